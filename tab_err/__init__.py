@@ -1,3 +1,26 @@
-from tab_err._error_model import ErrorModel
-from tab_err.error_mechanism._error_mechanism import ErrorMechanism
-from tab_err.error_type._error_type import ErrorType
+from typing import TYPE_CHECKING
+
+from tab_err._lazy import attach
+
+# Submodules and attributes are imported when they are first accessed, so that `import tab_err` does not import pandas.
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submodules=["api", "bench", "error_mechanism", "error_type"],
+    attributes={
+        "ErrorDiff": "._error_diff",
+        "ErrorModel": "._error_model",
+        "Observer": "._observer",
+        "StageCollector": "._observer",
+        "StageEvent": "._observer",
+        "ErrorMechanism": ".error_mechanism._error_mechanism",
+        "ErrorType": ".error_type._error_type",
+    },
+)
+
+if TYPE_CHECKING:
+    from tab_err import api, bench, error_mechanism, error_type
+    from tab_err._error_diff import ErrorDiff
+    from tab_err._error_model import ErrorModel
+    from tab_err._observer import Observer, StageCollector, StageEvent
+    from tab_err.error_mechanism._error_mechanism import ErrorMechanism
+    from tab_err.error_type._error_type import ErrorType
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import pandas as pd
+
+# pyarrow is an optional dependency, installed by the "arrow" extra. Without it, Arrow-backed dtypes cannot exist, so the
+# helpers below, which keep such string columns in Arrow memory while error types transform their masked values, are never called.
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:
+    pa = None
+    pc = None
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    import numpy as np
+
+
+def is_arrow_string_dtype(dtype: Any) -> bool:  # noqa: ANN401
+    """Returns whether `dtype` is `pd.ArrowDtype(pa.string())`, `pd.ArrowDtype(pa.large_string())`, or `string[pyarrow]`."""
+    if isinstance(dtype, pd.StringDtype):
+        return dtype.storage == "pyarrow"
+
+    if isinstance(dtype, pd.ArrowDtype):
+        return bool(pa.types.is_string(dtype.pyarrow_dtype) or pa.types.is_large_string(dtype.pyarrow_dtype))
+
+    return False
+
+
+def to_arrow(series: pd.Series) -> pa.Array:
+    """Returns the values of an Arrow-backed Series as one contiguous Arrow array, without copying if the Series has a single chunk."""
+    values = pa.array(series.array)
+    return values.combine_chunks() if isinstance(values, pa.ChunkedArray) else values
+
+
+def from_arrow(values: pa.Array, like: pd.Series) -> pd.Series:
+    """Wraps an Arrow array into a Series with the dtype, index, and name of `like`."""
+    return pd.Series(pd.array(values, dtype=like.dtype), index=like.index, name=like.name)
+
+
+def transform_masked_arrow_strings(series: pd.Series, mask: np.ndarray, transform: Callable[[pa.Array], pa.Array]) -> pd.Series:
+    """Transforms the values of an Arrow-backed string Series where `mask` is True and returns a new Series of the same dtype.
+
+    Only the masked values are taken out of the Arrow array and passed to `transform`, which returns an Arrow array of the same length,
+    ideally computed by pyarrow.compute kernels. The unmasked values are kept by `replace_with_mask`.
+
+    Args:
+        series (pd.Series): A Series whose dtype satisfies `is_arrow_string_dtype`.
+        mask (np.ndarray): A boolean array of the same length as `series` that is True at the values to transform.
+        transform (Callable[[pa.Array], pa.Array]): Maps the masked values to their new values.
+
+    Returns:
+        pd.Series: A new Series with the dtype, index, and name of `series`.
+    """
+    values = to_arrow(series)
+    arrow_mask = pa.array(mask, type=pa.bool_())
+    new_values = transform(pc.filter(values, arrow_mask)).cast(values.type)
+
+    return from_arrow(pc.replace_with_mask(values, arrow_mask, new_values), like=series)
+
+
+def map_arrow_strings(values: pa.Array, func: Callable[[str], str], *, unique: bool = False) -> pa.Array:
+    """Applies a Python function to each non-missing value of an Arrow string array, for transformations that no pyarrow.compute kernel covers.
+
+    With `unique`, the values are dictionary-encoded and `func` is called once per unique value, which requires it to be deterministic.
+    """
+    if unique:
+        encoded = pc.dictionary_encode(values)
+        dictionary = map_arrow_strings(encoded.dictionary, func)
+        return dictionary.take(encoded.indices)
+
+    return pa.array([func(value) if value is not None else None for value in values.to_pylist()], type=values.type)
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+import pandas as pd
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def is_categorical_dtype(dtype: Any) -> bool:  # noqa: ANN401
+    """Returns whether `dtype` is a `pd.CategoricalDtype`."""
+    return isinstance(dtype, pd.CategoricalDtype)
+
+
+def transform_masked_categories(series: pd.Series, mask: np.ndarray, func: Callable[[Any], Any], *, unique: bool = False) -> pd.Series:
+    """Applies a Python function to the non-missing values of a categorical Series where `mask` is True and returns a categorical Series.
+
+    The values stay int codes into the categories: the new values that are no categories yet are appended to the categories, and the
+    codes of the masked values are remapped to the categories of their new values. New missing values get the missing code -1.
+    With `unique`, `func` is called once per category of the masked values, which requires it to be deterministic, otherwise once per value.
+
+    Args:
+        series (pd.Series): A Series with a `pd.CategoricalDtype`.
+        mask (np.ndarray): A boolean array of the same length as `series` that is True at the values to transform.
+        func (Callable[[Any], Any]): Maps a value to its new value.
+        unique (bool, optional): Whether `func` is called once per category instead of once per value. Defaults to False.
+
+    Returns:
+        pd.Series: A new categorical Series with the index and name of `series`, whose categories extend those of `series`.
+    """
+    categorical = series.array
+    codes = categorical.codes.astype(np.intp)  # appended categories might not fit into the dtype of the codes
+    positions = np.flatnonzero(mask & (codes != -1))
+
+    if unique:
+        masked_codes, inverse = np.unique(codes[positions], return_inverse=True)
+        new_values = pd.Index([func(value) for value in categorical.categories.take(masked_codes)])
+    else:
+        inverse = np.arange(len(positions))
+        new_values = pd.Index([func(value) for value in categorical.categories.take(codes[positions])])
+
+    new_categories = new_values[new_values.notna()].unique().difference(categorical.categories, sort=False)
+    categorical = categorical.add_categories(new_categories)
+    codes[positions] = categorical.categories.get_indexer(new_values)[inverse]
+
+    return pd.Series(pd.Categorical.from_codes(codes, dtype=categorical.dtype), index=series.index, name=series.name)
@@ -0,0 +1,234 @@
+from __future__ import annotations
+
+import dataclasses
+import json
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+import pandas as pd
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable
+    from pathlib import Path
+
+
+@dataclasses.dataclass
+class ColumnDiff:
+    """The errors of one column of an ErrorDiff.
+
+    Attributes:
+        positions (np.ndarray): The sorted row positions of the cells with errors.
+        new_values (pd.Series): The values of the cells with errors, in the order of 'positions'. Its dtype is the dtype of the column with errors.
+        original_values (pd.Series | None): The values of the cells without errors, in the order of 'positions', None if they are not kept.
+            Its dtype is the dtype of the clean column.
+    """
+
+    positions: np.ndarray
+    new_values: pd.Series
+    original_values: pd.Series | None = None
+
+    @staticmethod
+    def from_series(series: pd.Series, positions: np.ndarray, original: pd.Series | None = None) -> ColumnDiff:
+        """Creates the ColumnDiff of the values of 'series' at 'positions', and of the values of 'original' at 'positions' if given."""
+        return ColumnDiff(
+            positions,
+            series.iloc[positions].reset_index(drop=True),
+            None if original is None else original.iloc[positions].reset_index(drop=True),
+        )
+
+
+@dataclasses.dataclass
+class ErrorDiff:
+    """The errors inserted into a DataFrame, stored as the positions and values of the cells with errors instead of full DataFrames.
+
+    An ErrorDiff is a compact alternative to the data with errors and the error mask: its memory scales with the number of errors.
+    `replay` inserts the errors into the clean data, `error_mask` derives the error mask, and `invert` restores the clean data from
+    the data with errors if the original values are kept.
+
+    Attributes:
+        n_rows (int): The number of rows of the data.
+        columns (dict[Hashable, ColumnDiff]): Maps the names of the columns with errors to their errors.
+    """
+
+    n_rows: int
+    columns: dict[Hashable, ColumnDiff]
+
+    @property
+    def n_errors(self: ErrorDiff) -> int:
+        """The number of cells with errors."""
+        return sum(len(column_diff.positions) for column_diff in self.columns.values())
+
+    @staticmethod
+    def from_frames(data: pd.DataFrame, data_dirty: pd.DataFrame, error_mask: pd.DataFrame, *, keep_original: bool = True) -> ErrorDiff:
+        """Creates an ErrorDiff from the results of an API.
+
+        Args:
+            data (pd.DataFrame): The data without errors.
+            data_dirty (pd.DataFrame): The data with errors.
+            error_mask (pd.DataFrame): The error mask of 'data_dirty'.
+            keep_original (bool, optional): Whether the original values are kept, which `invert` requires. Defaults to True.
+
+        Raises:
+            ValueError: If the shapes of the DataFrames differ.
+
+        Returns:
+            ErrorDiff: The errors of 'data_dirty'.
+        """
+        if not data.shape == data_dirty.shape == error_mask.shape:
+            msg = f"The shapes of 'data': {data.shape}, 'data_dirty': {data_dirty.shape}, and 'error_mask': {error_mask.shape} must be the same."
+            raise ValueError(msg)
+
+        columns = {}
+        for position, column in enumerate(data.columns):
+            positions = np.flatnonzero(error_mask.iloc[:, position].to_numpy(dtype=bool))
+            if len(positions) > 0:
+                original = data.iloc[:, position] if keep_original else None
+                columns[column] = ColumnDiff.from_series(data_dirty.iloc[:, position], positions, original)
+
+        return ErrorDiff(len(data), columns)
+
+    def replay(self: ErrorDiff, data: pd.DataFrame) -> pd.DataFrame:
+        """Inserts the errors into a copy of the clean data.
+
+        Columns with errors get the dtype they have with errors, e.g., integer columns with missing values become float columns.
+
+        Args:
+            data (pd.DataFrame): The data without errors.
+
+        Returns:
+            pd.DataFrame: A copy of 'data' with the errors.
+        """
+        self._check_rows(data)
+        data_dirty = data.copy()
+        for column, column_diff in self.columns.items():
+            series = data_dirty[column].astype(column_diff.new_values.dtype)  # copies
+            series.iloc[column_diff.positions] = column_diff.new_values.array
+            data_dirty[column] = series
+
+        return data_dirty
+
+    def invert(self: ErrorDiff, data_dirty: pd.DataFrame) -> pd.DataFrame:
+        """Restores the clean data from a copy of the data with errors, using the original values.
+
+        Args:
+            data_dirty (pd.DataFrame): The data with errors.
+
+        Raises:
+            ValueError: If the ErrorDiff does not keep the original values.
+
+        Returns:
+            pd.DataFrame: A copy of 'data_dirty' without the errors, with the dtypes of the clean data.
+        """
+        self._check_rows(data_dirty)
+        data = data_dirty.copy()
+        for column, column_diff in self.columns.items():
+            if column_diff.original_values is None:
+                msg = f"The ErrorDiff does not keep the original values of column '{column}'. Create it with 'keep_original=True' to invert it."
+                raise ValueError(msg)
+
+            series = data[column].copy()
+            series.iloc[column_diff.positions] = column_diff.original_values.to_numpy()  # the original dtype might not hold the values with errors
+            data[column] = series.astype(column_diff.original_values.dtype)
+
+        return data
+
+    def error_mask(self: ErrorDiff, data: pd.DataFrame) -> pd.DataFrame:
+        """Returns the error mask with the index and columns of 'data'."""
+        self._check_rows(data)
+        error_mask = pd.DataFrame(data=False, index=data.index, columns=data.columns)
+        for column, column_diff in self.columns.items():
+            column_mask = np.zeros(self.n_rows, dtype=bool)
+            column_mask[column_diff.positions] = True
+            error_mask[column] = column_mask
+
+        return error_mask
+
+    def save(self: ErrorDiff, path: str | Path) -> None:
+        """Saves the ErrorDiff to a compressed NPZ file.
+
+        The dtypes of the values are kept. Values that NumPy stores only as Python objects, e.g., values of mixed types or strings
+        with missing values in object columns, are pickled, and loading them requires `allow_pickle=True`. Column names must be strings or integers.
+
+        Args:
+            path (str | Path): The path of the file, to which NumPy appends '.npz' if it has another suffix.
+        """
+        arrays: dict[str, np.ndarray] = {}
+        metadata: dict[str, Any] = {"n_rows": self.n_rows, "columns": []}
+
+        for i, (column, column_diff) in enumerate(self.columns.items()):
+            arrays[f"positions_{i}"] = column_diff.positions
+            dtypes = {}
+            for name in ("new_values", "original_values"):
+                series = getattr(column_diff, name)
+                if series is not None:
+                    dtypes[name] = _store_series(series, f"{name}_{i}", arrays)
+
+            metadata["columns"].append({"name": column, "dtypes": dtypes})
+
+        arrays["metadata"] = np.array(json.dumps(metadata))
+        np.savez_compressed(path, **arrays)  # type: ignore[arg-type]
+
+    @staticmethod
+    def load(path: str | Path, *, allow_pickle: bool = False) -> ErrorDiff:
+        """Loads an ErrorDiff saved by `save`.
+
+        Args:
+            path (str | Path): The path of the NPZ file.
+            allow_pickle (bool, optional): Whether values that were pickled are loaded. Only load pickled values from trusted files. Defaults to False.
+
+        Returns:
+            ErrorDiff: The loaded ErrorDiff.
+        """
+        with np.load(path, allow_pickle=allow_pickle) as arrays:
+            metadata = json.loads(arrays["metadata"].item())
+            columns = {}
+            for i, column in enumerate(metadata["columns"]):
+                new_values, original_values = (
+                    _load_series(arrays, f"{name}_{i}", column["dtypes"][name]) if name in column["dtypes"] else None
+                    for name in ("new_values", "original_values")
+                )
+                columns[column["name"]] = ColumnDiff(arrays[f"positions_{i}"], new_values, original_values)  # type: ignore[arg-type]
+
+        return ErrorDiff(metadata["n_rows"], columns)
+
+    def _check_rows(self: ErrorDiff, data: pd.DataFrame) -> None:
+        """Raises a ValueError if 'data' has another number of rows than the data of the ErrorDiff."""
+        if len(data) != self.n_rows:
+            msg = f"The ErrorDiff has errors of {self.n_rows} rows but 'data' has {len(data)} rows."
+            raise ValueError(msg)
+
+
+def _store_series(series: pd.Series, key: str, arrays: dict[str, np.ndarray]) -> dict[str, Any]:
+    """Stores the values of 'series' in 'arrays' under 'key' and returns how to restore its dtype. Categories are stored as codes."""
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        arrays[key] = series.cat.codes.to_numpy()
+        categories = _store_series(pd.Series(series.cat.categories), f"{key}_categories", arrays)
+        return {"dtype": "category", "ordered": bool(series.dtype.ordered), "categories": categories}
+
+    if isinstance(series.dtype, pd.StringDtype):  # missing values of string dtypes are always pd.NA
+        arrays[key] = series.to_numpy(dtype=str, na_value="")
+        arrays[f"{key}_missing"] = series.isna().to_numpy()
+        return {"dtype": f"string[{series.dtype.storage}]", "missing": True}
+
+    values = series.to_numpy()
+    if values.dtype == object and pd.api.types.infer_dtype(values, skipna=False) == "string":
+        values = values.astype(str)  # NumPy stores strings without pickling them
+
+    arrays[key] = values
+    return {"dtype": str(series.dtype)}
+
+
+def _load_series(arrays: Any, key: str, dtype: dict[str, Any]) -> pd.Series:  # noqa: ANN401
+    """Restores a Series stored by `_store_series`."""
+    if dtype["dtype"] == "category":
+        categories = _load_series(arrays, f"{key}_categories", dtype["categories"])
+        return pd.Series(pd.Categorical.from_codes(arrays[key], dtype=pd.CategoricalDtype(categories, ordered=dtype["ordered"])))
+
+    values = arrays[key]
+    if values.dtype.kind == "U":
+        values = values.astype(object)
+
+    if dtype.get("missing", False):
+        values[arrays[f"{key}_missing"]] = None
+
+    return pd.Series(values).astype(dtype["dtype"])
@@ -3,8 +3,6 @@ from __future__ import annotations
 import dataclasses
 from typing import TYPE_CHECKING
 
-from tab_err.api import low_level
-
 if TYPE_CHECKING:
     import pandas as pd
 
@@ -37,6 +35,8 @@ class ErrorModel:
                 - The first element is a copy of 'data' with errors.
                 - The second element is the associated error mask.
         """
+        from tab_err.api import low_level  # noqa: PLC0415 - imported on use, because the API imports pandas
+
         data_with_errors, error_mask = low_level.create_errors(
             data=data, column=column, error_rate=self.error_rate, error_mechanism=self.error_mechanism, error_type=self.error_type
         )
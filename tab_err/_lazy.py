@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import importlib
+import sys
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+
+def attach(
+    package: str, submodules: Iterable[str] = (), attributes: dict[str, str] | None = None
+) -> tuple[Callable[[str], Any], Callable[[], list[str]], list[str]]:
+    """Returns `__getattr__`, `__dir__`, and `__all__` of a package that imports its submodules and attributes when they are first accessed.
+
+    Importing a package then only costs importing its `__init__.py`, e.g., pandas is only imported once an error type or API is used.
+    Type checkers do not run module `__getattr__`, so packages import the attributes for them under `TYPE_CHECKING` as well.
+
+    Args:
+        package (str): The name of the package, i.e., `__name__` of its `__init__.py`.
+        submodules (Iterable[str], optional): Names of the submodules that are imported on access. Defaults to ().
+        attributes (dict[str, str] | None, optional): Maps the names of attributes to the modules that define them, relative to the package,
+            e.g., {"Typo": "._typo"}. Defaults to None.
+
+    Returns:
+        tuple[Callable[[str], Any], Callable[[], list[str]], list[str]]: The `__getattr__` function, the `__dir__` function, and `__all__`.
+    """
+    submodules = set(submodules)
+    attributes = attributes or {}
+    names = sorted({*submodules, *attributes})
+
+    def getattr_(name: str) -> Any:  # noqa: ANN401
+        if name in submodules:
+            return importlib.import_module(f"{package}.{name}")
+
+        if name in attributes:
+            value = getattr(importlib.import_module(attributes[name], package), name)
+            setattr(sys.modules[package], name, value)  # Later accesses do not call __getattr__
+            return value
+
+        msg = f"module '{package}' has no attribute '{name}'"
+        raise AttributeError(msg)
+
+    def dir_() -> list[str]:
+        return names
+
+    return getattr_, dir_, names
@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+import contextlib
+import dataclasses
+import threading
+import time
+import tracemalloc
+from typing import TYPE_CHECKING, Callable
+
+import pandas as pd
+
+if TYPE_CHECKING:
+    from types import TracebackType
+
+Observer = Callable[["StageEvent"], None]
+"""A callable that receives one StageEvent per finished stage, e.g., a StageCollector.
+
+If the observer has a true `trace_memory` attribute, the outermost stage traces memory with tracemalloc while it runs, unless tracemalloc is
+already tracing.
+"""
+
+_local = threading.local()
+
+
+@dataclasses.dataclass(frozen=True)
+class StageEvent:
+    """Measurements of one stage of an error generation run.
+
+    Attributes:
+        stage (str): The name of the stage, e.g., "ErrorMechanism.sample", "ErrorType.apply", or "mid_level.create_errors".
+        component (str | None): The class name of the ErrorMechanism or ErrorType of the stage, None for stages of the APIs.
+        column (str | int | None): The column the stage works on, None if it works on the whole DataFrame.
+        n_cells (int): Number of cells the stage considered.
+        n_changed (int): Number of cells the stage selected or changed.
+        wall_time (float): Wall time of the stage in seconds, including its nested stages.
+        allocated_bytes (int | None): Peak memory allocated during the stage, None if tracemalloc is not tracing or, if it was started outside
+            of the stages, the stage did not exceed the peak from before the stage.
+    """
+
+    stage: str
+    component: str | None
+    column: str | int | None
+    n_cells: int
+    n_changed: int
+    wall_time: float
+    allocated_bytes: int | None
+
+
+class Stage:
+    """Context manager that measures one stage and reports it to an observer when the stage finishes without error.
+
+    The code in the context sets `n_changed` before leaving it. If the outermost stage started tracemalloc for an observer with a true
+    `trace_memory` attribute, the peak of the traced memory is reset when a stage starts, the peaks of nested stages are propagated to the
+    enclosing stages, and tracing stops when the outermost stage finishes. If tracemalloc was started by someone else, its peak is not reset,
+    so that it stays valid for them, and a stage only measures its allocation if it exceeds the peak from before the stage.
+    """
+
+    def __init__(self: Stage, observer: Observer, stage: str, component: str | None, column: str | int | None, n_cells: int) -> None:
+        self.n_changed = 0
+
+        self._observer = observer
+        self._stage = stage
+        self._component = component
+        self._column = column
+        self._n_cells = n_cells
+        self._start_time = 0.0
+        self._start_memory: int | None = None
+        self._start_peak = 0
+        self._peak_memory = 0
+        self._started_tracing = False
+
+    def __enter__(self: Stage) -> Stage:  # noqa: PYI034
+        open_stages = _get_open_stages()
+
+        if not open_stages and getattr(self._observer, "trace_memory", False) and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+
+        if tracemalloc.is_tracing():
+            current, peak = tracemalloc.get_traced_memory()
+            if _owns_tracing(open_stages or [self]):
+                if open_stages:
+                    open_stages[-1]._peak_memory = max(open_stages[-1]._peak_memory, peak)  # noqa: SLF001
+                tracemalloc.reset_peak()
+                peak = current
+            self._start_memory = self._peak_memory = current
+            self._start_peak = peak
+
+        open_stages.append(self)
+        self._start_time = time.perf_counter()
+        return self
+
+    def __exit__(self: Stage, exc_type: type[BaseException] | None, exc: BaseException | None, traceback: TracebackType | None) -> None:
+        wall_time = time.perf_counter() - self._start_time
+        open_stages = _get_open_stages()
+        open_stages.pop()
+
+        allocated_bytes = None
+        if self._start_memory is not None and tracemalloc.is_tracing():
+            peak = tracemalloc.get_traced_memory()[1]
+            if _owns_tracing(open_stages or [self]):
+                self._peak_memory = max(self._peak_memory, peak)
+                if open_stages:
+                    open_stages[-1]._peak_memory = max(open_stages[-1]._peak_memory, self._peak_memory)  # noqa: SLF001
+                allocated_bytes = self._peak_memory - self._start_memory
+            elif peak > self._start_peak:
+                allocated_bytes = peak - self._start_memory
+
+        if self._started_tracing:
+            tracemalloc.stop()
+
+        if exc_type is None:
+            self._observer(StageEvent(self._stage, self._component, self._column, self._n_cells, self.n_changed, wall_time, allocated_bytes))
+
+
+def observe_stage(observer: Observer | None, stage: str, component: str | None, column: str | int | None, n_cells: int) -> Stage | contextlib.nullcontext[None]:
+    """Returns a Stage that reports to `observer`, or a context manager that does nothing if `observer` is None."""
+    if observer is None:
+        return contextlib.nullcontext()
+
+    return Stage(observer, stage, component, column, n_cells)
+
+
+def _owns_tracing(open_stages: list[Stage]) -> bool:
+    """Returns whether the outermost of the open stages started tracemalloc, so that the stages may reset its peak."""
+    return open_stages[0]._started_tracing  # noqa: SLF001
+
+
+def _get_open_stages() -> list[Stage]:
+    """Returns the stack of the stages that are currently measured in this thread."""
+    if not hasattr(_local, "open_stages"):
+        _local.open_stages = []
+
+    return _local.open_stages
+
+
+class StageCollector:
+    """Observer that collects the StageEvents of one or many runs and summarizes them as a table.
+
+    Example:
+        >>> collector = StageCollector()
+        >>> dirty_data, error_mask = high_level.create_errors(data, 0.1, observer=collector)
+        >>> collector.summary()
+
+    Attributes:
+        events (list[StageEvent]): The collected events in the order in which the stages finished.
+        trace_memory (bool): Whether the stages trace their allocations with tracemalloc if it is not tracing yet.
+    """
+
+    def __init__(self: StageCollector, *, trace_memory: bool = False) -> None:
+        """Initialization method of the StageCollector class.
+
+        Args:
+            trace_memory (bool, optional): Whether the stages trace their allocations with tracemalloc if it is not tracing yet, which slows
+                them down. Defaults to False, i.e., allocations are only measured while tracemalloc traces them anyway.
+        """
+        self.events: list[StageEvent] = []
+        self.trace_memory = trace_memory
+
+    def __call__(self: StageCollector, event: StageEvent) -> None:
+        """Collects one event."""
+        self.events.append(event)
+
+    def to_frame(self: StageCollector) -> pd.DataFrame:
+        """Returns the collected events as DataFrame with one row per event."""
+        return pd.DataFrame([dataclasses.asdict(event) for event in self.events], columns=[field.name for field in dataclasses.fields(StageEvent)])
+
+    def summary(self: StageCollector) -> pd.DataFrame:
+        """Returns one row per stage, component, and column with the number of calls, the summed counts and wall times, and the maximal allocation.
+
+        The rows are sorted by the total wall time, so the stages that are responsible for slow runs come first. Wall times of nested stages
+        are included in the wall times of their enclosing stages.
+        """
+        events = self.to_frame()
+        events[["component", "column"]] = events[["component", "column"]].astype(object).fillna("")
+        events["column"] = events["column"].astype(str)
+
+        summary = events.groupby(["stage", "component", "column"], sort=False).agg(
+            calls=("wall_time", "size"),
+            n_cells=("n_cells", "sum"),
+            n_changed=("n_changed", "sum"),
+            wall_time=("wall_time", "sum"),
+            allocated_bytes=("allocated_bytes", "max"),
+        )
+        return summary.sort_values("wall_time", ascending=False, kind="stable").reset_index()
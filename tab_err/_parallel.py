@@ -0,0 +1,360 @@
+from __future__ import annotations
+
+import bisect
+import heapq
+import itertools
+import multiprocessing
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+import numpy as np
+import pandas as pd
+
+from tab_err._shared_memory import SharedColumn, SharedFrame, gather_column, release, share_series, unlink_columns
+from tab_err._utils import SortOrderCache, derive_seeded_copy, insert_errors_at_positions
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable, Sequence
+    from multiprocessing.connection import Connection
+    from multiprocessing.shared_memory import SharedMemory
+
+    from tab_err import ErrorType
+
+
+class Element(NamedTuple):
+    """An error-free cell in the order in which block mechanisms sort it: by value with missing values last, and by row on ties.
+
+    Tuple comparison implements this order, because `value` is None for missing values. Rows are positions in the whole DataFrame.
+    """
+
+    missing: bool
+    value: Any
+    row: int
+
+
+class Sketch(NamedTuple):
+    """Regularly spaced elements of the sorted error-free cells of one partition, with their ranks in the partition."""
+
+    elements: list[Element]
+    ranks: list[int]
+    size: int
+
+    def max_count_below(self: Sketch, element: Element) -> int:
+        """Returns an upper bound of the number of cells of the partition that are smaller than `element`."""
+        i = bisect.bisect_left(self.elements, element)
+        return self.ranks[i] if i < len(self.elements) else self.size
+
+    def min_count_below(self: Sketch, element: Element) -> int:
+        """Returns a lower bound of the number of cells of the partition that are smaller than `element`."""
+        i = bisect.bisect_left(self.elements, element)
+        return self.ranks[i - 1] + 1 if i > 0 else 0
+
+
+class SortedCells:
+    """The error-free cells of one column of a partition, sorted by another column as `get_sort_order` sorts them."""
+
+    def __init__(self: SortedCells, values: np.ndarray, rows: np.ndarray, n_present: int) -> None:
+        self.values = values  # Sorted values of the cells whose value is not missing
+        self.rows = rows  # Rows of all cells, those with missing values last
+        self.n_present = n_present
+
+    def __len__(self: SortedCells) -> int:
+        return len(self.rows)
+
+    def element(self: SortedCells, i: int) -> Element:
+        """Returns the element of rank `i`."""
+        if i >= self.n_present:
+            return Element(missing=True, value=None, row=int(self.rows[i]))
+
+        return Element(missing=False, value=self.values[i], row=int(self.rows[i]))
+
+    def count_below(self: SortedCells, element: Element | None) -> int:
+        """Returns the number of cells that are smaller than `element`, or all cells if `element` is None."""
+        if element is None:
+            return len(self.rows)
+
+        if element.missing:
+            return self.n_present + int(np.searchsorted(self.rows[self.n_present :], element.row))
+
+        lower = int(np.searchsorted(self.values, element.value, side="left"))
+        upper = int(np.searchsorted(self.values, element.value, side="right"))
+        return lower + int(np.searchsorted(self.rows[lower:upper], element.row))
+
+
+class Partition:
+    """A contiguous range of rows of a DataFrame and the error mask of these rows, owned by one worker of a PartitionPool.
+
+    The methods are the commands the driver of `tab_err.api.parallel` sends. The `select_*` methods record the local positions
+    of the cells they select, one array per error model, which `apply` uses to insert the errors.
+    """
+
+    def __init__(self: Partition, data: pd.DataFrame, index: int, offset: int) -> None:
+        self.data = data
+        self.index = index
+        self.offset = offset
+        self.error_mask = pd.DataFrame(data=False, index=data.index, columns=data.columns)
+        self.step_positions: list[np.ndarray] = []
+        self._sort_order_cache = SortOrderCache()
+
+    def sorted_cells(self: Partition, column: Hashable, block_column: Hashable) -> SortedCells:
+        """Returns the error-free cells of `column`, sorted by `block_column`."""
+        error_free = ~self.error_mask[column].to_numpy()
+        order = self._sort_order_cache.get(self.data, (block_column,))
+        order = order[error_free[order]]
+
+        series = self.data[block_column]
+        if isinstance(series.dtype, pd.CategoricalDtype):  # Categories sort by their codes
+            values = series.cat.codes.to_numpy()
+            missing = values < 0
+        else:
+            values = series.to_numpy()
+            missing = series.isna().to_numpy()
+
+        n_present = len(order) - int(missing[order].sum())
+        return SortedCells(values[order[:n_present]], order + self.offset, n_present)
+
+    def sketch(self: Partition, column: Hashable, block_column: Hashable, n_points: int) -> Sketch:
+        """Returns the elements of up to `n_points` evenly spaced ranks, including the first and last one."""
+        cells = self.sorted_cells(column, block_column)
+        ranks = np.unique(np.linspace(0, len(cells) - 1, min(n_points, len(cells))).astype(np.int64)).tolist()
+        return Sketch([cells.element(rank) for rank in ranks], ranks, len(cells))
+
+    def windows(
+        self: Partition, column: Hashable, block_column: Hashable, bounds: Sequence[tuple[Element | None, Element | None]]
+    ) -> list[tuple[int, list[Element]]]:
+        """Returns, for each pair of bounds, the number of cells below the lower bound and the elements from the lower to the upper bound.
+
+        A lower bound of None denotes the first cell, an upper bound of None the end of the cells.
+        """
+        cells = self.sorted_cells(column, block_column)
+        windows = []
+        for lower, upper in bounds:
+            start = cells.count_below(lower) if lower is not None else 0
+            windows.append((start, [cells.element(i) for i in range(start, cells.count_below(upper))]))
+
+        return windows
+
+    def select_block(self: Partition, column: Hashable, block_column: Hashable, start: Element, end: Element | None) -> int:
+        """Selects the error-free cells of `column` from `start` up to `end`, in the order of `block_column`, and returns their number."""
+        cells = self.sorted_cells(column, block_column)
+        rows = cells.rows[cells.count_below(start) : cells.count_below(end)]
+        return self._select(column, rows - self.offset)
+
+    def select_random(self: Partition, column: Hashable, n_errors: int, seed: int) -> int:
+        """Selects `n_errors` error-free cells of `column` uniformly at random and returns their number."""
+        error_free = np.flatnonzero(~self.error_mask[column].to_numpy())
+        return self._select(column, np.random.default_rng(seed).choice(error_free, n_errors, replace=False))
+
+    def _select(self: Partition, column: Hashable, positions: np.ndarray) -> int:
+        self.error_mask.iloc[positions, self.error_mask.columns.get_loc(column)] = True
+        self.step_positions.append(positions)
+        return len(positions)
+
+    def apply(self: Partition, steps: Sequence[tuple[Hashable, ErrorType]]) -> tuple[pd.DataFrame, pd.DataFrame]:
+        """Inserts the errors of the error types of `steps` into the selected cells and returns the data with errors and the error mask.
+
+        Each partition seeds the error types with a seed derived from their own seed and the index of the partition.
+        """
+        data_dirty = self.data.copy()
+        for (column, error_type), positions in zip(steps, self.step_positions):
+            insert_errors_at_positions(data_dirty, column, positions, derive_seeded_copy(error_type, self.index))  # type: ignore[arg-type]
+
+        return data_dirty, self.error_mask
+
+    def apply_shared(
+        self: Partition, steps: Sequence[tuple[Hashable, ErrorType]], mask_columns: dict[Hashable, SharedColumn]
+    ) -> dict[Hashable, SharedColumn | pd.Series]:
+        """Inserts the errors as `apply` does, but writes the error mask of the columns into their shared blocks and returns only the columns with errors.
+
+        The columns with errors are returned in new shared memory blocks, which the driver unlinks, or pickled if their dtype cannot be shared.
+        """
+        modified: dict[Hashable, pd.Series] = {}
+        for (column, error_type), positions in zip(steps, self.step_positions):
+            step_mask = np.zeros(len(self.data), dtype=bool)
+            step_mask[positions] = True
+            series = modified.get(column, self.data[column])
+            modified[column] = derive_seeded_copy(error_type, self.index).apply_series(series, step_mask)
+
+        for column, mask_column in mask_columns.items():
+            mask, block = mask_column.attach()
+            mask[self.offset : self.offset + len(self.data)] = self.error_mask[column].to_numpy()
+            del mask
+            release([block])
+
+        results: dict[Hashable, SharedColumn | pd.Series] = {}
+        try:
+            for column, series in modified.items():
+                shared = share_series(series)
+                if shared is None:
+                    results[column] = series
+                else:
+                    results[column] = shared[0]
+                    release([shared[1]])
+        except BaseException:
+            unlink_columns(results.values())
+            raise
+
+        return results
+
+
+def _serve(connection: Connection, data: pd.DataFrame | SharedFrame, index: int, offset: int) -> None:
+    """Runs the commands a PartitionPool sends to a worker process until it receives None."""
+    blocks: list[SharedMemory] = []
+    if isinstance(data, SharedFrame):
+        data, blocks = data.attach()
+
+    partition = Partition(data, index, offset)
+    while (request := connection.recv()) is not None:
+        method, args = request
+        try:
+            connection.send((True, getattr(partition, method)(*args)))
+        except Exception as error:  # noqa: BLE001
+            connection.send((False, error))
+
+    connection.close()
+    del partition, data
+    release(blocks)
+
+
+class PartitionPool:
+    """Splits a DataFrame into contiguous ranges of rows and runs one Partition per worker process.
+
+    With a single partition, the Partition runs in this process. The pool is a context manager that stops the workers on exit.
+    With `shared_memory`, the numeric, categorical, and Arrow-backed columns are copied once into shared memory blocks, which the
+    workers read without copying instead of unpickling their rows, and `apply` returns only the columns with errors through shared blocks.
+    """
+
+    def __init__(self: PartitionPool, data: pd.DataFrame, n_partitions: int, *, shared_memory: bool = False) -> None:
+        self.bounds = np.linspace(0, len(data), n_partitions + 1).astype(np.int64)
+        self.shared_memory = shared_memory and n_partitions > 1
+        self._partitions: list[Partition] = []
+        self._connections: list[Connection] = []
+        self._processes: list[multiprocessing.process.BaseProcess] = []
+        self._blocks: list[SharedMemory] = []
+
+        if n_partitions == 1:
+            self._partitions.append(Partition(data, 0, 0))
+            return
+
+        if self.shared_memory:
+            shared, self._blocks = SharedFrame.share(data)
+
+        context = multiprocessing.get_context()
+        for index, (start, stop) in enumerate(zip(self.bounds[:-1], self.bounds[1:])):
+            connection, worker_connection = context.Pipe()
+            rows = SharedFrame.from_rows(data, shared, int(start), int(stop)) if self.shared_memory else data.iloc[start:stop]
+            process = context.Process(target=_serve, args=(worker_connection, rows, index, int(start)), daemon=True)
+            process.start()
+            worker_connection.close()
+            self._connections.append(connection)
+            self._processes.append(process)
+
+    def __len__(self: PartitionPool) -> int:
+        return len(self.bounds) - 1
+
+    def __enter__(self: PartitionPool) -> PartitionPool:  # noqa: PYI034
+        return self
+
+    def __exit__(self: PartitionPool, *args: object) -> None:
+        self.close()
+
+    def call(self: PartitionPool, method: str, *args: Any) -> list[Any]:  # noqa: ANN401
+        """Calls a method with the same arguments on all partitions in parallel and returns their results."""
+        return self.call_each(method, [args] * len(self))
+
+    def call_each(self: PartitionPool, method: str, args: Sequence[tuple[Any, ...]]) -> list[Any]:
+        """Calls a method with one tuple of arguments per partition in parallel and returns their results, raises the first error of a worker."""
+        if self._partitions:
+            return [getattr(partition, method)(*partition_args) for partition, partition_args in zip(self._partitions, args)]
+
+        return _get_results(self._request(method, args))
+
+    def _request(self: PartitionPool, method: str, args: Sequence[tuple[Any, ...]]) -> list[tuple[bool, Any]]:
+        """Calls a method with one tuple of arguments per worker and returns their responses, (True, result) or (False, error)."""
+        for connection, partition_args in zip(self._connections, args):
+            connection.send((method, partition_args))
+
+        return [connection.recv() for connection in self._connections]
+
+    def apply(self: PartitionPool, data: pd.DataFrame, steps: Sequence[tuple[Hashable, ErrorType]]) -> tuple[pd.DataFrame, pd.DataFrame]:
+        """Inserts the errors of `steps` into the selected cells of all partitions and returns a copy of 'data' with errors and the error mask."""
+        if not self.shared_memory:
+            results = self.call("apply", steps)
+            return pd.concat([partition_data for partition_data, _ in results]), pd.concat([partition_mask for _, partition_mask in results])
+
+        mask_columns: dict[Hashable, SharedColumn] = {}
+        mask_blocks: dict[Hashable, SharedMemory] = {}
+        responses: list[tuple[bool, Any]] = []
+        try:
+            for column, _ in steps:
+                if column not in mask_columns:
+                    mask_columns[column], mask_blocks[column] = share_series(pd.Series(np.zeros(len(data), dtype=bool)))  # type: ignore[misc]
+
+            responses = self._request("apply_shared", [(steps, mask_columns)] * len(self))
+            results = _get_results(responses)
+            data_dirty = data.copy()
+            error_mask = pd.DataFrame(data=False, index=data.index, columns=data.columns)
+            for column, block in mask_blocks.items():
+                data_dirty[column] = gather_column([result[column] for result in results], data.index, column)
+                error_mask[column] = np.ndarray((len(data),), dtype=bool, buffer=block.buf).copy()
+        except BaseException:
+            # The blocks of the columns that were not gathered, e.g., of the workers that succeeded if another one failed
+            unlink_columns(part for success, result in responses if success for part in result.values())
+            raise
+        finally:
+            release(mask_blocks.values(), unlink=True)
+
+        return data_dirty, error_mask
+
+    def close(self: PartitionPool) -> None:
+        """Stops the worker processes and unlinks the shared memory blocks."""
+        for connection in self._connections:
+            connection.send(None)
+            connection.close()
+
+        for process in self._processes:
+            process.join()
+
+        release(self._blocks, unlink=True)
+        self._connections = []
+        self._processes = []
+        self._blocks = []
+
+
+def _get_results(responses: Sequence[tuple[bool, Any]]) -> list[Any]:
+    """Returns the results of the responses of the workers, raises the first error of a worker."""
+    for success, result in responses:
+        if not success:
+            raise result
+
+    return [result for _, result in responses]
+
+
+def bracket(rank: int, sketches: Sequence[Sketch]) -> tuple[Element | None, Element | None]:
+    """Returns sketch elements between which the element of the global `rank` lies, using only the sketches of the partitions.
+
+    The lower bound is the largest element of which at most `rank` cells are certainly smaller, the upper bound the smallest element of
+    which more than `rank` cells are certainly smaller. None denotes the first cell and the end of the cells, respectively.
+    """
+    merged = sorted(itertools.chain.from_iterable(sketch.elements for sketch in sketches))
+    n_lower = _partition_point(len(merged), lambda i: sum(sketch.max_count_below(merged[i]) for sketch in sketches) <= rank)
+    n_upper = _partition_point(len(merged), lambda i: sum(sketch.min_count_below(merged[i]) for sketch in sketches) <= rank)
+    return (merged[n_lower - 1] if n_lower > 0 else None), (merged[n_upper] if n_upper < len(merged) else None)
+
+
+def select_element(rank: int, windows: Sequence[tuple[int, list[Element]]]) -> Element:
+    """Returns the element of the global `rank` from the windows of all partitions around it, as returned by `Partition.windows`."""
+    n_below = sum(start for start, _ in windows)
+    return list(heapq.merge(*(elements for _, elements in windows)))[rank - n_below]
+
+
+def _partition_point(n: int, predicate: Callable[[int], bool]) -> int:
+    """Returns the first i in [0, n] for which `predicate(i)` is False, given that it is True for a prefix of [0, n)."""
+    low, high = 0, n
+    while low < high:
+        middle = (low + high) // 2
+        if predicate(middle):
+            low = middle + 1
+        else:
+            high = middle
+
+    return low
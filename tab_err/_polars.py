@@ -0,0 +1,232 @@
+from __future__ import annotations
+
+import functools
+import inspect
+import sys
+from typing import TYPE_CHECKING, Any, TypeVar, cast
+
+import pandas as pd
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from types import ModuleType
+
+    import polars as pl
+
+F = TypeVar("F", bound="Callable[..., Any]")
+
+
+def _get_polars() -> ModuleType | None:
+    """Returns the polars module if it was imported, None otherwise.
+
+    polars is an optional dependency, installed by the "polars" extra. A polars.DataFrame can only be passed if polars was imported,
+    so tab_err never imports polars itself, which keeps importing tab_err fast.
+    """
+    return sys.modules.get("polars")
+
+
+def polars_to_pandas(data: pl.DataFrame) -> pd.DataFrame:
+    """Converts a polars.DataFrame to pandas for error generation, column by column with `_column_to_pandas`."""
+    return pd.DataFrame({name: _column_to_pandas(data[name]) for name in data.columns}, copy=False)
+
+
+def _column_to_pandas(column: pl.Series) -> pd.Series:
+    """Converts a polars column to pandas for error generation.
+
+    String columns become Arrow-backed, so that the string error types keep them in Arrow memory. All other columns become
+    NumPy-backed, which all error types support and which does not copy numeric columns without missing values.
+    """
+    return column.to_pandas(use_pyarrow_extension_array=column.dtype == _get_polars().String)  # type: ignore[union-attr]
+
+
+def pandas_to_polars(data: pd.DataFrame, original: tuple[pl.DataFrame, pd.DataFrame] | None = None) -> pl.DataFrame:
+    """Converts a pandas DataFrame with errors back to polars.
+
+    Error types can leave values of different types in one object column, e.g., strings in a numeric column. Polars columns
+    hold values of one type, so such columns become string columns.
+
+    Args:
+        data (pd.DataFrame): The DataFrame to convert.
+        original (tuple[pl.DataFrame, pd.DataFrame] | None, optional): The polars.DataFrame that 'data' was created from and its conversion
+            by `polars_to_pandas`. Columns of 'data' that equal their conversion are taken from it unchanged, and other columns that kept
+            their pandas dtype get their polars dtype back if it holds their values, e.g., integer columns with missing values that pandas
+            converts to float. Defaults to None.
+
+    Returns:
+        pl.DataFrame: The converted DataFrame.
+    """
+    columns = []
+    for name, series in data.items():
+        original_column = (original[0][name], original[1][name]) if original is not None and name in original[1].columns else None
+        columns.append(_column_to_polars(str(name), series, original_column))
+
+    return _get_polars().DataFrame(columns)  # type: ignore[union-attr]
+
+
+def _column_to_polars(name: str, series: pd.Series, original: tuple[pl.Series, pd.Series] | None) -> pl.Series:
+    """Converts a pandas Series to polars, restoring the original polars column if it is unchanged or its dtype holds the values.
+
+    'original' is the polars column that 'series' was created from and its conversion by `_column_to_pandas`.
+    """
+    if original is None:
+        return _series_to_polars(name, series)
+
+    polars_column, pandas_column = original
+    if series.equals(pandas_column):
+        return polars_column
+
+    converted = _series_to_polars(name, series)
+    if series.dtype != pandas_column.dtype or converted.dtype == polars_column.dtype:
+        return converted
+
+    try:
+        restored = converted.cast(polars_column.dtype)
+    except _get_polars().exceptions.PolarsError:  # type: ignore[union-attr]
+        return converted
+
+    return restored if restored.cast(converted.dtype).equals(converted) else converted  # casts to integers truncate floats
+
+
+def _series_to_polars(name: str, series: pd.Series) -> pl.Series:
+    """Converts a pandas Series to polars, converting values of mixed types to strings."""
+    pl = _get_polars()
+    try:
+        return pl.Series(name, series)  # type: ignore[union-attr]
+    except (TypeError, ValueError):
+        return pl.Series(name, series.astype("string[pyarrow]"))  # type: ignore[union-attr]
+
+
+class PolarsColumns:
+    """Column operations on a polars.DataFrame for functions that read and replace only some of its columns.
+
+    It provides the part of the DataFrame interface that the error mechanisms, the error types, and the low- and mid-level
+    `create_errors` use: the `columns`, `index`, `shape`, `size`, and `empty` attributes, `len`, `copy`, and reading and replacing
+    columns by name. A column is converted to pandas by `_column_to_pandas` when it is read for the first time, e.g., the column that
+    errors are inserted into and the columns that EAR conditions on. `to_polars` converts the replaced columns back. All other columns
+    are never converted.
+
+    Attributes:
+        polars (pl.DataFrame): The polars.DataFrame whose columns are read.
+        columns (pd.Index): The names of the columns.
+        index (pd.RangeIndex): The index of the pandas columns.
+    """
+
+    def __init__(self: PolarsColumns, data: pl.DataFrame, converted: dict[str, pd.Series] | None = None) -> None:
+        self.polars = data
+        self.columns = pd.Index(data.columns)
+        self.index = pd.RangeIndex(data.height)
+        self._converted = {} if converted is None else converted  # Conversions of the columns of 'polars', shared by copies
+        self._replaced: dict[str, pd.Series] = {}
+
+    @property
+    def shape(self: PolarsColumns) -> tuple[int, int]:
+        return self.polars.shape
+
+    @property
+    def size(self: PolarsColumns) -> int:
+        return self.polars.height * self.polars.width
+
+    @property
+    def empty(self: PolarsColumns) -> bool:
+        return self.size == 0
+
+    def __len__(self: PolarsColumns) -> int:
+        return self.polars.height
+
+    def __getitem__(self: PolarsColumns, name: str) -> pd.Series:
+        if name in self._replaced:
+            return self._replaced[name]
+
+        if name not in self._converted:
+            self._converted[name] = _column_to_pandas(self.polars[name])
+
+        return self._converted[name]
+
+    def __setitem__(self: PolarsColumns, name: str, series: pd.Series) -> None:
+        self._replaced[name] = series
+
+    def copy(self: PolarsColumns) -> PolarsColumns:
+        """Returns a copy whose replaced columns are independent of this one's. It shares the polars.DataFrame and the conversions."""
+        columns_copy = PolarsColumns(self.polars, self._converted)
+        columns_copy._replaced = dict(self._replaced)
+        return columns_copy
+
+    def to_pandas(self: PolarsColumns) -> pd.DataFrame:
+        """Converts all columns to a pandas DataFrame, with the replaced columns."""
+        return pd.DataFrame({name: self[name] for name in self.columns}, copy=False)
+
+    def to_polars(self: PolarsColumns) -> pl.DataFrame:
+        """Returns the polars.DataFrame with the replaced columns converted back by `_column_to_polars`, and all other columns unchanged."""
+        if not self._replaced:
+            return self.polars
+
+        return self.polars.with_columns(
+            [_column_to_polars(name, series, (self.polars[name], self._converted[name])) for name, series in self._replaced.items()]
+        )
+
+
+def _convert_result(result: Any, originals: list[tuple[pl.DataFrame, pd.DataFrame]]) -> Any:  # noqa: ANN401
+    """Converts the DataFrames of a result, also inside of tuples and lists, to polars, with the schema of the argument with the same shape."""
+    if isinstance(result, PolarsColumns):
+        return result.to_polars()
+
+    if isinstance(result, pd.DataFrame):  # An argument that is returned may have been modified in place, e.g., an error mask
+        original = next(
+            (pair for pair in originals if pair[1] is not result and pair[1].shape == result.shape and pair[1].columns.equals(result.columns)), None
+        )
+        return pandas_to_polars(result, original)
+
+    if isinstance(result, (tuple, list)):
+        return type(result)(_convert_result(element, originals) for element in result)
+
+    return result
+
+
+def accepts_polars(func: F) -> F:
+    """Decorator that lets a function take polars.DataFrames instead of pandas DataFrames.
+
+    If any argument is a polars.DataFrame, all such arguments are converted with `polars_to_pandas` and the DataFrames in the
+    result with `pandas_to_polars`, which keeps the polars dtypes of the columns of the argument with the same columns and
+    number of rows if they were not changed. Otherwise, the function is called unchanged.
+    """
+    return cast("F", _wrap(func, columns=False))
+
+
+def accepts_polars_columns(func: F) -> F:
+    """Decorator that lets a function take a polars.DataFrame as 'data' and convert only the columns it reads to pandas.
+
+    If 'data' is a polars.DataFrame, it is passed as `PolarsColumns`, so the function must use 'data' only through the operations
+    that `PolarsColumns` supports. The `PolarsColumns` in the result are converted back with `PolarsColumns.to_polars`. Other
+    polars.DataFrame arguments, e.g., error masks, are converted as by `accepts_polars`, and so is 'data' if a 'cache' is given,
+    which stores pandas DataFrames.
+    """
+    return cast("F", _wrap(func, columns=True))
+
+
+def _wrap(func: Callable[..., Any], *, columns: bool) -> Callable[..., Any]:
+    """Returns the wrapper of `accepts_polars`, or of `accepts_polars_columns` if 'columns' is set."""
+    signature = inspect.signature(func)
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
+        pl = _get_polars()
+        if pl is None or not any(isinstance(argument, pl.DataFrame) for argument in (*args, *kwargs.values())):
+            return func(*args, **kwargs)
+
+        arguments = signature.bind(*args, **kwargs).arguments
+        columnar_data = None
+        if columns and isinstance(arguments.get("data"), pl.DataFrame) and arguments.get("cache") is None:
+            columnar_data = arguments["data"]
+
+        originals = [
+            (argument, polars_to_pandas(argument)) for argument in arguments.values() if isinstance(argument, pl.DataFrame) and argument is not columnar_data
+        ]
+        converted: dict[int, Any] = {id(polars_data): pandas_data for polars_data, pandas_data in originals}
+        if columnar_data is not None:
+            converted[id(columnar_data)] = PolarsColumns(columnar_data)
+
+        args = tuple(converted.get(id(argument), argument) for argument in args)
+        kwargs = {key: converted.get(id(argument), argument) for key, argument in kwargs.items()}
+        return _convert_result(func(*args, **kwargs), originals)
+
+    return wrapper
@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+import contextlib
+import dataclasses
+from multiprocessing.shared_memory import SharedMemory
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+import pandas as pd
+
+from tab_err._arrow import pa
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable, Iterable, Sequence
+
+
+@dataclasses.dataclass
+class SharedColumn:
+    """The values of a column in a shared memory block, which is pickled as the name of the block and how to restore the values.
+
+    NumPy columns store their values, categorical columns their codes, and Arrow-backed columns an Arrow IPC stream. Processes attach
+    to the block without copying the values.
+
+    Attributes:
+        block (str): The name of the shared memory block.
+        kind (str): How the values are stored: 'numpy', 'categorical', or 'arrow'.
+        dtype (Any): The dtype of the column.
+        length (int): The number of values.
+        buffer_dtype (str | None): The NumPy dtype of the values or codes in the block, None for Arrow columns.
+    """
+
+    block: str
+    kind: str
+    dtype: Any
+    length: int
+    buffer_dtype: str | None = None
+
+    def attach(self: SharedColumn, start: int = 0, stop: int | None = None, *, copy: bool = False) -> tuple[Any, SharedMemory]:
+        """Returns the values from `start` to `stop` as an array and the attached block, which must stay open while the values are used.
+
+        Without `copy`, the values are views of the block. With `copy`, they are copies, and the block can be closed right away.
+        """
+        block = SharedMemory(name=self.block)
+        stop = self.length if stop is None else stop
+
+        if self.kind == "arrow":
+            buffer = pa.py_buffer(bytes(block.buf) if copy else block.buf)  # type: ignore[arg-type]
+            values = pa.ipc.open_stream(buffer).read_all().column(0).slice(start, stop - start)
+            return pd.array(values, dtype=self.dtype), block
+
+        view = np.ndarray((self.length,), dtype=np.dtype(self.buffer_dtype), buffer=block.buf)[start:stop]
+        values = view.copy() if copy else view
+        if self.kind == "categorical":
+            return pd.Categorical.from_codes(values, dtype=self.dtype, validate=False), block
+
+        return values, block
+
+
+def share_series(series: pd.Series) -> tuple[SharedColumn, SharedMemory] | None:
+    """Copies the values of 'series' into a new shared memory block, or returns None if its dtype cannot be shared, e.g., object columns."""
+    dtype = series.dtype
+    if isinstance(dtype, np.dtype) and dtype.kind in "biufmM":
+        return _share_array(series.to_numpy(), "numpy", dtype)
+
+    if isinstance(dtype, pd.CategoricalDtype):
+        return _share_array(series.cat.codes.to_numpy(), "categorical", dtype)
+
+    if pa is not None and (isinstance(dtype, pd.ArrowDtype) or (isinstance(dtype, pd.StringDtype) and dtype.storage == "pyarrow")):
+        return _share_arrow(series.array.__arrow_array__(), dtype)
+
+    return None
+
+
+def _share_array(values: np.ndarray, kind: str, dtype: Any) -> tuple[SharedColumn, SharedMemory]:  # noqa: ANN401
+    """Copies a 1-D array into a new shared memory block."""
+    block = SharedMemory(create=True, size=max(values.nbytes, 1))
+    np.ndarray(values.shape, dtype=values.dtype, buffer=block.buf)[:] = values
+    return SharedColumn(block.name, kind, dtype, len(values), values.dtype.str), block
+
+
+def _share_arrow(values: pa.ChunkedArray, dtype: Any) -> tuple[SharedColumn, SharedMemory]:  # noqa: ANN401
+    """Writes an Arrow array as IPC stream into a new shared memory block, whose size is measured by writing it to a mock stream first."""
+    table = pa.table({"values": values})
+    mock = pa.MockOutputStream()
+    with pa.ipc.new_stream(mock, table.schema) as writer:
+        writer.write_table(table)
+
+    block = SharedMemory(create=True, size=max(mock.size(), 1))
+    with pa.ipc.new_stream(pa.FixedSizeBufferWriter(pa.py_buffer(block.buf)), table.schema) as writer:
+        writer.write_table(table)
+
+    return SharedColumn(block.name, "arrow", dtype, len(values)), block
+
+
+def release(blocks: Iterable[SharedMemory], *, unlink: bool = False) -> None:
+    """Closes the attached blocks and unlinks them if `unlink`. Blocks whose memory is still referenced stay mapped until the process exits."""
+    for block in blocks:
+        with contextlib.suppress(BufferError):
+            block.close()
+
+        if unlink:
+            block.unlink()
+
+
+def unlink_columns(parts: Iterable[SharedColumn | pd.Series]) -> None:
+    """Unlinks the shared blocks of columns that are not gathered, e.g., after an error. Blocks that were unlinked already are skipped."""
+    for part in parts:
+        if isinstance(part, SharedColumn):
+            with contextlib.suppress(FileNotFoundError):
+                release([SharedMemory(name=part.block)], unlink=True)
+
+
+@dataclasses.dataclass
+class SharedFrame:
+    """A range of rows of a DataFrame whose shareable columns are in shared memory blocks and whose other columns are pickled.
+
+    Attributes:
+        columns (pd.Index): The columns of the DataFrame.
+        shared (dict[int, SharedColumn]): The shared columns of the whole DataFrame by position.
+        other (pd.DataFrame): The rows of the columns that are not shared.
+        index (pd.Index): The index of the rows.
+        start (int): The position of the first row.
+    """
+
+    columns: pd.Index
+    shared: dict[int, SharedColumn]
+    other: pd.DataFrame
+    index: pd.Index
+    start: int
+
+    @staticmethod
+    def share(data: pd.DataFrame) -> tuple[dict[int, SharedColumn], list[SharedMemory]]:
+        """Copies the shareable columns of 'data' into shared memory blocks, once for all ranges of rows, and returns them with their blocks."""
+        shared, blocks = {}, []
+        for position in range(len(data.columns)):
+            result = share_series(data.iloc[:, position])
+            if result is not None:
+                shared[position], block = result
+                blocks.append(block)
+
+        return shared, blocks
+
+    @staticmethod
+    def from_rows(data: pd.DataFrame, shared: dict[int, SharedColumn], start: int, stop: int) -> SharedFrame:
+        """Returns the SharedFrame of the rows from `start` to `stop` of 'data', whose shareable columns were shared by `share`."""
+        other = data.iloc[start:stop, [position for position in range(len(data.columns)) if position not in shared]]
+        return SharedFrame(data.columns, shared, other, data.index[start:stop], start)
+
+    def attach(self: SharedFrame) -> tuple[pd.DataFrame, list[SharedMemory]]:
+        """Returns the rows as DataFrame, whose shared columns are views of the blocks, and the attached blocks."""
+        stop = self.start + len(self.index)
+        columns, blocks = {}, []
+        other_positions = iter(range(len(self.other.columns)))
+        for position in range(len(self.columns)):
+            if position in self.shared:
+                columns[position], block = self.shared[position].attach(self.start, stop)
+                blocks.append(block)
+            else:
+                columns[position] = self.other.iloc[:, next(other_positions)].array
+
+        data = pd.DataFrame(columns, index=self.index, copy=False)
+        data.columns = self.columns
+        return data, blocks
+
+
+def gather_column(parts: Sequence[SharedColumn | pd.Series], index: pd.Index, name: Hashable) -> pd.Series:
+    """Concatenates the parts of a column that the partitions returned, shared or pickled, and unlinks the shared blocks.
+
+    Categorical parts with different categories get the union of their categories.
+    """
+    values: list[Any] = []
+    blocks = []
+    try:
+        for part in parts:
+            if isinstance(part, SharedColumn):
+                attached, block = part.attach(copy=part.kind != "numpy")  # NumPy views are copied once by concatenating them
+                values.append(attached)
+                blocks.append(block)
+                del attached
+            else:
+                values.append(part.array)
+
+        return _concat_values(values, index, name)
+    finally:
+        values.clear()  # Drop the views before closing the blocks
+        release(blocks, unlink=True)
+
+
+def _concat_values(values: Sequence[Any], index: pd.Index, name: Hashable) -> pd.Series:
+    """Concatenates arrays into a new Series. Categorical arrays with different categories get the union of their categories."""
+    if all(isinstance(array, np.ndarray) for array in values):
+        return pd.Series(np.concatenate(values), index=index, name=name)
+
+    if all(isinstance(array, pd.Categorical) for array in values):
+        return pd.Series(pd.api.types.union_categoricals(values), index=index, name=name)
+
+    return pd.Series(pd.concat([pd.Series(array) for array in values], ignore_index=True).array, index=index, name=name)
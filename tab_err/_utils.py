@@ -1,12 +1,20 @@
 from __future__ import annotations
 
+import copy
 import random
-from typing import TYPE_CHECKING
+import weakref
+from typing import TYPE_CHECKING, Any, TypeVar
 
 import numpy as np
+import pandas as pd
 
 if TYPE_CHECKING:
-    import pandas as pd
+    from collections.abc import Callable, Hashable, Sequence
+
+    from tab_err import ErrorMechanism, ErrorType
+    from tab_err._observer import Observer
+
+_Component = TypeVar("_Component", "ErrorMechanism", "ErrorType")
 
 
 def set_column(data: pd.DataFrame, column: int | str, series: pd.Series) -> None:
@@ -15,9 +23,7 @@ def set_column(data: pd.DataFrame, column: int | str, series: pd.Series) -> None
     Mutates data and changes the dtype of the original data to that of the series,
     which, depending on the error type, might change.
     """
-    col = data.columns[column] if isinstance(column, int) else column
-    data[col] = data[col].astype(series.dtype)
-    data[col] = series
+    data[get_column_str(data, column)] = series
 
 
 def get_column_str(data: pd.DataFrame, column: int | str) -> str:
@@ -49,6 +55,22 @@ def seed_randomness_and_get_generator(seed: int | None) -> np.random.Generator:
     return random_generator
 
 
+def derive_seeded_copy(component: _Component, key: int) -> _Component:
+    """Returns a shallow copy of an ErrorMechanism or ErrorType whose seed is derived from its seed and `key`, or None if it has none.
+
+    The copy shares the config of `component`, including the values that the component sampled into it, e.g., the delta of AddDelta.
+    Copies of ErrorMechanisms that cache sort orders get their own SortOrderCache, so that copies can sample different DataFrames in different threads.
+    """
+    component_copy = copy.copy(component)
+    if component._seed is not None:  # noqa: SLF001
+        component_copy._seed = int(np.random.SeedSequence([component._seed, key]).generate_state(1)[0])  # noqa: SLF001
+
+    if hasattr(component_copy, "_sort_order_cache") and component_copy._sort_order_cache is not None:  # noqa: SLF001
+        component_copy._sort_order_cache = SortOrderCache()  # noqa: SLF001
+
+    return component_copy
+
+
 def check_error_rate(error_rate: float) -> None:
     """Check that the error rate falls in the valid range, raise a ValueError otherwise."""
     if error_rate < 0.0 or error_rate > 1.0:
@@ -56,8 +78,160 @@ def check_error_rate(error_rate: float) -> None:
         raise ValueError(msg)
 
 
+def count_errors(n_rows: int, n_error_free: int, error_rate: float) -> int:
+    """Returns the number of errors to insert into a column of `n_rows` cells, raises a ValueError if it has fewer error-free cells."""
+    n_errors = int(n_rows * error_rate)
+
+    if n_error_free < n_errors:
+        msg = f"The error rate of {error_rate} requires {n_errors} error-free cells. "
+        msg += f"However, only {n_error_free} error-free cells are available."
+        raise ValueError(msg)
+
+    return n_errors
+
+
+def map_unique(series: pd.Series, function: Callable[[Any], Any]) -> pd.Series:
+    """Applies `function` to each value of `series` like `Series.apply`, but calls it only once per unique value.
+
+    The values are factorized, `function` maps the unique values, and the results are taken back to the positions of the values.
+    This requires `function` to be deterministic. Missing values are mapped as well, as `Series.apply` does.
+    """
+    if series.empty:
+        return series.apply(function)
+
+    codes, uniques = pd.factorize(series, use_na_sentinel=False)
+    mapped = pd.Series([function(value) for value in uniques], dtype=object).infer_objects()
+    return pd.Series(mapped.to_numpy().take(codes), index=series.index, name=series.name)
+
+
 def check_data_emptiness(data: pd.DataFrame) -> None:
     """Check that the dataset is not empty, raise a ValueError otherwise."""
     if data.empty:
         msg = "The dataframe is empty, cannot introduce errors."
         raise ValueError(msg)
+
+
+def check_error_rates_ascending(error_rates: Sequence[float]) -> None:
+    """Check that the error rates of a sweep are valid and sorted in ascending order, raise a ValueError otherwise."""
+    if len(error_rates) == 0:
+        msg = "'error_rates' needs to contain at least one error rate."
+        raise ValueError(msg)
+
+    for error_rate in error_rates:
+        check_error_rate(error_rate)
+
+    if any(lower > higher for lower, higher in zip(error_rates, error_rates[1:])):
+        msg = f"The error rates {list(error_rates)} of a sweep must be sorted in ascending order."
+        raise ValueError(msg)
+
+
+def insert_errors_at_positions(  # noqa: PLR0913
+    data: pd.DataFrame,
+    column: str | int,
+    positions: np.ndarray,
+    error_type: ErrorType,
+    observer: Observer | None = None,
+    *,
+    rng: np.random.Generator | None = None,
+) -> None:
+    """Inserts errors of `error_type` into the cells of `column` at the row `positions`. Mutates data.
+
+    `rng` and `observer` are passed to `ErrorType.apply_series`.
+    """
+    step_mask = np.zeros(len(data), dtype=bool)
+    step_mask[positions] = True
+    set_column(data, column, error_type.apply_series(get_column(data, column), step_mask, rng, observer=observer))
+
+
+def get_array_column(data: np.ndarray, column: int | str) -> np.ndarray:
+    """Selects a column of a 2-D array by position, or a field of a structured array by name or position."""
+    if data.dtype.names is None:
+        return data[:, column]  # type: ignore[index]
+
+    return data[column if isinstance(column, str) else data.dtype.names[column]]
+
+
+def get_column_labels(data: pd.DataFrame | np.ndarray) -> list[Hashable]:
+    """Returns the column names of a DataFrame or structured array, or the column positions of a 2-D array."""
+    if not isinstance(data, np.ndarray):  # A DataFrame, or the PolarsColumns of a polars.DataFrame
+        return data.columns.to_list()
+
+    if data.dtype.names is None:
+        return list(range(data.shape[1]))
+
+    return list(data.dtype.names)
+
+
+def get_column_label(data: pd.DataFrame | np.ndarray, column: int | str) -> Hashable:
+    """Returns the element of `get_column_labels` that denotes `column`, given by name or position."""
+    if not isinstance(data, np.ndarray):
+        return get_column_str(data, column)
+
+    return get_column_labels(data)[column] if isinstance(column, int) else column
+
+
+def get_sort_order(data: pd.DataFrame | np.ndarray, columns: tuple[Hashable, ...]) -> np.ndarray:
+    """Returns the positions that stably sort `data` by `columns`, where the first column is the primary key and missing values come last.
+
+    `data` is a DataFrame, or a numeric 2-D or structured array whose columns are denoted as by `get_column_labels`.
+    """
+    if isinstance(data, np.ndarray):  # NumPy sorts NaN last
+        return np.lexsort([get_array_column(data, col) for col in reversed(columns)])  # type: ignore[arg-type]
+
+    keys = []
+    for col in reversed(columns):  # np.lexsort uses the last key as primary key
+        codes, _ = pd.factorize(data[col], sort=True)
+        keys.append(np.where(codes < 0, len(codes), codes))
+
+    return np.lexsort(keys)
+
+
+def get_numeric_sort_keys(data: pd.DataFrame | np.ndarray, column: Hashable) -> np.ndarray | None:
+    """Returns float values that sort the rows as `get_sort_order` sorts them by `column`, with NaN for missing values.
+
+    Supported are numeric, boolean, datetime, and timedelta columns, and categorical columns whose categories sort by their codes.
+    Returns None for other columns, e.g., strings. Integers beyond 2**53 lose precision.
+    """
+    if isinstance(data, np.ndarray):
+        values = get_array_column(data, column)  # type: ignore[arg-type]
+        return values.astype(np.float64) if values.dtype.kind in "biuf" else None
+
+    series = data[column]
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        codes = series.cat.codes.to_numpy().astype(np.float64)
+        return np.where(codes < 0, np.nan, codes)
+
+    if series.dtype.kind in "mM":
+        values = series.to_numpy()
+        return np.where(np.isnat(values), np.nan, values.view(np.int64).astype(np.float64))
+
+    if pd.api.types.is_numeric_dtype(series.dtype) or pd.api.types.is_bool_dtype(series.dtype):
+        return series.to_numpy(dtype=np.float64, na_value=np.nan)
+
+    return None
+
+
+class SortOrderCache:
+    """Caches the sort orders of the columns of one DataFrame or array.
+
+    Error mechanisms that select blocks of sorted values only need to sort a column once per DataFrame. Later samples
+    filter the cached order by the error-free cells, which is O(n) instead of O(n log n). The cache is bound to the identity
+    of the DataFrame it was last used with and is reset whenever a different DataFrame is passed. It cannot detect in-place
+    mutations of the DataFrame, so error mechanisms only use it if it is set explicitly, e.g., by `high_level.create_errors_many`
+    for the DataFrame it owns while creating variants.
+    """
+
+    def __init__(self: SortOrderCache) -> None:
+        self._data_ref: weakref.ref[pd.DataFrame | np.ndarray] | None = None
+        self._orders: dict[tuple[Hashable, ...], np.ndarray] = {}
+
+    def get(self: SortOrderCache, data: pd.DataFrame | np.ndarray, columns: tuple[Hashable, ...]) -> np.ndarray:
+        """Returns the cached sort order of `data` by `columns`, computing it on first use."""
+        if self._data_ref is None or self._data_ref() is not data:
+            self._data_ref = weakref.ref(data)
+            self._orders = {}
+
+        if columns not in self._orders:
+            self._orders[columns] = get_sort_order(data, columns)
+
+        return self._orders[columns]
@@ -1,2 +1,15 @@
-from tab_err.api import low_level, mid_level
-from tab_err.api.mid_level import MidLevelConfig
+from typing import TYPE_CHECKING
+
+from tab_err._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submodules=["array", "cache", "cost", "high_level", "low_level", "mid_level", "minibatch", "parallel", "transformer"],
+    attributes={"MidLevelConfig": ".mid_level", "MidLevelPlan": ".mid_level", "ResultCache": ".cache", "TabErrTransformer": ".transformer"},
+)
+
+if TYPE_CHECKING:
+    from tab_err.api import array, cache, cost, high_level, low_level, mid_level, minibatch, parallel, transformer
+    from tab_err.api.cache import ResultCache
+    from tab_err.api.mid_level import MidLevelConfig, MidLevelPlan
+    from tab_err.api.transformer import TabErrTransformer
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from tab_err._utils import check_error_rate, get_array_column, get_column_label, get_column_labels
+from tab_err.api.mid_level import _to_mid_level_config
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable
+
+    from tab_err.api.mid_level import MidLevelConfig
+
+
+def _check_array(data: np.ndarray) -> None:
+    """Checks that 'data' is a non-empty numeric 2-D array or a non-empty 1-D structured array, raises a TypeError or ValueError otherwise."""
+    if not isinstance(data, np.ndarray):
+        msg = f"'data' needs to be a NumPy array but was {type(data)}."
+        raise TypeError(msg)
+
+    if data.dtype.names is None and (data.ndim != 2 or data.dtype.kind not in "iuf"):  # noqa: PLR2004
+        msg = f"'data' needs to be a 2-D array of integers or floating point numbers, but has {data.ndim} dimensions and dtype {data.dtype}."
+        raise TypeError(msg)
+
+    if data.dtype.names is not None and data.ndim != 1:
+        msg = f"A structured array needs to be 1-D, but 'data' has {data.ndim} dimensions."
+        raise TypeError(msg)
+
+    if data.size == 0:
+        msg = "The array is empty, cannot introduce errors."
+        raise ValueError(msg)
+
+
+def _assemble(data: np.ndarray, dirty_columns: dict[Hashable, np.ndarray]) -> np.ndarray:
+    """Returns a copy of 'data' whose columns are replaced by 'dirty_columns', with the dtype promoted to hold the dirty values."""
+    if data.dtype.names is None:
+        dirty_data = data.astype(np.result_type(data.dtype, *(values.dtype for values in dirty_columns.values())))
+        for position, values in dirty_columns.items():
+            dirty_data[:, position] = values  # type: ignore[index]
+
+        return dirty_data
+
+    dtype = np.dtype([(name, dirty_columns[name].dtype if name in dirty_columns else data.dtype[name]) for name in data.dtype.names])
+    dirty_data = data.astype(dtype)
+    for name, values in dirty_columns.items():
+        dirty_data[name] = values  # type: ignore[call-overload]
+
+    return dirty_data
+
+
+def create_errors(data: np.ndarray, config: MidLevelConfig | dict) -> tuple[np.ndarray, np.ndarray]:
+    """Creates errors in a numeric 2-D array or structured array, following a configuration as for the mid-level API.
+
+    The error mechanisms and error types work directly on the arrays, without creating pandas objects. Supported are the error mechanisms
+    ECAR, ENAR, and EAR, and the error types that implement `ErrorType.apply_array`: AddDelta, Outlier, WrongUnit, and MissingValue.
+    With the same seeds, the errors are the same as the ones of the mid-level API for a DataFrame with the same values.
+
+    Args:
+        data (np.ndarray): A 2-D array of integers or floating point numbers, or a 1-D structured array whose fields are the columns.
+        config (MidLevelConfig | dict): The configuration for the error generation process. Columns of 2-D arrays are denoted by their position,
+            fields of structured arrays by their name or position.
+
+    Raises:
+        TypeError: If 'data' is not a numeric 2-D array or structured array, or an error type does not support arrays.
+        KeyError: If a column of the configuration does not exist in 'data'.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]:
+            - The first element is a copy of 'data' with errors. Its dtype is promoted if errors change the dtype of a column, e.g.,
+              MissingValue turns integers into floating point numbers to insert NaN.
+            - The second element is the associated boolean error mask of shape (rows, columns).
+    """
+    _check_array(data)
+    _config = _to_mid_level_config(config)
+
+    labels = get_column_labels(data)
+    error_mask = np.zeros((len(data), len(labels)), dtype=bool)
+    dirty_columns: dict[Hashable, np.ndarray] = {}
+
+    for column in _config.columns:
+        if isinstance(column, int) and not -len(labels) <= column < len(labels):
+            msg = f"Column position {column} does not exist in 'data', which has {len(labels)} columns."
+            raise KeyError(msg)
+
+        label = get_column_label(data, column)
+        if label not in labels:
+            msg = f"Column '{column}' does not exist in 'data'."
+            raise KeyError(msg)
+
+        column_position = labels.index(label)
+        values = dirty_columns[label] if label in dirty_columns else get_array_column(data, label)  # type: ignore[arg-type]
+
+        for error_model in _config.columns[column]:
+            check_error_rate(error_model.error_rate)
+
+            positions = error_model.error_mechanism.sample_array_priority(data, column, error_model.error_rate, error_mask)
+            error_mask[positions, column_position] = True
+
+            step_mask = np.zeros(len(data), dtype=bool)
+            step_mask[positions] = True
+            values = error_model.error_type.apply_array(values, step_mask)
+
+        dirty_columns[label] = values
+
+    return _assemble(data, dirty_columns), error_mask
@@ -0,0 +1,199 @@
+from __future__ import annotations
+
+import contextlib
+import dataclasses
+import hashlib
+import os
+import pickle
+import shutil
+import tempfile
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+import pandas as pd
+
+from tab_err.error_mechanism._error_mechanism import ErrorMechanism
+from tab_err.error_type._error_type import ErrorType
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+# Attributes of error mechanisms and error types that hold state of a run instead of configuration, and are not part of cache keys.
+_RUNTIME_ATTRIBUTES = frozenset({"_random_generator", "_sort_order_cache"})
+
+
+class ResultCache:
+    """An on-disk cache of the results of the APIs, e.g., to reuse the same corruption of a dataset across experiments.
+
+    Pass it as `cache` to `low_level.create_errors`, `mid_level.create_errors`, or `high_level.create_errors`. Entries are keyed by a hash
+    of the data, the arguments of the call, including the configs and seeds of the error mechanisms and error types, and the name of the
+    API. Calls whose errors are random, i.e., an error mechanism or error type without seed or the high-level API without seed, are not
+    cached. Numeric columns and the error mask are stored as `.npy` files that are memory-mapped copy-on-write when they are loaded,
+    so that a cache hit reads only the pages it uses and modifying the result does not modify the cache. Other columns are pickled.
+    When the entries exceed `max_bytes`, the least recently used ones are deleted.
+
+    A cache hit reports no StageEvents and does not sample values into the configs of the error types, e.g., the delta of AddDelta.
+    Since sampled values are part of the key, the second call with the same error type objects is a cache miss and later ones are hits.
+    Values without a stable representation, e.g., functions in the configs of error types, make each call a cache miss.
+    Entries are unpickled when they are loaded, so only use directories that you trust.
+
+    Attributes:
+        directory (Path): The directory of the entries.
+        max_bytes (int): The maximum total size of the entries in bytes.
+    """
+
+    def __init__(self: ResultCache, directory: str | os.PathLike[str], max_bytes: int = 2**30) -> None:
+        """Initialization method of the ResultCache class.
+
+        Args:
+            directory (str | os.PathLike[str]): The directory of the entries. It is created if it does not exist.
+            max_bytes (int, optional): The maximum total size of the entries in bytes. Defaults to 1 GiB.
+
+        Raises:
+            ValueError: If `max_bytes` is smaller than 1.
+        """
+        if max_bytes < 1:
+            msg = f"'max_bytes' is: {max_bytes} and should be a positive integer."
+            raise ValueError(msg)
+
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+
+    def key(self: ResultCache, data: pd.DataFrame, *arguments: Any) -> str | None:  # noqa: ANN401
+        """Returns the key of a call with 'data' and 'arguments', or None if an error mechanism or error type in 'arguments' has no seed."""
+        components: list[ErrorMechanism | ErrorType] = []
+        description = repr(_describe(arguments, components))
+        if any(component._seed is None for component in components):  # noqa: SLF001
+            return None
+
+        digest = hashlib.blake2b(hash_data(data).encode(), digest_size=16)
+        digest.update(description.encode())
+        return digest.hexdigest()
+
+    def load(self: ResultCache, key: str) -> tuple[pd.DataFrame, pd.DataFrame] | None:
+        """Returns the dirty data and the error mask of 'key', or None if they are not cached, and marks the entry as recently used."""
+        entry = self.directory / key
+        try:
+            with (entry / "frame.pkl").open("rb") as file:
+                frame = pickle.load(file)  # noqa: S301 - the entries are written by `store`
+
+            values = {
+                position: frame["other"][position] if position in frame["other"] else _map_array(entry / f"column_{position}.npy")
+                for position in range(len(frame["columns"]))
+            }
+            error_mask_values = _map_array(entry / "error_mask.npy")
+        except FileNotFoundError:  # not cached, or evicted by another process
+            return None
+
+        with contextlib.suppress(OSError):
+            os.utime(entry)
+
+        data_dirty = pd.DataFrame(values, index=frame["index"], copy=False)
+        data_dirty.columns = frame["columns"]
+        error_mask = pd.DataFrame(error_mask_values, index=frame["index"], columns=frame["mask_columns"], copy=False)
+        return data_dirty, error_mask
+
+    def store(self: ResultCache, key: str, data_dirty: pd.DataFrame, error_mask: pd.DataFrame) -> None:
+        """Stores the dirty data and the error mask as the entry of 'key' and evicts the least recently used entries.
+
+        Results that are larger than `max_bytes` are not stored. The entry is written to a temporary directory first and then renamed,
+        so that other processes never load partial entries.
+        """
+        temporary = Path(tempfile.mkdtemp(prefix=".tmp-", dir=self.directory))
+        try:
+            other = {}
+            for position in range(len(data_dirty.columns)):
+                series = data_dirty.iloc[:, position]
+                if isinstance(series.dtype, np.dtype) and series.dtype.kind in "biufmM":
+                    np.save(temporary / f"column_{position}.npy", series.to_numpy())
+                else:
+                    other[position] = series.array
+
+            np.save(temporary / "error_mask.npy", error_mask.to_numpy(dtype=bool))
+            frame = {"columns": data_dirty.columns, "index": data_dirty.index, "mask_columns": error_mask.columns, "other": other}
+            with (temporary / "frame.pkl").open("wb") as file:
+                pickle.dump(frame, file, protocol=pickle.HIGHEST_PROTOCOL)
+
+            if _get_size(temporary) <= self.max_bytes:
+                with contextlib.suppress(OSError):  # another process stored the entry first
+                    temporary.rename(self.directory / key)
+        finally:
+            shutil.rmtree(temporary, ignore_errors=True)
+
+        self._evict()
+
+    def clear(self: ResultCache) -> None:
+        """Deletes all entries."""
+        for entry in self._iter_entries():
+            shutil.rmtree(entry, ignore_errors=True)
+
+    def __len__(self: ResultCache) -> int:
+        """Returns the number of entries."""
+        return sum(1 for _ in self._iter_entries())
+
+    def _iter_entries(self: ResultCache) -> Iterator[Path]:
+        """Yields the directories of the entries, without the temporary directories of entries that are being stored."""
+        return (entry for entry in self.directory.iterdir() if entry.is_dir() and not entry.name.startswith("."))
+
+    def _evict(self: ResultCache) -> None:
+        """Deletes the least recently used entries until the entries fit into `max_bytes`."""
+        entries = []
+        for entry in self._iter_entries():
+            with contextlib.suppress(FileNotFoundError):  # evicted by another process
+                entries.append((entry.stat().st_mtime_ns, _get_size(entry), entry))
+
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, entry in sorted(entries):
+            if total_size <= self.max_bytes:
+                break
+
+            shutil.rmtree(entry, ignore_errors=True)
+            total_size -= size
+
+
+def hash_data(data: pd.DataFrame) -> str:
+    """Returns a hash of the values, index, column names, and dtypes of 'data'. NumPy columns are hashed as raw bytes, others by pandas."""
+    digest = hashlib.blake2b(repr((data.columns.to_list(), [str(dtype) for dtype in data.dtypes])).encode(), digest_size=16)
+    digest.update(pd.util.hash_pandas_object(data.index).to_numpy())
+    for position in range(len(data.columns)):
+        series = data.iloc[:, position]
+        if isinstance(series.dtype, np.dtype) and series.dtype.kind in "biufmM":
+            digest.update(np.ascontiguousarray(series.to_numpy()).view(np.uint8).data)
+        else:
+            digest.update(pd.util.hash_pandas_object(series, index=False).to_numpy())
+
+    return digest.hexdigest()
+
+
+def _describe(value: Any, components: list[ErrorMechanism | ErrorType]) -> Any:  # noqa: ANN401
+    """Returns a representation of 'value' that is equal for equal configurations and collects the error mechanisms and error types in it."""
+    if isinstance(value, (ErrorMechanism, ErrorType)):
+        components.append(value)
+        attributes = {name: attribute for name, attribute in vars(value).items() if name not in _RUNTIME_ATTRIBUTES}
+        return type(value).__module__, type(value).__qualname__, _describe(attributes, components)
+
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return type(value).__qualname__, _describe({field.name: getattr(value, field.name) for field in dataclasses.fields(value)}, components)
+
+    if isinstance(value, dict):
+        return tuple((repr(name), _describe(item, components)) for name, item in value.items())
+
+    if isinstance(value, (list, tuple)):
+        return type(value).__name__, tuple(_describe(item, components) for item in value)
+
+    if isinstance(value, np.ndarray):  # the repr of large arrays is truncated
+        return value.dtype.str, value.shape, hashlib.blake2b(np.ascontiguousarray(value).tobytes(), digest_size=16).hexdigest()
+
+    return repr(value)
+
+
+def _map_array(path: Path) -> np.ndarray:
+    """Memory-maps the array of a `.npy` file copy-on-write, as a plain ndarray that is a view of the np.memmap."""
+    return np.load(path, mmap_mode="c").view(np.ndarray)
+
+
+def _get_size(directory: Path) -> int:
+    """Returns the total size of the files in 'directory' in bytes."""
+    return sum(path.stat().st_size for path in directory.iterdir())
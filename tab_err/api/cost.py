@@ -0,0 +1,418 @@
+from __future__ import annotations
+
+import dataclasses
+from collections import defaultdict
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+import pandas as pd
+
+from tab_err._utils import check_error_rate
+from tab_err.api.high_level import _build_config
+from tab_err.api.mid_level import _to_mid_level_config
+from tab_err.error_mechanism._error_mechanism import ErrorMechanism
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from tab_err import ErrorType
+    from tab_err.api.mid_level import MidLevelConfig
+
+
+@dataclasses.dataclass(frozen=True)
+class CostModel:
+    """Linear model of the wall time and the peak memory of one application of an ErrorType or one sampling of an ErrorMechanism.
+
+    Both are `fixed + per_row * n_rows + per_cell * n_cells`, where `n_cells` is the number of cells that are changed or selected.
+
+    Attributes:
+        seconds (float): Fixed wall time in seconds.
+        seconds_per_row (float): Wall time per row of the column in seconds.
+        seconds_per_cell (float): Wall time per changed or selected cell in seconds.
+        bytes (float): Fixed peak memory in bytes.
+        bytes_per_row (float): Peak memory per row of the column in bytes.
+        bytes_per_cell (float): Peak memory per changed or selected cell in bytes.
+    """
+
+    seconds: float
+    seconds_per_row: float
+    seconds_per_cell: float
+    bytes: float
+    bytes_per_row: float
+    bytes_per_cell: float
+
+    def time(self: CostModel, n_rows: int, n_cells: int) -> float:
+        """Returns the modeled wall time in seconds."""
+        return self.seconds + self.seconds_per_row * n_rows + self.seconds_per_cell * n_cells
+
+    def memory(self: CostModel, n_rows: int, n_cells: int) -> float:
+        """Returns the modeled peak memory in bytes."""
+        return self.bytes + self.bytes_per_row * n_rows + self.bytes_per_cell * n_cells
+
+
+# Fitted by `fit_cost_models` to the micro benchmarks with 1e4 to 1e6 rows and a range index, on one core of a Linux machine.
+DEFAULT_COST_MODELS: dict[tuple[str, str], CostModel] = {
+    ("AddDelta", "datetime64"): CostModel(0.00444, 4.15e-07, 0.0, 4.93e04, 69, 0.0),
+    ("AddDelta", "float64"): CostModel(0.000565, 1.12e-08, 7.41e-09, 3.39e04, 28, 0.0),
+    ("AddDelta", "int64"): CostModel(0.000686, 3.27e-08, 0.0, 4.93e04, 69, 0.0),
+    ("CategorySwap", "category"): CostModel(0.00206, 4.02e-09, 1.69e-07, 9.03e03, 1, 74),
+    ("EAR", "category"): CostModel(0.000768, 7.79e-08, 0.0, 0.0, 30.1, 0.0),
+    ("EAR", "datetime64"): CostModel(0.0, 3.8e-07, 0.0, 0.0, 61.6, 0.0),
+    ("EAR", "float64"): CostModel(0.0, 2.17e-07, 5.76e-07, 0.0, 61.5, 0.0),
+    ("EAR", "int64"): CostModel(0.0, 1.19e-07, 2e-09, 0.0, 44.7, 0.0),
+    ("EAR", "object"): CostModel(0.0, 2.19e-06, 5.59e-07, 0.0, 61.1, 0.0),
+    ("ECAR", "category"): CostModel(0.000156, 6.46e-09, 1.27e-08, 0.0, 14.2, 19.1),
+    ("ECAR", "datetime64"): CostModel(0.0, 1.59e-09, 4.1e-08, 0.0, 14.2, 19.1),
+    ("ECAR", "float64"): CostModel(0.000107, 3.35e-09, 2.47e-08, 0.0, 14.2, 19.1),
+    ("ECAR", "int64"): CostModel(0.000137, 3.32e-09, 1.57e-08, 0.0, 14.2, 19.1),
+    ("ECAR", "object"): CostModel(0.0, 2.88e-09, 5.54e-08, 0.0, 14.2, 19.1),
+    ("ENAR", "category"): CostModel(0.00113, 7.42e-08, 0.0, 0.0, 30.1, 0.0),
+    ("ENAR", "datetime64"): CostModel(0.0, 3.62e-07, 1.58e-07, 0.0, 61.6, 0.0),
+    ("ENAR", "float64"): CostModel(0.0, 2.73e-07, 0.0, 0.0, 61.5, 0.0),
+    ("ENAR", "int64"): CostModel(0.0, 1.14e-07, 0.0, 0.0, 44.7, 0.0),
+    ("ENAR", "object"): CostModel(0.0, 2.22e-06, 0.0, 0.0, 61.1, 0.0),
+    ("Extraneous", "category"): CostModel(0.000626, 6.01e-09, 3.49e-08, 6.04e03, 8.99, 54.7),
+    ("Extraneous", "datetime64"): CostModel(0.0, 1.29e-06, 6.38e-06, 1.67e04, 144, 118),
+    ("Extraneous", "float64"): CostModel(0.0, 5.29e-08, 1.37e-06, 7.69e03, 40, 109),
+    ("Extraneous", "int64"): CostModel(0.00117, 4.48e-08, 3.79e-08, 4.77e04, 39.8, 40),
+    ("Extraneous", "object"): CostModel(0.0, 0.0, 1.57e-06, 0.0, 8.01, 158),
+    ("MissingValue", "category"): CostModel(0.000415, 2.26e-09, 1.3e-08, 6.6e03, 3, 0.0),
+    ("MissingValue", "datetime64"): CostModel(0.000377, 2.91e-09, 1.41e-08, 7.15e03, 10, 0.0),
+    ("MissingValue", "float64"): CostModel(0.000208, 3.11e-09, 2.86e-08, 3.74e04, 9.97, 0.0),
+    ("MissingValue", "int64"): CostModel(0.000483, 4.91e-09, 5.72e-09, 7.33e04, 17, 0.0),
+    ("MissingValue", "object"): CostModel(0.0, 4.22e-08, 4.12e-07, 4.21e03, 16, 0.0),
+    ("Mistype", "float64"): CostModel(0.0, 4.11e-08, 3.14e-07, 2.04e04, 38.7, 26.3),
+    ("Mistype", "int64"): CostModel(0.000511, 3.64e-08, 9.09e-08, 2.09e04, 37.1, 52.5),
+    ("Mojibake", "category"): CostModel(0.00135, 5.83e-09, 2.7e-08, 1.36e04, 8.99, 54.7),
+    ("Mojibake", "object"): CostModel(0.0, 4.34e-08, 1.95e-06, 4.48e03, 8.01, 155),
+    ("Outlier", "datetime64"): CostModel(0.0145, 3.14e-07, 3.91e-07, 1.5e04, 63, 0.0),
+    ("Outlier", "float64"): CostModel(0.00247, 5.44e-08, 9.21e-09, 2.69e04, 12.6, 36.3),
+    ("Outlier", "int64"): CostModel(0.00296, 4.94e-08, 3.61e-08, 5.32e04, 12.6, 37.4),
+    ("Permutate", "object"): CostModel(0.0138, 2.53e-07, 5.26e-06, 0.0, 16.5, 131),
+    ("Replace", "category"): CostModel(0.00125, 6.75e-09, 2.36e-08, 5.39e03, 8.99, 54.7),
+    ("Replace", "object"): CostModel(0.00107, 2.92e-08, 7.37e-07, 0.0, 8.01, 153),
+    ("SoftENAR", "category"): CostModel(0.000886, 1.04e-07, 1.21e-07, 1e04, 51, 0.0),
+    ("SoftENAR", "datetime64"): CostModel(0.0, 8.41e-08, 1.83e-07, 9.99e03, 51, 0.0),
+    ("SoftENAR", "float64"): CostModel(0.0, 4.8e-08, 5.81e-07, 9.99e03, 51, 0.0),
+    ("SoftENAR", "int64"): CostModel(0.0, 8.73e-08, 9.35e-08, 9.99e03, 51, 0.0),
+    ("SoftENAR", "object"): CostModel(0.0, 1.89e-06, 2.42e-06, 0.0, 85.1, 0.0),
+    ("Typo", "category"): CostModel(0.0261, 8.16e-08, 1.05e-05, 0.0, 8.78, 165),
+    ("Typo", "object"): CostModel(0.0, 0.0, 9.68e-06, 0.0, 8.01, 131),
+    ("WrongUnit", "float64"): CostModel(0.000357, 1.54e-08, 2.64e-07, 6.29e03, 8, 106),
+    ("WrongUnit", "int64"): CostModel(0.000841, 6.39e-09, 1.5e-08, 0.0, 7.37, 58.7),
+}
+
+
+@dataclasses.dataclass(frozen=True)
+class StepEstimate:
+    """The estimated cost of one error model.
+
+    Attributes:
+        column (str | int): The name of the column.
+        error_mechanism (str): The class name of the ErrorMechanism.
+        error_type (str): The class name of the ErrorType.
+        error_rate (float): The error rate of the error model.
+        n_changed (int): The number of cells the error model changes.
+        input_dtype (Any): The dtype of the column before the error model is applied.
+        output_dtype (Any): The expected dtype of the column after the error model was applied.
+        time (float): The estimated wall time of sampling and applying the error model in seconds on the machine of the cost models.
+        peak_memory (int): The estimated peak memory that sampling or applying the error model allocates in bytes.
+    """
+
+    column: str | int
+    error_mechanism: str
+    error_type: str
+    error_rate: float
+    n_changed: int
+    input_dtype: Any
+    output_dtype: Any
+    time: float
+    peak_memory: int
+
+
+@dataclasses.dataclass(frozen=True)
+class Estimate:
+    """The estimated cost of inserting errors into a DataFrame, returned by `estimate` and `estimate_high_level`.
+
+    Attributes:
+        n_rows (int): The number of rows of the DataFrame.
+        input_bytes (int): The estimated memory of the DataFrame in bytes.
+        steps (tuple[StepEstimate, ...]): The estimated cost of each error model, in the order in which they are applied.
+        output_dtypes (pd.Series): The expected dtypes of the columns after all error models were applied.
+        time (float): The estimated wall time of all error models in seconds on the machine of the cost models. Since the machine that
+            runs the job is likely another one, it is mostly meaningful relative to other estimates.
+        peak_memory (int): The estimated peak memory that the call allocates in addition to the DataFrame in bytes, i.e., the copy of
+            the DataFrame with errors, the error mask, the growth of columns whose dtype changes, and the largest error model.
+    """
+
+    n_rows: int
+    input_bytes: int
+    steps: tuple[StepEstimate, ...]
+    output_dtypes: pd.Series
+    time: float
+    peak_memory: int
+
+    def to_frame(self: Estimate) -> pd.DataFrame:
+        """Returns the estimates of the error models as a DataFrame with one row per error model."""
+        return pd.DataFrame([dataclasses.asdict(step) for step in self.steps], columns=[field.name for field in dataclasses.fields(StepEstimate)])
+
+
+def estimate(
+    schema: pd.Series | pd.DataFrame,
+    n_rows: int,
+    config: MidLevelConfig | dict,
+    cost_models: Mapping[tuple[str, str], CostModel] | None = None,
+    bytes_per_object: int = 64,
+) -> Estimate:
+    """Estimates the cells, dtype changes, wall time, and peak memory of `mid_level.create_errors` without data, e.g., before a large job.
+
+    The configuration is compiled for the schema, so that it is validated as it would be by the job. The number of cells of each error
+    model is exact, the dtype changes are those of the common case, see `ErrorType.get_output_dtype`, and the time and memory follow
+    the cost model of the class of the error mechanism or error type and the dtype of its column. Classes without cost model get the
+    most expensive cost model of their dtype.
+
+    Args:
+        schema (pd.Series | pd.DataFrame): The dtypes of the columns, as returned by `DataFrame.dtypes`, or a DataFrame whose dtypes are used.
+        n_rows (int): The number of rows of the DataFrame.
+        config (MidLevelConfig | dict): The configuration for the error generation process.
+        cost_models (Mapping[tuple[str, str], CostModel] | None, optional): Cost models by class name and dtype, e.g., fitted to the
+            benchmarks of the machine that runs the job by `fit_cost_models`. Defaults to None, i.e., `DEFAULT_COST_MODELS`.
+        bytes_per_object (int, optional): The estimated memory of each value of object and string columns in bytes. Defaults to 64.
+
+    Raises:
+        ValueError: If `n_rows` is smaller than 1.
+        TypeError: If `config` has incorrect type or an error type cannot be applied to its column.
+        KeyError: If a column of `config` does not exist in the schema.
+
+    Returns:
+        Estimate: The estimated cost of the error models and the whole call.
+    """
+    if n_rows < 1:
+        msg = f"'n_rows' is: {n_rows} and should be a positive integer."
+        raise ValueError(msg)
+
+    plan = _to_mid_level_config(config).compile(schema)
+    cost_models = DEFAULT_COST_MODELS if cost_models is None else cost_models
+
+    input_bytes = sum(_get_column_bytes(dtype, n_rows, bytes_per_object) for dtype in plan.schema)
+    # Copying the data copies the references of objects but not the objects
+    column_bytes = {column: _get_column_bytes(dtype, n_rows, np.dtype(object).itemsize) for column, dtype in plan.schema.items()}
+    allocated = sum(column_bytes.values()) + n_rows * len(plan.schema)  # the copy of the data and the error mask
+    peak_memory = allocated
+    sort_orders: set[tuple[int, Any]] = set()
+    steps = []
+
+    for step in plan.steps:
+        error_model = step.error_model
+        dtype = _get_benchmark_dtype(step.input_dtype)
+        n_changed = int(n_rows * error_model.error_rate)
+        mechanism_cost = _get_cost_model(cost_models, error_model.error_mechanism, _get_mechanism_dtype(plan.schema, error_model.error_mechanism, dtype))
+        type_cost = _get_cost_model(cost_models, error_model.error_type, dtype)
+
+        step_memory = int(max(mechanism_cost.memory(n_rows, n_changed), type_cost.memory(n_rows, n_changed)))
+        peak_memory = max(peak_memory, allocated + step_memory)
+
+        sort_order = _get_sort_order_key(error_model.error_mechanism, step.column)
+        if sort_order is not None and sort_order not in sort_orders:  # the error mechanism keeps the sort order until it is deleted
+            sort_orders.add(sort_order)
+            allocated += n_rows * np.dtype(np.intp).itemsize
+
+        output_dtype = error_model.error_type.get_output_dtype(step.input_dtype)
+        output_bytes = _get_column_bytes(output_dtype, n_rows, bytes_per_object)
+        if output_dtype != step.input_dtype:  # the values are converted, so that new objects are created
+            allocated += output_bytes - column_bytes[step.column]
+            column_bytes[step.column] = output_bytes
+        elif _stores_objects(output_dtype):  # new objects of the changed cells
+            allocated += n_changed * bytes_per_object
+
+        steps.append(
+            StepEstimate(
+                column=step.column,
+                error_mechanism=type(error_model.error_mechanism).__name__,
+                error_type=type(error_model.error_type).__name__,
+                error_rate=error_model.error_rate,
+                n_changed=n_changed,
+                input_dtype=step.input_dtype,
+                output_dtype=output_dtype,
+                time=mechanism_cost.time(n_rows, n_changed) + type_cost.time(n_rows, n_changed),
+                peak_memory=step_memory,
+            )
+        )
+
+    return Estimate(
+        n_rows=n_rows,
+        input_bytes=input_bytes,
+        steps=tuple(steps),
+        output_dtypes=plan.output_dtypes,
+        time=sum(step.time for step in steps),
+        peak_memory=max(peak_memory, allocated),
+    )
+
+
+def estimate_high_level(  # noqa: PLR0913
+    schema: pd.Series | pd.DataFrame,
+    n_rows: int,
+    error_rate: float,
+    n_error_models_per_column: int = 1,
+    error_types_to_include: list[ErrorType] | None = None,
+    error_types_to_exclude: list[ErrorType] | None = None,
+    error_mechanisms_to_include: list[ErrorMechanism] | None = None,
+    error_mechanisms_to_exclude: list[ErrorMechanism] | None = None,
+    seed: int | None = None,
+    cost_models: Mapping[tuple[str, str], CostModel] | None = None,
+    bytes_per_object: int = 64,
+) -> Estimate:
+    """Estimates the cost of `high_level.create_errors` without data. See `estimate`.
+
+    The error models are drawn from the dtypes of the schema as `high_level.create_errors` draws them, so with a seed, the estimate is of
+    the error models that `high_level.create_errors` applies with that seed. Without seed, it is of one random draw.
+    See `high_level.create_errors` for a description of the other arguments.
+
+    Returns:
+        Estimate: The estimated cost of the drawn error models and the whole call.
+    """
+    check_error_rate(error_rate)
+    dtypes = schema.dtypes if isinstance(schema, pd.DataFrame) else schema
+    empty_data = pd.DataFrame({column: pd.Series(dtype=dtype) for column, dtype in dtypes.items()})
+
+    config = _build_config(
+        data=empty_data,
+        error_rate=error_rate,
+        n_error_models_per_column=n_error_models_per_column,
+        error_types_to_include=error_types_to_include,
+        error_types_to_exclude=error_types_to_exclude,
+        error_mechanisms_to_include=error_mechanisms_to_include,
+        error_mechanisms_to_exclude=error_mechanisms_to_exclude,
+        random_generator=np.random.default_rng(seed),
+        n_rows=n_rows,
+    )
+    return estimate(dtypes, n_rows, config, cost_models, bytes_per_object)
+
+
+def fit_cost_models(report: dict[str, Any]) -> dict[tuple[str, str], CostModel]:
+    """Fits a CostModel for each ErrorType and ErrorMechanism and dtype to the measurements of a micro benchmark report.
+
+    The minimum wall time and the traced peak memory of the cases are regressed on their numbers of rows and of selected cells with
+    non-negative coefficients. The fit is dominated by the largest cases, so that costs that grow faster than linearly, such as sorting
+    strings, are overestimated for small jobs rather than underestimated for large ones.
+    Pass the result as `cost_models` to `estimate` to estimate the cost of jobs on the machine that ran the benchmarks.
+
+    Args:
+        report (dict[str, Any]): A report of the micro benchmarks, e.g., written by `python -m tab_err.bench micro --output micro.json` in a
+            source checkout and read with `json.load`.
+
+    Raises:
+        ValueError: If 'report' is not a report of the micro benchmarks.
+
+    Returns:
+        dict[tuple[str, str], CostModel]: The cost models by the class name of the ErrorType or ErrorMechanism and the benchmarked dtype.
+    """
+    if report["kind"] != "micro":
+        msg = f"Cost models are fitted to a 'micro' report but the report is a '{report['kind']}' report."
+        raise ValueError(msg)
+
+    cases: dict[tuple[str, str], list[tuple[int, int, float, int | None]]] = defaultdict(list)
+    for result in report["results"]:
+        if result["error"] is None and result["times"]:
+            name = result["benchmark"].split("/", 1)[1]
+            n_cells = int(result["n_rows"] * result["error_rate"])
+            cases[(name, result["dtype"])].append((result["n_rows"], n_cells, min(result["times"]), result.get("tracemalloc_peak")))
+
+    cost_models = {}
+    for key, measurements in cases.items():
+        features = np.array([[1.0, n_rows, n_cells] for n_rows, n_cells, _, _ in measurements])
+        seconds = _fit_non_negative(features, np.array([wall_time for _, _, wall_time, _ in measurements]))
+        peaks = [peak for _, _, _, peak in measurements]
+        memory = _fit_non_negative(features, np.array(peaks, dtype=float)) if None not in peaks else np.zeros(3)
+        cost_models[key] = CostModel(*(float(coefficient) for coefficient in (*seconds, *memory)))
+
+    return cost_models
+
+
+def _get_benchmark_dtype(dtype: Any) -> str:  # noqa: ANN401
+    """Returns the dtype of the micro benchmarks whose cost models apply to columns of 'dtype'."""
+    if isinstance(dtype, pd.CategoricalDtype):
+        return "category"
+
+    if pd.api.types.is_datetime64_any_dtype(dtype):
+        return "datetime64"
+
+    if pd.api.types.is_float_dtype(dtype):
+        return "float64"
+
+    if pd.api.types.is_bool_dtype(dtype) or pd.api.types.is_numeric_dtype(dtype):
+        return "int64"
+
+    return "object"
+
+
+def _get_mechanism_dtype(schema: pd.Series, error_mechanism: ErrorMechanism, dtype: str) -> str:
+    """Returns the benchmark dtype of the first conditioning column of 'error_mechanism', which it sorts, or 'dtype' if it has none."""
+    condition_to_column = error_mechanism.condition_to_column
+    if condition_to_column is None:
+        return dtype
+
+    condition = condition_to_column[0] if isinstance(condition_to_column, list) else condition_to_column
+    return _get_benchmark_dtype(schema.iloc[condition] if isinstance(condition, int) else schema[condition])
+
+
+def _get_sort_order_key(error_mechanism: ErrorMechanism, column: str | int) -> tuple[int, Any] | None:
+    """Returns the identity of the sort order that 'error_mechanism' caches to sample 'column', or None if it does not cache one."""
+    if type(error_mechanism)._get_block_columns is ErrorMechanism._get_block_columns or error_mechanism.approximate:  # noqa: SLF001
+        return None
+
+    if error_mechanism._sort_order_cache is None:  # noqa: SLF001
+        return None  # the sort order is freed after sampling, which the cost model of the error mechanism includes
+
+    condition_to_column = error_mechanism.condition_to_column
+    columns = column if condition_to_column is None else tuple(condition_to_column) if isinstance(condition_to_column, list) else condition_to_column
+    return id(error_mechanism._sort_order_cache), columns  # noqa: SLF001
+
+
+def _get_cost_model(cost_models: Mapping[tuple[str, str], CostModel], component: ErrorMechanism | ErrorType, dtype: str) -> CostModel:
+    """Returns the cost model of the class of 'component' and 'dtype', or the most expensive one of 'dtype' if the class has none."""
+    name = type(component).__name__
+    if (name, dtype) in cost_models:
+        return cost_models[name, dtype]
+
+    candidates = [cost_model for (_, model_dtype), cost_model in cost_models.items() if model_dtype == dtype] or list(cost_models.values())
+    if not candidates:
+        return CostModel(0.0, 0.0, 0.0, 0.0, 0.0, 0.0)
+
+    return CostModel(*(max(getattr(candidate, field.name) for candidate in candidates) for field in dataclasses.fields(CostModel)))
+
+
+def _stores_objects(dtype: Any) -> bool:  # noqa: ANN401
+    """Returns whether columns of 'dtype' store their values as objects or strings, whose size is not given by the dtype."""
+    if isinstance(dtype, pd.CategoricalDtype):
+        return False
+
+    if isinstance(dtype, np.dtype):
+        return dtype.kind == "O"
+
+    return not ((pd.api.types.is_numeric_dtype(dtype) or pd.api.types.is_bool_dtype(dtype)) and hasattr(dtype, "itemsize"))
+
+
+def _get_column_bytes(dtype: Any, n_rows: int, bytes_per_object: int) -> int:  # noqa: ANN401
+    """Returns the estimated memory of a column of 'dtype' in bytes. Values of extension dtypes with a validity mask take one more byte."""
+    if _stores_objects(dtype):
+        return n_rows * bytes_per_object
+
+    if isinstance(dtype, pd.CategoricalDtype):
+        return n_rows * np.min_scalar_type(-len(dtype.categories)).itemsize
+
+    return n_rows * (dtype.itemsize + (not isinstance(dtype, np.dtype)))
+
+
+def _fit_non_negative(features: np.ndarray, targets: np.ndarray) -> np.ndarray:
+    """Fits the coefficients of a linear model by least squares, dropping features whose coefficients are negative and refitting."""
+    active = np.ones(features.shape[1], dtype=bool)
+    while True:
+        coefficients = np.zeros(features.shape[1])
+        if active.any():
+            coefficients[active] = np.linalg.lstsq(features[:, active], targets, rcond=None)[0]
+
+        if (coefficients >= 0).all():
+            return coefficients
+
+        active &= coefficients > 0
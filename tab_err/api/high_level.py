@@ -1,18 +1,49 @@
 from __future__ import annotations
 
+import copy
+import dataclasses
 import warnings
-from typing import TYPE_CHECKING
-
-import pandas as pd
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import TYPE_CHECKING, Any
 
 from tab_err import ErrorMechanism, ErrorType, error_mechanism, error_type
 from tab_err._error_model import ErrorModel
-from tab_err._utils import check_data_emptiness, check_error_rate, seed_randomness_and_get_generator
+from tab_err._observer import observe_stage
+from tab_err._polars import accepts_polars
+from tab_err._utils import SortOrderCache, check_data_emptiness, check_error_rate, seed_randomness_and_get_generator
 from tab_err.api import MidLevelConfig, mid_level
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+    import pandas as pd
     from numpy.random import Generator
 
+    from tab_err._observer import Observer
+    from tab_err.api.cache import ResultCache
+
+
+@dataclasses.dataclass
+class _DataProfile:
+    """Seed-independent properties of a DataFrame that are shared by all error variants created from it.
+
+    Attributes:
+        valid_columns (dict[tuple[type[ErrorType], str], list[str | int]]): Valid columns per error type class and configuration.
+        sort_order_cache (SortOrderCache): Sort orders of the columns, shared by the error mechanisms of all variants.
+    """
+
+    valid_columns: dict[tuple[type[ErrorType], str], list[str | int]] = dataclasses.field(default_factory=dict)
+    sort_order_cache: SortOrderCache = dataclasses.field(default_factory=SortOrderCache)
+
+    def get_valid_columns(self: _DataProfile, data: pd.DataFrame, error_type_: ErrorType) -> list[str | int]:
+        """Returns the valid columns of `data` for `error_type_`, computing them only once per error type class and configuration."""
+        key = (type(error_type_), repr(error_type_.config))
+        if key not in self.valid_columns:
+            self.valid_columns[key] = error_type_.get_valid_columns(data)
+
+        return self.valid_columns[key]
+
 
 def _are_same_class(obj1: object, obj2: object) -> bool:
     """Checks if two objects are of the same class.
@@ -43,6 +74,7 @@ def _build_column_type_dictionary(
     random_generator: Generator,
     error_types_to_include: list[ErrorType] | None = None,
     error_types_to_exclude: list[ErrorType] | None = None,
+    profile: _DataProfile | None = None,
 ) -> dict[int | str, list[ErrorType]]:
     """Creates a dictionary mapping from column names to the list of valid error types to apply to that column.
 
@@ -53,6 +85,7 @@ def _build_column_type_dictionary(
         error_types_to_exclude (list[ErrorType] | None, optional): A list of the error types to be excluded when building error models. Defaults to None.
             When both error_types_to_include and error_types_to_exclude are none, the maximum number of default error types will be used.
             At least one must be None or an error will occur.
+        profile (_DataProfile | None, optional): Precomputed properties of `data` that are reused to find the valid columns. Defaults to None.
 
     Raises:
         ValueError: If error_types_to_exclude is not None and error_types_to_include is not None, a ValueError is thrown.
@@ -95,9 +128,12 @@ def _build_column_type_dictionary(
         msg = "The list of error types to be applied cannot have length 0. Use the default or resturcture your input."
         raise ValueError(msg)
 
-    return {
-        column: [valid_error_type for valid_error_type in error_types_applied if column in valid_error_type.get_valid_columns(data)] for column in data.columns
-    }
+    if profile is None:
+        profile = _DataProfile()
+
+    valid_columns = [set(profile.get_valid_columns(data, applied_error_type)) for applied_error_type in error_types_applied]
+
+    return {column: [valid_error_type for valid_error_type, columns in zip(error_types_applied, valid_columns) if column in columns] for column in data.columns}
 
 
 def _build_column_mechanism_dictionary(
@@ -188,6 +224,90 @@ def _build_column_number_of_models_dictionary(
     return column_num_models
 
 
+def _build_config(  # noqa: PLR0913
+    *,
+    data: pd.DataFrame,
+    error_rate: float,
+    n_error_models_per_column: int,
+    error_types_to_include: list[ErrorType] | None,
+    error_types_to_exclude: list[ErrorType] | None,
+    error_mechanisms_to_include: list[ErrorMechanism] | None,
+    error_mechanisms_to_exclude: list[ErrorMechanism] | None,
+    random_generator: Generator,
+    profile: _DataProfile | None = None,
+    n_rows: int | None = None,
+) -> MidLevelConfig:
+    """Randomly draws the error models that the high-level API applies to each column and returns them as a MidLevelConfig.
+
+    See `create_errors` for a description of the arguments.
+    `profile` holds precomputed properties of `data` that are reused across calls. If given, the error mechanisms of the
+    returned config share its sort orders. Defaults to None.
+    `n_rows` is the number of rows the config is drawn for, if `data` only holds the schema, e.g., to estimate the cost of a call.
+    Defaults to None, i.e., the number of rows of `data`.
+
+    Returns:
+        MidLevelConfig: The configuration that is passed to the mid-level API.
+    """
+    # Build Dictionaries
+    col_type = _build_column_type_dictionary(
+        data=data,
+        random_generator=random_generator,
+        error_types_to_include=error_types_to_include,
+        error_types_to_exclude=error_types_to_exclude,
+        profile=profile,
+    )
+    col_mechanisms = _build_column_mechanism_dictionary(
+        data=data,
+        random_generator=random_generator,
+        error_mechanisms_to_include=error_mechanisms_to_include,
+        error_mechanisms_to_exclude=error_mechanisms_to_exclude,
+    )
+    col_num_models = _build_column_number_of_models_dictionary(data=data, column_types=col_type, column_mechanisms=col_mechanisms)
+
+    if n_error_models_per_column > 0:
+        error_rate = error_rate / n_error_models_per_column
+        config_dictionary: dict[str | int, list[ErrorModel]] = {
+            column: [] for column in data.columns if col_num_models[column] > 0
+        }  # Filter out those columns with no valid error models
+
+        n_rows = len(data) if n_rows is None else n_rows
+        if error_rate * n_rows < 1:  # This value is calculated and rounded to 0 in the sample function of the error mechanism subclasses "n_errors"
+            msg = f"With a per-model error rate of: {error_rate} and {n_rows} rows, 0 errors will be introduced."
+            warnings.warn(msg, stacklevel=3)
+
+        for column, error_model_list in config_dictionary.items():
+            for _ in range(n_error_models_per_column):
+                error_model_list.append(
+                    ErrorModel(
+                        # NOTE: in python 3.9 mypy fails here but tests work
+                        error_type=random_generator.choice(col_type[column]),  # type: ignore[arg-type]
+                        error_mechanism=random_generator.choice(col_mechanisms[column]),  # type: ignore[arg-type]
+                        error_rate=error_rate,
+                    )
+                )
+    else:  # n_error_models_per_column is 0 or less.
+        msg = f"n_error_models_per_column is: {n_error_models_per_column} and should be a positive integer"
+        raise ValueError(msg)
+
+    if profile is not None:  # Copies of the error mechanisms share the sort orders, so that those of 'error_mechanisms_to_include' keep no cache
+        for error_model_list in config_dictionary.values():
+            for position, error_model in enumerate(error_model_list):
+                mechanism = copy.copy(error_model.error_mechanism)
+                mechanism._sort_order_cache = profile.sort_order_cache  # noqa: SLF001
+                error_model_list[position] = dataclasses.replace(error_model, error_mechanism=mechanism)
+
+    return MidLevelConfig(config_dictionary)
+
+
+def _describe_excluded(components: list[ErrorType] | list[ErrorMechanism] | None) -> list[tuple[str, Any]] | None:
+    """Returns the classes and conditioning columns of excluded error types or error mechanisms, which are all that the exclusion compares."""
+    if components is None:
+        return None
+
+    return [(type(component).__qualname__, getattr(component, "condition_to_column", None)) for component in components]
+
+
+@accepts_polars
 def create_errors(  # noqa: PLR0913
     data: pd.DataFrame,
     error_rate: float,
@@ -197,11 +317,13 @@ def create_errors(  # noqa: PLR0913
     error_mechanisms_to_include: list[ErrorMechanism] | None = None,
     error_mechanisms_to_exclude: list[ErrorMechanism] | None = None,
     seed: int | None = None,
+    observer: Observer | None = None,
+    cache: ResultCache | None = None,
 ) -> tuple[pd.DataFrame, pd.DataFrame]:
     """Creates errors in a given DataFrame, at a rate of *approximately* max_error_rate.
 
     Args:
-        data (pd.DataFrame): The pandas DataFrame to create errors in.
+        data (pd.DataFrame): The pandas DataFrame to create errors in. A polars.DataFrame is converted to pandas and the results back to polars.
         error_rate (float): The maximum error rate to be introduced to each column in the DataFrame.
         n_error_models_per_column (int, optional): The number of valid error models to apply to each column. Defaults to 1.
         error_types_to_include (list[ErrorType] | None, optional): A list of the error types to be included when building error models. Defaults to None.
@@ -213,6 +335,10 @@ def create_errors(  # noqa: PLR0913
         error_mechanisms_to_exclude (list[ErrorMechanism] | None = None): A list of the error mechanisms to be excluded when building error models.
             Defaults to None.
         seed (int | None, optional): Random seed. Defaults to None.
+        observer (Observer | None, optional): Receives StageEvents of the whole call, of drawing the error models, and of the mid-level API
+            with each error mechanism and error type, e.g., a StageCollector. Defaults to None.
+        cache (ResultCache | None, optional): Returns the cached result of an equal call and caches the result otherwise, if 'seed' and
+            all included error mechanisms and error types have seeds. Defaults to None.
 
     Returns:
         tuple[pd.DataFrame, pd.DataFrame]:
@@ -224,47 +350,143 @@ def create_errors(  # noqa: PLR0913
     check_error_rate(error_rate)
     check_data_emptiness(data)
 
-    # Set Up Data
-    data_copy = data.copy()
-    error_mask = pd.DataFrame(data=False, index=data.index, columns=data.columns)
+    key = None
+    if cache is not None and seed is not None:
+        key = cache.key(
+            data,
+            "high_level.create_errors",
+            error_rate,
+            n_error_models_per_column,
+            error_types_to_include,
+            _describe_excluded(error_types_to_exclude),
+            error_mechanisms_to_include,
+            _describe_excluded(error_mechanisms_to_exclude),
+            seed,
+        )
+    if cache is not None and key is not None and (cached := cache.load(key)) is not None:
+        return cached
+
+    with observe_stage(observer, "high_level.create_errors", None, None, n_cells=data.size) as stage:
+        with observe_stage(observer, "high_level.build_config", None, None, n_cells=data.size):
+            config = _build_config(
+                data=data,
+                error_rate=error_rate,
+                n_error_models_per_column=n_error_models_per_column,
+                error_types_to_include=error_types_to_include,
+                error_types_to_exclude=error_types_to_exclude,
+                error_mechanisms_to_include=error_mechanisms_to_include,
+                error_mechanisms_to_exclude=error_mechanisms_to_exclude,
+                random_generator=random_generator,
+            )
+
+        # Create Errors & Return -- the mid-level API copies 'data' before inserting errors
+        dirty_data, error_mask = mid_level.create_errors(data, config, observer=observer)
+
+        if stage is not None:
+            stage.n_changed = int(error_mask.to_numpy().sum())
+
+    if cache is not None and key is not None:
+        cache.store(key, dirty_data, error_mask)
 
-    # Build Dictionaries
-    col_type = _build_column_type_dictionary(
-        data=data, random_generator=random_generator, error_types_to_include=error_types_to_include, error_types_to_exclude=error_types_to_exclude
-    )
-    col_mechanisms = _build_column_mechanism_dictionary(
-        data=data,
-        random_generator=random_generator,
-        error_mechanisms_to_include=error_mechanisms_to_include,
-        error_mechanisms_to_exclude=error_mechanisms_to_exclude,
-    )
-    col_num_models = _build_column_number_of_models_dictionary(data=data, column_types=col_type, column_mechanisms=col_mechanisms)
+    return dirty_data, error_mask
 
-    if n_error_models_per_column > 0:
-        error_rate = error_rate / n_error_models_per_column
-        config_dictionary: dict[str | int, list[ErrorModel]] = {
-            column: [] for column in data.columns if col_num_models[column] > 0
-        }  # Filter out those columns with no valid error models
 
-        if error_rate * len(data) < 1:  # This value is calculated and rounded to 0 in the sample function of the error mechanism subclasses "n_errors"
-            msg = f"With a per-model error rate of: {error_rate} and {len(data)} rows, 0 errors will be introduced."
-            warnings.warn(msg, stacklevel=2)
+def _create_variant(data: pd.DataFrame, seed: int | None, profile: _DataProfile, kwargs: dict[str, Any]) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Creates one error variant of `data`, reusing the precomputed `profile`."""
+    random_generator = seed_randomness_and_get_generator(seed=seed)
+    config = _build_config(data=data, random_generator=random_generator, profile=profile, **kwargs)
+    return mid_level.create_errors(data, config)
 
-        for column, error_model_list in config_dictionary.items():
-            for _ in range(n_error_models_per_column):
-                error_model_list.append(
-                    ErrorModel(
-                        # NOTE: in python 3.9 mypy fails here but tests work
-                        error_type=random_generator.choice(col_type[column]),  # type: ignore[arg-type]
-                        error_mechanism=random_generator.choice(col_mechanisms[column]),  # type: ignore[arg-type]
-                        error_rate=error_rate,
-                    )
-                )
-        config = MidLevelConfig(config_dictionary)
-    else:  # n_error_models_per_column is 0 or less.
-        msg = f"n_error_models_per_column is: {n_error_models_per_column} and should be a positive integer"
+
+# State of a worker process of `create_errors_many`, set once per process by `_init_worker` to avoid pickling 'data' for every variant.
+_worker_state: dict[str, Any] = {}
+
+
+def _init_worker(data: pd.DataFrame, kwargs: dict[str, Any]) -> None:
+    _worker_state.update(data=data, kwargs=kwargs, profile=_DataProfile())
+
+
+def _create_variant_in_worker(seed: int | None) -> tuple[pd.DataFrame, pd.DataFrame]:
+    return _create_variant(_worker_state["data"], seed, _worker_state["profile"], _worker_state["kwargs"])
+
+
+def create_errors_many(  # noqa: PLR0913
+    data: pd.DataFrame,
+    error_rate: float,
+    seeds: Iterable[int | None],
+    n_error_models_per_column: int = 1,
+    error_types_to_include: list[ErrorType] | None = None,
+    error_types_to_exclude: list[ErrorType] | None = None,
+    error_mechanisms_to_include: list[ErrorMechanism] | None = None,
+    error_mechanisms_to_exclude: list[ErrorMechanism] | None = None,
+    n_jobs: int = 1,
+) -> Iterator[tuple[pd.DataFrame, pd.DataFrame]]:
+    """Lazily creates one error variant of a given DataFrame per seed.
+
+    The variant for a seed is identical to the result of `create_errors(data, ..., seed=seed)`. Properties of `data` that
+    do not depend on the seed, i.e., the valid columns of each error type and the sort orders used by the error mechanisms,
+    are computed only once and shared by all variants. Therefore, `data` must not be modified in-place while the variants are iterated.
+
+    Args:
+        data (pd.DataFrame): The pandas DataFrame to create errors in.
+        error_rate (float): The maximum error rate to be introduced to each column in the DataFrame.
+        seeds (Iterable[int | None]): One random seed per variant.
+        n_error_models_per_column (int, optional): The number of valid error models to apply to each column. Defaults to 1.
+        error_types_to_include (list[ErrorType] | None, optional): A list of the error types to be included when building error models. Defaults to None.
+        error_types_to_exclude (list[ErrorType] | None, optional): A list of the error types to be excluded when building error models. Defaults to None.
+        error_mechanisms_to_include (list[ErrorMechanism] | None = None): A list of the error mechanisms to be included when building error models.
+            Defaults to None.
+        error_mechanisms_to_exclude (list[ErrorMechanism] | None = None): A list of the error mechanisms to be excluded when building error models.
+            Defaults to None.
+        n_jobs (int, optional): Number of worker processes that create variants in parallel. `data` is sent once to each worker, variants are
+            yielded in the order of `seeds`, and at most 2 * `n_jobs` variants are in flight at any time. Defaults to 1, i.e., no parallelism.
+
+    Raises:
+        ValueError: If `error_rate` is out of the [0,1] interval, `data` is empty, or `n_jobs` is smaller than 1, a ValueError is raised
+            when `create_errors_many` is called, before the first variant is requested.
+
+    Returns:
+        Iterator[tuple[pd.DataFrame, pd.DataFrame]]: An iterator that creates the variants when they are requested, in the order of `seeds`:
+            - The first element is a copy of 'data' with errors.
+            - The second element is the associated error mask.
+    """
+    check_error_rate(error_rate)
+    check_data_emptiness(data)
+
+    if n_jobs < 1:
+        msg = f"n_jobs is: {n_jobs} and should be a positive integer."
         raise ValueError(msg)
 
-    # Create Errors & Return
-    dirty_data, error_mask = mid_level.create_errors(data_copy, config)
-    return dirty_data, error_mask
+    kwargs = {
+        "error_rate": error_rate,
+        "n_error_models_per_column": n_error_models_per_column,
+        "error_types_to_include": error_types_to_include,
+        "error_types_to_exclude": error_types_to_exclude,
+        "error_mechanisms_to_include": error_mechanisms_to_include,
+        "error_mechanisms_to_exclude": error_mechanisms_to_exclude,
+    }
+    return _iterate_variants(data, seeds, kwargs, n_jobs)
+
+
+def _iterate_variants(data: pd.DataFrame, seeds: Iterable[int | None], kwargs: dict[str, Any], n_jobs: int) -> Iterator[tuple[pd.DataFrame, pd.DataFrame]]:
+    """Yields the variants of `create_errors_many`, whose arguments it checked, in `n_jobs` processes if it is larger than 1."""
+    if n_jobs == 1:
+        profile = _DataProfile()
+        for seed in seeds:
+            yield _create_variant(data, seed, profile, kwargs)
+        return
+
+    seed_iterator = iter(seeds)
+    executor = ProcessPoolExecutor(max_workers=n_jobs, initializer=_init_worker, initargs=(data, kwargs))
+    try:
+        pending: deque[Future[tuple[pd.DataFrame, pd.DataFrame]]] = deque(
+            executor.submit(_create_variant_in_worker, seed) for _, seed in zip(range(2 * n_jobs), seed_iterator)
+        )
+        while pending:
+            variant = pending.popleft().result()
+            for seed in seed_iterator:  # keep the pool busy while the consumer handles the variant
+                pending.append(executor.submit(_create_variant_in_worker, seed))
+                break
+            yield variant
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
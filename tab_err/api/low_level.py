@@ -2,25 +2,52 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from tab_err._utils import check_data_emptiness, check_error_rate, set_column
+import pandas as pd
+
+from tab_err._observer import observe_stage
+from tab_err._polars import accepts_polars_columns
+from tab_err._utils import (
+    check_data_emptiness,
+    check_error_rate,
+    check_error_rates_ascending,
+    get_column,
+    get_column_str,
+    insert_errors_at_positions,
+    seed_randomness_and_get_generator,
+    set_column,
+)
 
 if TYPE_CHECKING:
-    import pandas as pd
+    from collections.abc import Iterator, Sequence
 
     from tab_err import ErrorMechanism, ErrorType
+    from tab_err._observer import Observer
+    from tab_err.api.cache import ResultCache
 
 
-def create_errors(
-    data: pd.DataFrame, column: str | int, error_rate: float, error_mechanism: ErrorMechanism, error_type: ErrorType
+@accepts_polars_columns
+def create_errors(  # noqa: PLR0913
+    data: pd.DataFrame,
+    column: str | int,
+    error_rate: float,
+    error_mechanism: ErrorMechanism,
+    error_type: ErrorType,
+    observer: Observer | None = None,
+    cache: ResultCache | None = None,
 ) -> tuple[pd.DataFrame, pd.DataFrame]:
     """Creates errors in a given column of a pandas DataFrame.
 
     Args:
-        data (pd.DataFrame): The pandas DataFrame to create errors in.
+        data (pd.DataFrame): The pandas DataFrame to create errors in. Of a polars.DataFrame, only the columns that errors are inserted into
+            or sampled by are converted to pandas and back, unless a 'cache' is given, which converts all columns.
         column (str | int): The column to create errors in.
         error_rate (float): The rate at which errors will be created.
         error_mechanism (ErrorMechanism): The mechanism, controls the error distribution.
         error_type (ErrorType): The type of the error that will be distributed.
+        observer (Observer | None, optional): Receives a StageEvent of the whole call, the sampling, and the application of the error type,
+            e.g., a StageCollector. Defaults to None.
+        cache (ResultCache | None, optional): Returns the cached result of an equal call and caches the result otherwise, if the error
+            mechanism and the error type have seeds. Defaults to None.
 
     Returns:
         tuple[pd.DataFrame, pd.DataFrame]:
@@ -29,10 +56,66 @@ def create_errors(
     """
     check_error_rate(error_rate)
     check_data_emptiness(data)
-    data_copy = data.copy()
 
-    error_mask = error_mechanism.sample(data_copy, column, error_rate, error_mask=None)
-    series = error_type.apply(data_copy, error_mask, column)
-    set_column(data_copy, column, series)
+    key = None if cache is None else cache.key(data, "low_level.create_errors", column, error_rate, error_mechanism, error_type)
+    if cache is not None and key is not None and (cached := cache.load(key)) is not None:
+        return cached
+
+    with observe_stage(observer, "low_level.create_errors", None, column, n_cells=len(data)) as stage:
+        data_copy = data.copy()
+
+        error_mask = error_mechanism.sample(data_copy, column, error_rate, error_mask=None, observer=observer)
+        series = error_type.apply(data_copy, error_mask, column, observer=observer)
+        set_column(data_copy, column, series)
+
+        if stage is not None:
+            stage.n_changed = int(get_column(error_mask, column).sum())
+
+    if cache is not None and key is not None:
+        cache.store(key, data_copy, error_mask)
 
     return data_copy, error_mask
+
+
+def create_errors_sweep(
+    data: pd.DataFrame, column: str | int, error_rates: Sequence[float], error_mechanism: ErrorMechanism, error_type: ErrorType
+) -> Iterator[tuple[pd.DataFrame, pd.DataFrame]]:
+    """Creates errors in a given column of a pandas DataFrame at several error rates in one pass.
+
+    The error mechanism draws the priority of the cells only once, at the highest error rate. The cells of each error rate are a prefix of
+    them, so the error masks are nested. The data of each error rate is derived from the data of the previous one by inserting errors only
+    into the cells that were added to the mask. The error type draws the errors of all increments from one random number generator, which
+    is seeded once by its seed.
+
+    Args:
+        data (pd.DataFrame): The pandas DataFrame to create errors in.
+        column (str | int): The column to create errors in.
+        error_rates (Sequence[float]): The rates at which errors will be created, sorted in ascending order.
+        error_mechanism (ErrorMechanism): The mechanism, controls the error distribution.
+        error_type (ErrorType): The type of the error that will be distributed.
+
+    Yields:
+        tuple[pd.DataFrame, pd.DataFrame]: One pair per error rate, in the order of 'error_rates':
+            - The first element is a copy of 'data' with errors.
+            - The second element is the associated error mask.
+    """
+    check_error_rates_ascending(error_rates)
+    check_data_emptiness(data)
+    data_copy = data.copy()
+
+    positions = error_mechanism.sample_priority(data_copy, column, error_rates[-1], error_mask=None)
+    error_mask = pd.DataFrame(data=False, index=data.index, columns=data.columns)
+    column_position = error_mask.columns.get_loc(get_column_str(data, column))
+    random_generator = seed_randomness_and_get_generator(error_type._seed)  # noqa: SLF001
+    n_previous_errors = 0
+
+    for error_rate in error_rates:
+        n_errors = int(len(data) * error_rate)
+        new_positions = positions[n_previous_errors:n_errors]
+
+        if len(new_positions) > 0:
+            insert_errors_at_positions(data_copy, column, new_positions, error_type, rng=random_generator)
+            error_mask.iloc[new_positions, column_position] = True
+
+        n_previous_errors = n_errors
+        yield data_copy.copy(), error_mask.copy()
@@ -1,14 +1,35 @@
 from __future__ import annotations
 
+import copy
 import dataclasses
 from typing import TYPE_CHECKING, Any
 
+import numpy as np
 import pandas as pd
 
-from tab_err._utils import check_data_emptiness, check_error_rate, set_column
+from tab_err import error_mechanism
+from tab_err._error_diff import ColumnDiff, ErrorDiff
+from tab_err._observer import observe_stage
+from tab_err._polars import accepts_polars, accepts_polars_columns
+from tab_err._utils import (
+    check_data_emptiness,
+    check_error_rate,
+    check_error_rates_ascending,
+    derive_seeded_copy,
+    get_column,
+    get_column_str,
+    insert_errors_at_positions,
+    seed_randomness_and_get_generator,
+)
 
 if TYPE_CHECKING:
+    from collections.abc import Hashable, Iterator, Sequence
+
+    from tab_err import ErrorType
     from tab_err._error_model import ErrorModel
+    from tab_err._observer import Observer
+    from tab_err.api.cache import ResultCache
+    from tab_err.error_mechanism import RowCorrelated
 
 
 @dataclasses.dataclass
@@ -34,13 +55,193 @@ class MidLevelConfig:
         """Deserializes the MidLevelConfig from a dict."""
         return MidLevelConfig(**data)
 
+    def compile(self: MidLevelConfig, schema: pd.Series | pd.DataFrame) -> MidLevelPlan:
+        """Validates the MidLevelConfig against a schema and compiles it into a reusable MidLevelPlan.
+
+        All checks that `create_errors` does while it runs are done up front: the error rates, the columns and conditioning columns,
+        and whether each error type supports the dtype its column has when the error type is applied, given the dtype changes of the
+        previous error models of that column. Column references are resolved to column names.
+
+        The plan holds copies of the error models, so that running it does not change the config. Parameters that would be drawn while
+        running are drawn once in these copies instead, so that all runs of the plan use the same ones: the conditioning column of an `EAR`
+        mechanism without `condition_to_column` and, if 'schema' is a DataFrame, config parameters that error types draw from the values of
+        their column, e.g., the delta of `AddDelta` and `replace_what` of `Replace`, drawn from the values of the column in 'schema'.
+        If 'schema' only has dtypes, the latter are drawn on the first run of the plan and kept for all later runs.
+
+        Args:
+            schema (pd.Series | pd.DataFrame): The dtypes of the columns, as returned by `DataFrame.dtypes`, or a DataFrame whose dtypes are used
+                and whose values the config parameters of the error types are drawn from.
+
+        Raises:
+            KeyError: If a column or conditioning column does not exist in the schema.
+            ValueError: If an error rate or the sum of the error rates of a column is not between 0 and 1, or if the schema has fewer than
+                2 columns but an error mechanism conditions on another column.
+            TypeError: If an error type does not support the dtype of its column.
+
+        Returns:
+            MidLevelPlan: The compiled plan that can be run on all DataFrames with the given schema.
+        """
+        dtypes = schema.dtypes if isinstance(schema, pd.DataFrame) else schema
+        output_dtypes = dtypes.copy()
+        steps = []
+
+        for column in self.columns:
+            if isinstance(column, int) and not 0 <= column < len(dtypes):
+                msg = f"Column position {column} is out of bounds for a schema with {len(dtypes)} columns."
+                raise KeyError(msg)
+
+            col = dtypes.index[column] if isinstance(column, int) else column
+            if col not in dtypes.index:
+                msg = f"Column '{col}' does not exist in the schema."
+                raise KeyError(msg)
+
+            error_rate_sum = 0.0
+            for config_error_model in self.columns[column]:
+                check_error_rate(config_error_model.error_rate)
+                error_rate_sum += config_error_model.error_rate
+                error_model = _resolve_error_mechanism(config_error_model, dtypes, col)
+
+                condition_to_column = error_model.error_mechanism.condition_to_column
+                if condition_to_column is not None:
+                    if len(dtypes) < 2:  # noqa: PLR2004
+                        msg = "The schema needs at least 2 columns if 'condition_to_column' is given."
+                        raise ValueError(msg)
+
+                    for condition in condition_to_column if isinstance(condition_to_column, list) else [condition_to_column]:
+                        valid_condition = 0 <= condition < len(dtypes) if isinstance(condition, int) else condition in dtypes.index
+                        if not valid_condition:
+                            msg = f"The conditioning column '{condition}' of the error mechanism of column '{col}' does not exist in the schema."
+                            raise KeyError(msg)
+
+                input_dtype = output_dtypes[col]
+                error_model.error_type.check_dtype(input_dtype, col)
+                _resolve_error_type_config(error_model.error_type, schema, col, input_dtype)
+                output_dtypes[col] = error_model.error_type.get_output_dtype(input_dtype)
+                steps.append(PlanStep(column=col, column_position=dtypes.index.get_loc(col), error_model=error_model, input_dtype=input_dtype))
+
+            if error_rate_sum > 1.0:
+                msg = f"The error rates of column '{col}' sum up to {error_rate_sum} but must not exceed 1."
+                raise ValueError(msg)
+
+        return MidLevelPlan(schema=dtypes.copy(), steps=tuple(steps), output_dtypes=output_dtypes)
+
+
+def _resolve_error_mechanism(error_model: ErrorModel, dtypes: pd.Series, column: str | int) -> ErrorModel:
+    """Returns a copy of 'error_model' whose `EAR` mechanism conditions on the column it would draw at random while running, if it is not configured."""
+    error_model = copy.deepcopy(error_model)
+    mechanism = error_model.error_mechanism
+
+    if isinstance(mechanism, error_mechanism.EAR) and mechanism.condition_to_column is None:
+        mechanism._random_generator = seed_randomness_and_get_generator(mechanism._seed)  # noqa: SLF001
+        (condition_to_column,) = mechanism._get_block_columns(pd.DataFrame(columns=dtypes.index), column)  # noqa: SLF001
+        mechanism.condition_to_column = condition_to_column  # type: ignore[assignment]
+
+    return error_model
+
+
+def _resolve_error_type_config(error_type: ErrorType, schema: pd.Series | pd.DataFrame, column: str | int, input_dtype: Any) -> None:  # noqa: ANN401
+    """Draws the config parameters of 'error_type' from the values of 'column' if 'schema' is a DataFrame and the column still has its dtype."""
+    if isinstance(schema, pd.DataFrame) and len(schema) > 0 and input_dtype == schema.dtypes[column]:
+        error_type._random_generator = seed_randomness_and_get_generator(error_type._seed)  # noqa: SLF001
+        error_type._sample_config(schema[column])  # noqa: SLF001
+
+
+@dataclasses.dataclass(frozen=True)
+class PlanStep:
+    """One error model of a MidLevelPlan.
+
+    Attributes:
+        column (str | int): The name of the column the error model is applied to.
+        column_position (int): The position of the column in the schema.
+        error_model (ErrorModel): The error model that is applied, a copy of the one of the config whose defaults were resolved.
+        input_dtype (Any): The expected dtype of the column before the error model is applied.
+    """
+
+    column: str | int
+    column_position: int
+    error_model: ErrorModel
+    input_dtype: Any
+
+
+@dataclasses.dataclass(frozen=True)
+class MidLevelPlan:
+    """A MidLevelConfig that was validated against a schema by `MidLevelConfig.compile`.
+
+    The plan can be run on many DataFrames with the same schema. Running it only checks that the schema matches and then
+    applies the error models in order, without resolving or validating the configuration again.
+
+    Attributes:
+        schema (pd.Series): The dtypes of the columns of the DataFrames the plan can be run on.
+        steps (tuple[PlanStep, ...]): The error models in the order in which they are applied.
+        output_dtypes (pd.Series): The expected dtypes of the columns after all error models were applied.
+    """
+
+    schema: pd.Series
+    steps: tuple[PlanStep, ...]
+    output_dtypes: pd.Series
+
+    def run(self: MidLevelPlan, data: pd.DataFrame, observer: Observer | None = None) -> tuple[pd.DataFrame, pd.DataFrame]:
+        """Creates errors in a given DataFrame by running the plan.
+
+        Args:
+            data (pd.DataFrame): The pandas DataFrame to create errors in. Must have the schema the plan was compiled for.
+            observer (Observer | None, optional): Receives StageEvents of the run and of each error mechanism and error type,
+                e.g., a StageCollector. Defaults to None.
+
+        Raises:
+            ValueError: If the dtypes of 'data' differ from the schema of the plan.
+
+        Returns:
+            tuple[pd.DataFrame, pd.DataFrame]:
+                - The first element is a copy of 'data' with errors.
+                - The second element is the associated error mask.
+        """
+        check_data_emptiness(data)
+        if not data.dtypes.equals(self.schema):
+            msg = "The dtypes of 'data' differ from the schema the plan was compiled for. Compile the config for this schema."
+            raise ValueError(msg)
 
-def create_errors(data: pd.DataFrame, config: MidLevelConfig | dict) -> tuple[pd.DataFrame, pd.DataFrame]:
+        with observe_stage(observer, "MidLevelPlan.run", None, None, n_cells=data.size) as stage:
+            data_dirty = data.copy()
+            error_mask = pd.DataFrame(data=False, index=data.index, columns=data.columns)
+
+            for step in self.steps:
+                positions = step.error_model.error_mechanism.sample_priority(data, step.column, step.error_model.error_rate, error_mask, observer=observer)
+                error_mask.iloc[positions, step.column_position] = True
+                insert_errors_at_positions(data_dirty, step.column, positions, step.error_model.error_type, observer=observer)
+
+            if stage is not None:
+                stage.n_changed = int(error_mask.to_numpy().sum())
+
+        return data_dirty, error_mask
+
+
+def _to_mid_level_config(config: MidLevelConfig | dict) -> MidLevelConfig:
+    """Returns `config` as MidLevelConfig, raises a TypeError if it has incorrect type."""
+    if isinstance(config, dict):
+        return MidLevelConfig(config)
+
+    if isinstance(config, MidLevelConfig):
+        return config
+
+    msg = f"The type of 'config' must be either MidLevelConfig or dict but was {type(config)}."
+    raise TypeError(msg)
+
+
+@accepts_polars_columns
+def create_errors(
+    data: pd.DataFrame, config: MidLevelConfig | dict, observer: Observer | None = None, cache: ResultCache | None = None
+) -> tuple[pd.DataFrame, pd.DataFrame]:
     """Creates errors in a given DataFrame, following a user-defined configuration.
 
     Args:
-        data (pd.DataFrame): The pandas DataFrame to create errors in.
+        data (pd.DataFrame): The pandas DataFrame to create errors in. Of a polars.DataFrame, only the columns that errors are inserted into
+            or sampled by are converted to pandas and back, unless a 'cache' is given, which converts all columns.
         config (MidLevelConfig | dict): The configuration for the error generation process.
+        observer (Observer | None, optional): Receives StageEvents of the whole call and of each error mechanism and error type,
+            e.g., a StageCollector. Defaults to None.
+        cache (ResultCache | None, optional): Returns the cached result of an equal call and caches the result otherwise, if all error
+            mechanisms and error types have seeds. Defaults to None.
 
     Returns:
         tuple[pd.DataFrame, pd.DataFrame]:
@@ -51,31 +252,278 @@ def create_errors(data: pd.DataFrame, config: MidLevelConfig | dict) -> tuple[pd
         TypeError: If `config` has incorrect type.
     """
     check_data_emptiness(data)
-    if isinstance(config, dict):
-        _config = MidLevelConfig(config)
+    _config = _to_mid_level_config(config)
 
-    elif isinstance(config, MidLevelConfig):
-        _config = config
+    key = None if cache is None else cache.key(data, "mid_level.create_errors", _config)
+    if cache is not None and key is not None and (cached := cache.load(key)) is not None:
+        return cached
 
-    else:
-        msg = f"The type of 'config' must be either MidLevelConfig or dict but was {type(config)}."
-        raise TypeError(msg)
+    with observe_stage(observer, "mid_level.create_errors", None, None, n_cells=data.size) as stage:
+        data_dirty = data.copy()
+        error_mask = pd.DataFrame(data=False, index=data.index, columns=data.columns)
 
-    data_dirty = data.copy()
-    error_mask = pd.DataFrame(data=False, index=data.index, columns=data.columns)
+        for column in _config.columns:
+            for error_model in _config.columns[column]:
+                check_error_rate(error_model.error_rate)
+
+                positions = error_model.error_mechanism.sample_priority(data, column, error_model.error_rate, error_mask, observer=observer)
+                error_mask.iloc[positions, error_mask.columns.get_loc(get_column_str(data, column))] = True
+                insert_errors_at_positions(data_dirty, column, positions, error_model.error_type, observer=observer)
+
+        if stage is not None:
+            stage.n_changed = int(error_mask.to_numpy().sum())
+
+    if cache is not None and key is not None:
+        cache.store(key, data_dirty, error_mask)
+
+    return data_dirty, error_mask
+
+
+@accepts_polars
+def create_row_errors(
+    data: pd.DataFrame,
+    error_rate: float,
+    error_mechanism: RowCorrelated,
+    error_types: dict[int | str, ErrorType],
+    observer: Observer | None = None,
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Creates errors in several columns of the same rows, whose cells are sampled at once by a RowCorrelated error mechanism.
+
+    The error mechanism samples the erroneous rows and their columns in bulk, so that correlated errors in wide tables do not need one
+    sampling pass per column. The error type of each column is then applied to the row positions of the column.
+
+    Args:
+        data (pd.DataFrame): The pandas DataFrame to create errors in. A polars.DataFrame is converted to pandas and the results back to polars.
+        error_rate (float): Percentage of rows to be affected by errors in range [0,1].
+        error_mechanism (RowCorrelated): The error mechanism that samples the erroneous rows and their columns.
+        error_types (dict[int | str, ErrorType]): A dictionary mapping from the columns that erroneous rows have errors in to their error types.
+        observer (Observer | None, optional): Receives StageEvents of the whole call, the sampling, and each error type, e.g., a StageCollector.
+            Defaults to None.
+
+    Raises:
+        ValueError: If the error rate is out of the [0,1] interval.
+
+    Returns:
+        tuple[pd.DataFrame, pd.DataFrame]:
+            - The first element is a copy of 'data' with errors.
+            - The second element is the associated error mask.
+    """
+    check_data_emptiness(data)
+    check_error_rate(error_rate)
+
+    with observe_stage(observer, "mid_level.create_row_errors", None, None, n_cells=data.size) as stage:
+        data_dirty = data.copy()
+        error_mask = pd.DataFrame(data=False, index=data.index, columns=data.columns)
+
+        positions = error_mechanism.sample_row_positions(data, list(error_types), error_rate, error_mask, observer=observer)
+        for column, error_type in error_types.items():
+            error_mask.iloc[positions[column], error_mask.columns.get_loc(get_column_str(data, column))] = True
+            insert_errors_at_positions(data_dirty, column, positions[column], error_type, observer=observer)
+
+        if stage is not None:
+            stage.n_changed = sum(len(column_positions) for column_positions in positions.values())
+
+    return data_dirty, error_mask
+
+
+def create_error_diff(data: pd.DataFrame, config: MidLevelConfig | dict, *, keep_original: bool = True, observer: Observer | None = None) -> ErrorDiff:
+    """Creates errors in a given DataFrame like `create_errors`, but returns them as an ErrorDiff instead of a copy of 'data' and an error mask.
+
+    Only the column that errors are inserted into is copied at a time, so that the memory of the result scales with the number of errors.
+    `ErrorDiff.replay(data)` returns the same data with errors as `create_errors`.
+
+    Args:
+        data (pd.DataFrame): The pandas DataFrame to create errors in.
+        config (MidLevelConfig | dict): The configuration for the error generation process.
+        keep_original (bool, optional): Whether the ErrorDiff keeps the original values of the cells with errors, which
+            `ErrorDiff.invert` requires. Defaults to True.
+        observer (Observer | None, optional): Receives StageEvents of the whole call and of each error mechanism and error type,
+            e.g., a StageCollector. Defaults to None.
+
+    Raises:
+        TypeError: If `config` has incorrect type.
+
+    Returns:
+        ErrorDiff: The positions and values of the cells with errors.
+    """
+    check_data_emptiness(data)
+    _config = _to_mid_level_config(config)
+
+    with observe_stage(observer, "mid_level.create_error_diff", None, None, n_cells=data.size) as stage:
+        error_mask = pd.DataFrame(data=False, index=data.index, columns=data.columns)
+        columns: dict[Hashable, ColumnDiff] = {}
+
+        for column in _config.columns:
+            col = get_column_str(data, column)
+            column_position = error_mask.columns.get_loc(col)
+            series = data[col]
+
+            for error_model in _config.columns[column]:
+                check_error_rate(error_model.error_rate)
+
+                positions = error_model.error_mechanism.sample_priority(data, column, error_model.error_rate, error_mask, observer=observer)
+                error_mask.iloc[positions, column_position] = True
+                step_mask = np.zeros(len(data), dtype=bool)
+                step_mask[positions] = True
+                series = error_model.error_type.apply_series(series, step_mask, observer=observer)
+
+            positions = np.flatnonzero(error_mask.iloc[:, column_position].to_numpy())
+            if len(positions) > 0:
+                columns[col] = ColumnDiff.from_series(series, positions, data[col] if keep_original else None)
+
+        error_diff = ErrorDiff(len(data), columns)
+        if stage is not None:
+            stage.n_changed = error_diff.n_errors
+
+    return error_diff
+
+
+def _concat_rows(previous: pd.DataFrame, appended: pd.DataFrame) -> pd.DataFrame:
+    """Concatenates the rows of two DataFrames. Categorical columns whose categories differ get the union of their categories."""
+    for column in previous.columns:
+        previous_dtype, appended_dtype = previous[column].dtype, appended[column].dtype
+        if isinstance(previous_dtype, pd.CategoricalDtype) and isinstance(appended_dtype, pd.CategoricalDtype) and previous_dtype != appended_dtype:
+            categories = previous_dtype.categories.union(appended_dtype.categories, sort=False)
+            dtype = pd.CategoricalDtype(categories, ordered=previous_dtype.ordered)
+            previous, appended = previous.astype({column: dtype}), appended.astype({column: dtype})
+
+    return pd.concat([previous, appended])
+
+
+def _fit_on_previous_rows(error_type: ErrorType, previous_values: pd.Series, dtype: Any) -> ErrorType:  # noqa: ANN401
+    """Fits 'error_type' on the error-free values of the previous rows, cast to the 'dtype' of the appended rows, unless it was fitted before."""
+    if error_type._statistics is not None or previous_values.empty:  # noqa: SLF001
+        return error_type
+
+    return error_type.fit(previous_values if previous_values.dtype == dtype else previous_values.astype(dtype))
+
+
+@accepts_polars
+def append_errors(
+    data_dirty: pd.DataFrame, error_mask: pd.DataFrame, new_data: pd.DataFrame, config: MidLevelConfig | dict, observer: Observer | None = None
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Creates errors only in rows that are appended to data that already contains errors, following the configuration of the existing errors.
+
+    The errors of the previous rows are kept. Each error model inserts as many errors into the appended rows as it needs to have inserted
+    `int(n_rows * error_rate)` errors into all `n_rows` rows, assuming that it inserted `int(n_previous_rows * error_rate)` errors into the
+    previous rows, as `create_errors` and `append_errors` do. So appending small batches of rows inserts errors at the configured rates
+    as well, rather than flooring the number of errors of each batch.
+
+    Seeded error mechanisms and error types draw from seeds derived from their seeds and the number of previous rows, so that each batch
+    of rows gets different errors that are reproducible. The error types keep the parameters they sampled into their config for the previous
+    rows, e.g., the delta of AddDelta. Error types that derive statistics from the column, e.g., the quartiles of Outlier, are fitted on the
+    error-free cells of the previous rows, unless they were fitted with `ErrorType.fit` before. The error mechanisms only see the appended
+    rows, e.g., EAR sorts them by their own values.
+
+    Args:
+        data_dirty (pd.DataFrame): The data with errors returned by `create_errors` or a previous call of `append_errors`.
+        error_mask (pd.DataFrame): The error mask of 'data_dirty'.
+        new_data (pd.DataFrame): The appended rows without errors, with the same columns as 'data_dirty'.
+        config (MidLevelConfig | dict): The configuration that created the errors of 'data_dirty'.
+        observer (Observer | None, optional): Receives StageEvents of the whole call and of each error mechanism and error type,
+            e.g., a StageCollector. Defaults to None.
+
+    Raises:
+        TypeError: If `config` has incorrect type.
+        ValueError: If the shapes of 'data_dirty' and 'error_mask' differ or 'new_data' has other columns.
+
+    Returns:
+        tuple[pd.DataFrame, pd.DataFrame]:
+            - The first element is 'data_dirty' followed by a copy of 'new_data' with errors.
+            - The second element is 'error_mask' followed by the error mask of the appended rows.
+    """
+    check_data_emptiness(new_data)
+    _config = _to_mid_level_config(config)
+
+    if data_dirty.shape != error_mask.shape:
+        msg = f"The shape of 'data_dirty': {data_dirty.shape} was different from the shape of 'error_mask': {error_mask.shape}. They should be the same."
+        raise ValueError(msg)
+
+    if not new_data.columns.equals(data_dirty.columns):
+        msg = f"The columns of 'new_data': {new_data.columns.to_list()} differ from the columns of 'data_dirty': {data_dirty.columns.to_list()}."
+        raise ValueError(msg)
+
+    n_previous_rows, n_new_rows = len(data_dirty), len(new_data)
+    with observe_stage(observer, "mid_level.append_errors", None, None, n_cells=new_data.size) as stage:
+        new_data_dirty = new_data.copy()
+        new_error_mask = pd.DataFrame(data=False, index=new_data.index, columns=new_data.columns)
+
+        for column, error_models in _config.columns.items():
+            column_position = new_error_mask.columns.get_loc(get_column_str(new_data, column))
+            previous_values = get_column(data_dirty, column)[~get_column(error_mask, column).to_numpy(dtype=bool)]
+
+            for error_model in error_models:
+                check_error_rate(error_model.error_rate)
+                n_errors = int((n_previous_rows + n_new_rows) * error_model.error_rate) - int(n_previous_rows * error_model.error_rate)
+                n_errors = min(n_errors, n_new_rows - int(new_error_mask.iloc[:, column_position].sum()))
+
+                mechanism = derive_seeded_copy(error_model.error_mechanism, n_previous_rows)
+                error_type = derive_seeded_copy(error_model.error_type, n_previous_rows)
+                error_type = _fit_on_previous_rows(error_type, previous_values, get_column(new_data, column).dtype)
+
+                # Sample at least n_errors cells and keep the ones of highest priority, as every prefix is a valid selection
+                error_rate = min(1.0, (n_errors + 0.5) / n_new_rows)
+                positions = mechanism.sample_priority(new_data, column, error_rate, new_error_mask, observer=observer)[:n_errors]
+                new_error_mask.iloc[positions, column_position] = True
+                insert_errors_at_positions(new_data_dirty, column, positions, error_type, observer=observer)
+
+        if stage is not None:
+            stage.n_changed = int(new_error_mask.to_numpy().sum())
+
+    return _concat_rows(data_dirty, new_data_dirty), pd.concat([error_mask, new_error_mask])
+
+
+def create_errors_sweep(data: pd.DataFrame, config: MidLevelConfig | dict, scales: Sequence[float]) -> Iterator[tuple[pd.DataFrame, pd.DataFrame]]:
+    """Creates errors in a given DataFrame at several scales of the configured error rates in one pass.
+
+    Each error model draws the priority of its cells only once, at its configured error rate. At scale `s`, an error model
+    inserts errors into the first `int(len(data) * s * error_rate)` of those cells, so the error masks of increasing scales are nested.
+    The data of each scale is derived from the data of the previous one by inserting errors only into the cells that were added to the mask.
+    Each error type draws the errors of all scales from one random number generator, which is seeded once by its seed.
+
+    Args:
+        data (pd.DataFrame): The pandas DataFrame to create errors in.
+        config (MidLevelConfig | dict): The configuration for the error generation process.
+        scales (Sequence[float]): Factors in range [0, 1], sorted in ascending order, that scale the error rates of all error models.
+
+    Yields:
+        tuple[pd.DataFrame, pd.DataFrame]: One pair per scale, in the order of 'scales':
+            - The first element is a copy of 'data' with errors.
+            - The second element is the associated error mask.
+
+    Raises:
+        TypeError: If `config` has incorrect type.
+    """
+    check_data_emptiness(data)
+    check_error_rates_ascending(scales)
+    _config = _to_mid_level_config(config)
+
+    # Sample the cells of all error models at their full error rates, excluding the cells of the previous error models
+    reserved_mask = pd.DataFrame(data=False, index=data.index, columns=data.columns)
+    sampled_models: list[tuple[int | str, ErrorModel, np.ndarray, np.random.Generator]] = []
 
     for column in _config.columns:
+        column_position = reserved_mask.columns.get_loc(get_column_str(data, column))
+
         for error_model in _config.columns[column]:
             check_error_rate(error_model.error_rate)
+            positions = error_model.error_mechanism.sample_priority(data, column, error_model.error_rate, reserved_mask)
+            reserved_mask.iloc[positions, column_position] = True
+            sampled_models.append((column, error_model, positions, seed_randomness_and_get_generator(error_model.error_type._seed)))  # noqa: SLF001
 
-            error_mechanism = error_model.error_mechanism
-            error_type = error_model.error_type
-            error_rate = error_model.error_rate
+    data_dirty = data.copy()
+    error_mask = pd.DataFrame(data=False, index=data.index, columns=data.columns)
+    n_previous_errors = [0] * len(sampled_models)
 
-            old_error_mask = error_mask.copy()
-            error_mask = error_mechanism.sample(data, column, error_rate, error_mask)
+    for scale in scales:
+        for i, (column, error_model, positions, random_generator) in enumerate(sampled_models):
+            n_errors = int(len(data) * error_model.error_rate * scale)
+            new_positions = positions[n_previous_errors[i] : n_errors]
 
-            series = error_type.apply(data_dirty, old_error_mask != error_mask, column)
-            set_column(data_dirty, column, series)
+            if len(new_positions) > 0:
+                insert_errors_at_positions(data_dirty, column, new_positions, error_model.error_type, rng=random_generator)
+                error_mask.iloc[new_positions, error_mask.columns.get_loc(get_column_str(data, column))] = True
 
-    return data_dirty, error_mask
+            n_previous_errors[i] = n_errors
+
+        yield data_dirty.copy(), error_mask.copy()
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from tab_err._utils import check_data_emptiness
+from tab_err.api.transformer import TabErrTransformer
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    import pandas as pd
+
+    from tab_err.api.mid_level import MidLevelConfig
+
+
+def iter_minibatches(  # noqa: PLR0913
+    data: pd.DataFrame,
+    config: MidLevelConfig | dict,
+    batch_size: int,
+    *,
+    shuffle: bool = True,
+    seed: int | None = None,
+    n_threads: int = 2,
+    prefetch: int = 4,
+) -> Iterator[tuple[pd.DataFrame, pd.DataFrame]]:
+    """Lazily yields the rows of a DataFrame in minibatches with fresh errors, e.g., to augment training data without corrupting copies of all of it.
+
+    The configuration is fitted once to 'data' by a TabErrTransformer, so the statistics of the error types, e.g., the quartiles of
+    Outlier, are those of the whole DataFrame. Background threads insert the errors of the next `prefetch` batches while the consumer
+    handles the current one, so that at most `prefetch` + 1 batches are in memory. The first batch is created before the threads start,
+    so that error types that sample parameters into their config, e.g., the delta of AddDelta, sample them once and reproducibly.
+    Each batch draws from seeds derived from the seeds of the error models and a key drawn from 'seed'. Error types that draw from the
+    `random` module, e.g., Typo, share it across threads, so their errors are only reproducible with one thread.
+
+    Args:
+        data (pd.DataFrame): The pandas DataFrame without errors.
+        config (MidLevelConfig | dict): The configuration for the error generation process.
+        batch_size (int): The number of rows per batch. The last batch contains the remaining rows.
+        shuffle (bool, optional): Whether the rows are shuffled before they are split into batches. Defaults to True.
+        seed (int | None, optional): Random seed of the shuffling and the keys of the batches. Defaults to None, which yields new errors on
+            every call.
+        n_threads (int, optional): Number of background threads that create batches. Defaults to 2.
+        prefetch (int, optional): Number of batches that are created ahead of the consumer. Defaults to 4.
+
+    Raises:
+        ValueError: If `batch_size`, `n_threads`, or `prefetch` is smaller than 1, or 'data' is empty.
+
+    Yields:
+        tuple[pd.DataFrame, pd.DataFrame]:
+            - The first element is a batch of the rows of 'data' with errors, with their index.
+            - The second element is the associated error mask.
+    """
+    check_data_emptiness(data)
+    for name, value in (("batch_size", batch_size), ("n_threads", n_threads), ("prefetch", prefetch)):
+        if value < 1:
+            msg = f"'{name}' is: {value} and should be a positive integer."
+            raise ValueError(msg)
+
+    transformer = TabErrTransformer(config).fit(data)
+    random_generator = np.random.default_rng(seed)
+    order = random_generator.permutation(len(data)) if shuffle else np.arange(len(data))
+    starts = range(0, len(data), batch_size)
+    keys = random_generator.integers(0, np.iinfo(np.int64).max, size=len(starts))
+
+    def create_batch(i: int) -> tuple[pd.DataFrame, pd.DataFrame]:
+        batch = data.iloc[order[starts[i] : starts[i] + batch_size]]
+        return transformer.transform_with_mask(batch, seed=int(keys[i]))
+
+    first_batch = create_batch(0)
+    batch_indices = iter(range(1, len(starts)))
+    executor = ThreadPoolExecutor(max_workers=n_threads, thread_name_prefix="tab_err")
+    try:
+        pending: deque[Future[tuple[pd.DataFrame, pd.DataFrame]]] = deque(executor.submit(create_batch, i) for _, i in zip(range(prefetch), batch_indices))
+        yield first_batch
+        while pending:
+            batch = pending.popleft().result()
+            for i in batch_indices:  # keep the threads busy while the consumer handles the batch
+                pending.append(executor.submit(create_batch, i))
+                break
+            yield batch
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
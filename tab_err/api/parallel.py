@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import copy
+import os
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from tab_err._observer import observe_stage
+from tab_err._parallel import PartitionPool, bracket, select_element
+from tab_err._polars import accepts_polars
+from tab_err._utils import check_data_emptiness, check_error_rate, count_errors, get_column_str, seed_randomness_and_get_generator
+from tab_err.api.mid_level import _to_mid_level_config
+from tab_err.error_mechanism import ECAR
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable
+
+    import pandas as pd
+
+    from tab_err import ErrorMechanism, ErrorType
+    from tab_err._observer import Observer
+    from tab_err.api.mid_level import MidLevelConfig
+
+N_SKETCH_POINTS = 4096
+"""Number of sorted values each partition reports per block selection. More points narrow the windows of values sent to the driver."""
+
+
+def _sample_random(pool: PartitionPool, mechanism: ErrorMechanism, column: str, n_errors: int, n_error_free: np.ndarray) -> np.ndarray:
+    """Samples `n_errors` error-free cells uniformly at random from all partitions and returns the number of cells selected per partition.
+
+    The number of cells per partition follows the multivariate hypergeometric distribution of drawing `n_errors` cells from all error-free
+    cells without replacement, so that the selected cells are distributed as those of the single-process ECAR.
+    """
+    random_generator = seed_randomness_and_get_generator(mechanism._seed)  # noqa: SLF001
+    counts = random_generator.multivariate_hypergeometric(n_error_free, n_errors)
+    seeds = random_generator.integers(0, np.iinfo(np.int64).max, size=len(pool))
+    return np.array(pool.call_each("select_random", [(column, int(count), int(seed)) for count, seed in zip(counts, seeds)]))
+
+
+def _sample_block(  # noqa: PLR0913
+    pool: PartitionPool, mechanism: ErrorMechanism, data: pd.DataFrame, column: str, n_errors: int, n_error_free: np.ndarray
+) -> np.ndarray:
+    """Selects the same block of cells as the single-process mechanism and returns the number of cells selected per partition.
+
+    The mechanism draws the column to sort by and the rank at which the block starts, as it does in `_select_block`. The elements at the
+    first rank of the block and right after its end are found in two passes that send only few values to the driver: each partition
+    reports a sketch of its sorted values, which bounds the global ranks of the sketch values, and then the values between the bounds of
+    the two ranks, which the driver merges to determine the elements exactly. Each partition finally selects its cells between them.
+
+    Raises:
+        TypeError: If the mechanism does not select blocks of cells sorted by a single column.
+    """
+    mechanism._random_generator = seed_randomness_and_get_generator(mechanism._seed)  # noqa: SLF001
+    block_columns = mechanism._get_block_columns(data, column)  # noqa: SLF001
+    if block_columns is None:
+        msg = f"The error mechanism {type(mechanism).__name__} is not supported by the parallel API."
+        raise TypeError(msg)
+
+    if len(block_columns) > 1:
+        msg = f"The error mechanism {type(mechanism).__name__} with multiple conditioning columns is not supported by the parallel API."
+        raise TypeError(msg)
+
+    block_column = block_columns[0]
+
+    start_rank = mechanism._draw_block_start(n_errors, int(n_error_free.sum()))  # noqa: SLF001
+    ranks = [start_rank] if start_rank + n_errors == n_error_free.sum() else [start_rank, start_rank + n_errors]
+
+    sketches = pool.call("sketch", column, block_column, N_SKETCH_POINTS)
+    windows = pool.call("windows", column, block_column, [bracket(rank, sketches) for rank in ranks])
+    start, *end = (select_element(rank, [partition_windows[i] for partition_windows in windows]) for i, rank in enumerate(ranks))
+
+    return np.array(pool.call("select_block", column, block_column, start, end[0] if end else None))
+
+
+def _fit_error_type(error_type: ErrorType, series: pd.Series) -> ErrorType:
+    """Samples the config parameters of 'error_type' from the whole column and returns a copy fitted to it, unless it was fitted before.
+
+    The sampled parameters, e.g., the delta of AddDelta, are written to the config of 'error_type' as in a single process, and the
+    statistics, e.g., the quartiles of Outlier, are those of the whole column, so that all partitions insert errors with the same parameters.
+    """
+    error_type._random_generator = seed_randomness_and_get_generator(error_type._seed)  # noqa: SLF001
+    error_type._sample_config(series)  # noqa: SLF001
+
+    if error_type._statistics is not None:  # noqa: SLF001
+        return error_type
+
+    return copy.copy(error_type).fit(series)
+
+
+@accepts_polars
+def create_errors(
+    data: pd.DataFrame, config: MidLevelConfig | dict, n_jobs: int | None = None, observer: Observer | None = None, *, shared_memory: bool = False
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Creates errors in a given DataFrame, following a configuration as for the mid-level API, in multiple processes.
+
+    The rows are split into `n_jobs` contiguous partitions, each of which a worker process holds. ECAR samples the number of errors per
+    partition, and each partition samples its cells. ENAR and EAR select the same block of cells as in a single process, without
+    sorting the whole column at once: the partitions sort their rows, and the driver determines the values at which the block starts and
+    ends from a few sorted values per partition, also if they are `approximate`. Other error mechanisms, and EAR with multiple
+    conditioning columns, are not supported.
+
+    Error types insert errors into each partition with a seed derived from their seed and the partition. Parameters that error types
+    derive from the values of the column are computed once in this process from the whole column without errors, before the partitions
+    insert errors: config parameters, e.g., the delta of AddDelta without 'add_delta_value', are sampled into the config as in a single
+    process, and statistics, e.g., the quartiles of Outlier, are fitted with `ErrorType.fit` unless the error type was fitted before.
+
+    By default, each worker process receives its rows pickled and returns its rows with errors and its error mask pickled. With
+    `shared_memory`, the numeric, datetime, categorical, and Arrow-backed columns are copied once into shared memory blocks that the
+    workers read without copying, and the workers return only the columns with errors and the error mask through shared memory blocks.
+    Other columns, e.g., object columns, are pickled as before. This avoids serializing large DataFrames, at the cost of one copy of
+    the shared columns in shared memory.
+
+    Args:
+        data (pd.DataFrame): The pandas DataFrame to create errors in. A polars.DataFrame is converted to pandas and the results back to polars.
+        config (MidLevelConfig | dict): The configuration for the error generation process.
+        n_jobs (int | None, optional): Number of worker processes and partitions. With 1, the partition is processed in this process.
+            Defaults to None, which uses all CPUs.
+        observer (Observer | None, optional): Receives a StageEvent of the whole call, e.g., a StageCollector. The stages of the worker
+            processes are not observed. Defaults to None.
+        shared_memory (bool, optional): Whether the worker processes exchange columns through shared memory instead of pickling them.
+            Defaults to False.
+
+    Raises:
+        TypeError: If `config` has incorrect type or an error mechanism is not supported.
+        ValueError: If `n_jobs` is not positive, or there are insufficient error-free cells for an error rate.
+
+    Returns:
+        tuple[pd.DataFrame, pd.DataFrame]:
+            - The first element is a copy of 'data' with errors.
+            - The second element is the associated error mask.
+    """
+    check_data_emptiness(data)
+    _config = _to_mid_level_config(config)
+
+    if n_jobs is None:
+        n_jobs = os.cpu_count() or 1
+    if n_jobs < 1:
+        msg = f"'n_jobs' needs to be a positive integer but was {n_jobs}."
+        raise ValueError(msg)
+
+    with (
+        observe_stage(observer, "parallel.create_errors", None, None, n_cells=data.size) as stage,
+        PartitionPool(data, min(n_jobs, len(data)), shared_memory=shared_memory) as pool,
+    ):
+        partition_sizes = np.diff(pool.bounds)
+        steps: list[tuple[Hashable, ErrorType]] = []
+
+        for column in _config.columns:
+            col = get_column_str(data, column)
+            data.columns.get_loc(col)  # Raises a KeyError if the column does not exist
+            n_error_free = partition_sizes.copy()
+
+            for error_model in _config.columns[column]:
+                check_error_rate(error_model.error_rate)
+                mechanism = error_model.error_mechanism
+                n_errors = count_errors(len(data), int(n_error_free.sum()), error_model.error_rate)
+
+                if n_errors == 0:
+                    n_selected = np.array(pool.call_each("select_random", [(col, 0, 0)] * len(pool)))
+                elif isinstance(mechanism, ECAR):
+                    n_selected = _sample_random(pool, mechanism, col, n_errors, n_error_free)
+                else:
+                    n_selected = _sample_block(pool, mechanism, data, col, n_errors, n_error_free)
+
+                n_error_free -= n_selected
+                steps.append((col, _fit_error_type(error_model.error_type, data[col])))
+
+        data_dirty, error_mask = pool.apply(data, steps)
+
+        if stage is not None:
+            stage.n_changed = int(error_mask.to_numpy().sum())
+
+    return data_dirty, error_mask
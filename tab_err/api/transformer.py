@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import copy
+import dataclasses
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from tab_err._error_model import ErrorModel
+from tab_err._utils import check_data_emptiness, derive_seeded_copy, get_column
+from tab_err.api.mid_level import _to_mid_level_config
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+    from tab_err._observer import Observer
+    from tab_err.api.mid_level import MidLevelConfig, MidLevelPlan
+
+
+class TabErrTransformer:
+    """Inserts errors into batches of data with a mid-level configuration that was fitted once, e.g., into each minibatch or fold of training.
+
+    `fit` compiles the configuration for the schema of the data and fits the error types of each column to the column, e.g., the quartiles
+    of Outlier and the mean and standard deviation of AddDelta. `transform` then applies the fitted error models to batches with the same
+    schema without validating the configuration or computing these statistics again. The transformer implements the estimator interface of
+    scikit-learn, i.e., `get_params`, `set_params`, `fit`, `transform`, and `fit_transform`, without depending on it, so that it can be a
+    step of a `sklearn.pipeline.Pipeline`.
+
+    Attributes:
+        config (MidLevelConfig | dict): The configuration of the error models.
+        seed (int | None): The default seed of `transform`.
+        plan_ (MidLevelPlan): The compiled configuration whose error types are fitted, set by `fit`.
+        feature_names_in_ (list[str | int]): The names of the columns of the fitted data, set by `fit`.
+        n_features_in_ (int): The number of columns of the fitted data, set by `fit`.
+    """
+
+    def __init__(self: TabErrTransformer, config: MidLevelConfig | dict, seed: int | None = None) -> None:
+        """Initialization method of the TabErrTransformer class.
+
+        Args:
+            config (MidLevelConfig | dict): The configuration for the error generation process.
+            seed (int | None, optional): The seed that `transform` derives the seeds of the error models from if it gets no seed. Defaults to None,
+                which uses the seeds of the error models as they are.
+        """
+        self.config = config
+        self.seed = seed
+
+    def get_params(self: TabErrTransformer, deep: bool = True) -> dict[str, Any]:  # noqa: ARG002, FBT001, FBT002
+        """Returns the parameters of the transformer, as scikit-learn estimators do."""
+        return {"config": self.config, "seed": self.seed}
+
+    def set_params(self: TabErrTransformer, **params: Any) -> TabErrTransformer:  # noqa: ANN401
+        """Sets the parameters of the transformer, as scikit-learn estimators do.
+
+        Raises:
+            ValueError: If a parameter does not exist.
+        """
+        for name, value in params.items():
+            if name not in self.get_params():
+                msg = f"Invalid parameter '{name}' for TabErrTransformer. Valid parameters are {sorted(self.get_params())}."
+                raise ValueError(msg)
+            setattr(self, name, value)
+
+        return self
+
+    def fit(self: TabErrTransformer, data: pd.DataFrame, y: Any = None) -> TabErrTransformer:  # noqa: ANN401, ARG002
+        """Compiles the configuration for the schema of 'data' and fits a copy of the error type of each error model to its column.
+
+        The copies share the configs of the error types, including the values that they sample into them, e.g., the delta of AddDelta.
+
+        Args:
+            data (pd.DataFrame): The data without errors, e.g., the training data.
+            y (Any, optional): Ignored, for compatibility with scikit-learn pipelines. Defaults to None.
+
+        Raises:
+            TypeError: If `config` has incorrect type or an error type cannot be applied to its column.
+            KeyError: If a column of `config` does not exist.
+            ValueError: If 'data' is empty or the error rates of a column sum up to more than 1.
+
+        Returns:
+            TabErrTransformer: The fitted transformer.
+        """
+        check_data_emptiness(data)
+        plan = _to_mid_level_config(self.config).compile(data)
+
+        steps = []
+        for step in plan.steps:
+            error_model = step.error_model
+            error_type = copy.copy(error_model.error_type).fit(get_column(data, step.column))
+            steps.append(dataclasses.replace(step, error_model=ErrorModel(error_model.error_mechanism, error_type, error_model.error_rate)))
+
+        self.plan_ = dataclasses.replace(plan, steps=tuple(steps))
+        self.feature_names_in_ = data.columns.to_list()
+        self.n_features_in_ = len(data.columns)
+        return self
+
+    def transform(self: TabErrTransformer, data: pd.DataFrame, seed: int | None = None) -> pd.DataFrame:
+        """Returns a copy of 'data' with errors of the fitted error models. See `transform_with_mask`."""
+        return self.transform_with_mask(data, seed)[0]
+
+    def transform_with_mask(
+        self: TabErrTransformer, data: pd.DataFrame, seed: int | None = None, observer: Observer | None = None
+    ) -> tuple[pd.DataFrame, pd.DataFrame]:
+        """Inserts errors into a batch with the fitted error models.
+
+        With a seed, the error mechanisms and error types draw from seeds derived from their seeds and 'seed', so that each batch
+        gets different errors that are reproducible, e.g., with the index of the batch as 'seed'. Error models without seed stay random.
+
+        Args:
+            data (pd.DataFrame): The batch to create errors in. Must have the schema of the fitted data.
+            seed (int | None, optional): The seed of the batch. Defaults to None, which uses the seed of the transformer.
+            observer (Observer | None, optional): Receives StageEvents of the run and of each error mechanism and error type,
+                e.g., a StageCollector. Defaults to None.
+
+        Raises:
+            ValueError: If the transformer is not fitted or the dtypes of 'data' differ from those of the fitted data.
+
+        Returns:
+            tuple[pd.DataFrame, pd.DataFrame]:
+                - The first element is a copy of 'data' with errors.
+                - The second element is the associated error mask.
+        """
+        if not hasattr(self, "plan_"):
+            msg = "The TabErrTransformer is not fitted yet. Call 'fit' before 'transform'."
+            raise ValueError(msg)
+
+        seed = self.seed if seed is None else seed
+        plan = self.plan_ if seed is None else _derive_seeded_plan(self.plan_, seed)
+        return plan.run(data, observer=observer)
+
+    def fit_transform(self: TabErrTransformer, data: pd.DataFrame, y: Any = None, seed: int | None = None) -> pd.DataFrame:  # noqa: ANN401
+        """Fits the transformer to 'data' and returns a copy of 'data' with errors."""
+        return self.fit(data, y).transform(data, seed)
+
+    def get_feature_names_out(self: TabErrTransformer, input_features: Any = None) -> np.ndarray:  # noqa: ANN401, ARG002
+        """Returns the names of the columns of the transformed data, which are those of the fitted data."""
+        return np.asarray(self.feature_names_in_, dtype=object)
+
+
+def _derive_seeded_plan(plan: MidLevelPlan, seed: int) -> MidLevelPlan:
+    """Returns a copy of 'plan' whose error mechanisms and error types draw from seeds derived from their seeds and 'seed'."""
+    steps = []
+    for step in plan.steps:
+        error_model = step.error_model
+        mechanism, error_type = derive_seeded_copy(error_model.error_mechanism, seed), derive_seeded_copy(error_model.error_type, seed)
+        steps.append(dataclasses.replace(step, error_model=ErrorModel(mechanism, error_type, error_model.error_rate)))
+
+    return dataclasses.replace(plan, steps=tuple(steps))
@@ -0,0 +1,27 @@
+from typing import TYPE_CHECKING
+
+from tab_err._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    attributes={
+        "make_frame": "._data",
+        "make_mixed_frame": "._data",
+        "ImportResult": "._imports",
+        "run_import_benchmarks": "._imports",
+        "BenchmarkResult": "._micro",
+        "run_micro_benchmarks": "._micro",
+        "compare_reports": "._report",
+        "read_report": "._report",
+        "write_report": "._report",
+        "ScalingResult": "._scaling",
+        "run_scaling_benchmarks": "._scaling",
+    },
+)
+
+if TYPE_CHECKING:
+    from tab_err.bench._data import make_frame, make_mixed_frame
+    from tab_err.bench._imports import ImportResult, run_import_benchmarks
+    from tab_err.bench._micro import BenchmarkResult, run_micro_benchmarks
+    from tab_err.bench._report import compare_reports, read_report, write_report
+    from tab_err.bench._scaling import ScalingResult, run_scaling_benchmarks
@@ -0,0 +1,121 @@
+"""Command line interface of the tab_err benchmarks.
+
+Run `python -m tab_err.bench micro --output micro.json` to benchmark every ErrorType and ErrorMechanism and
+`python -m tab_err.bench scaling --output scaling.json` to measure the wall time and peak memory of the APIs end to end,
+`python -m tab_err.bench imports --output imports.json` to measure import times against their budgets, and
+`python -m tab_err.bench compare baseline.json candidate.json` to compare two reports, e.g., of different versions.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+from tab_err.bench._data import DTYPES, INDEX_TYPES, OPTIONAL_DTYPES
+from tab_err.bench._imports import IMPORT_BUDGETS, run_import_benchmarks
+from tab_err.bench._micro import ERROR_MECHANISMS, ERROR_RATES, ERROR_TYPES, SIZES, run_micro_benchmarks
+from tab_err.bench._report import compare_reports, read_report, write_report
+from tab_err.bench._scaling import APIS, COLUMNS, MODELS_PER_COLUMN, ROWS, run_scaling_benchmarks
+
+_KEY_FIELDS = {
+    "micro": ("benchmark", "dtype", "n_rows", "error_rate", "index_type"),
+    "scaling": ("api", "n_rows", "n_columns", "n_error_models_per_column"),
+    "imports": ("statement",),
+}
+
+
+def _micro(args: argparse.Namespace) -> None:
+    results = run_micro_benchmarks(
+        sizes=args.sizes, dtypes=args.dtypes, error_rates=args.error_rates, index_types=args.index_types, repeat=args.repeat, selection=args.select
+    )
+    write_report(args.output, "micro", [result.to_dict() for result in results])
+
+    for result in results:
+        measurement = f"{min(result.times):.6f}s" if result.times else result.error
+        sys.stdout.write(f"{result.benchmark:<28} {result.dtype:<11} {result.n_rows:>9} {result.error_rate:<5} {result.index_type:<9} {measurement}\n")
+
+
+def _scaling(args: argparse.Namespace) -> None:
+    results = run_scaling_benchmarks(
+        apis=args.apis, rows=args.rows, columns=args.columns, models_per_column=args.models, error_rate=args.error_rate, isolate=not args.no_isolate
+    )
+    write_report(args.output, "scaling", [result.to_dict() for result in results])
+
+    for result in results:
+        row = result.to_dict()
+        if result.error is not None:
+            measurement = result.error
+        else:
+            rss_multiple = f"{row['rss_multiple']:.2f}x" if row["rss_multiple"] is not None else "-"
+            measurement = f"{result.wall_time:.4f}s tracemalloc {row['tracemalloc_multiple']:.2f}x rss {rss_multiple}"
+        sys.stdout.write(f"{result.api:<10} {result.n_rows:>9} {result.n_columns:>4} {result.n_error_models_per_column:>3} {measurement}\n")
+
+
+def _imports(args: argparse.Namespace) -> None:
+    results = run_import_benchmarks(statements=args.statements, repeat=args.repeat)
+    write_report(args.output, "imports", [result.to_dict() for result in results])
+
+    for result in results:
+        budget = f"budget {result.budget:.3f}s {'ok' if result.within_budget else 'EXCEEDED'}" if result.budget is not None else ""
+        sys.stdout.write(f"{result.statement:<40} {min(result.times):.4f}s {budget} imports {', '.join(result.packages)}\n")
+
+    if not all(result.within_budget for result in results):
+        msg = "An import exceeded its budget."
+        raise SystemExit(msg)
+
+
+def _compare(args: argparse.Namespace) -> None:
+    baseline, candidate = read_report(args.baseline), read_report(args.candidate)
+    if baseline["kind"] != candidate["kind"]:
+        msg = f"Cannot compare a '{baseline['kind']}' report to a '{candidate['kind']}' report."
+        raise SystemExit(msg)
+
+    for row in compare_reports(baseline, candidate, _KEY_FIELDS[baseline["kind"]], args.metric):
+        key = " ".join(str(row[field]) for field in _KEY_FIELDS[baseline["kind"]])
+        sys.stdout.write(f"{key:<70} {row['baseline']:>12.6g} {row['candidate']:>12.6g} {row['ratio']:>7.2f}x\n")
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Parses the command line arguments and runs the selected benchmark."""
+    parser = argparse.ArgumentParser(prog="python -m tab_err.bench", description="Benchmarks of tab_err.")
+    subparsers = parser.add_subparsers(required=True)
+
+    micro = subparsers.add_parser("micro", help="Benchmark every ErrorType and ErrorMechanism on synthetic columns.")
+    micro.add_argument("--output", type=Path, default=Path("micro.json"), help="Path of the JSON report.")
+    micro.add_argument("--sizes", type=int, nargs="+", default=list(SIZES), help="Numbers of rows.")
+    micro.add_argument("--dtypes", nargs="+", default=list(DTYPES), choices=DTYPES + OPTIONAL_DTYPES)
+    micro.add_argument("--error-rates", type=float, nargs="+", default=list(ERROR_RATES))
+    micro.add_argument("--index-types", nargs="+", default=list(INDEX_TYPES), choices=INDEX_TYPES)
+    micro.add_argument("--repeat", type=int, default=3, help="Number of repetitions of each case.")
+    micro.add_argument("--select", nargs="+", choices=[*ERROR_TYPES, *ERROR_MECHANISMS], help="Only benchmark these ErrorTypes and ErrorMechanisms.")
+    micro.set_defaults(func=_micro)
+
+    scaling = subparsers.add_parser("scaling", help="Measure the wall time and peak memory of the APIs on synthetic DataFrames with mixed dtypes.")
+    scaling.add_argument("--output", type=Path, default=Path("scaling.json"), help="Path of the JSON report.")
+    scaling.add_argument("--apis", nargs="+", default=list(APIS), choices=APIS)
+    scaling.add_argument("--rows", type=int, nargs="+", default=list(ROWS), help="Numbers of rows.")
+    scaling.add_argument("--columns", type=int, nargs="+", default=list(COLUMNS), help="Numbers of columns.")
+    scaling.add_argument("--models", type=int, nargs="+", default=list(MODELS_PER_COLUMN), help="Numbers of error models per column.")
+    scaling.add_argument("--error-rate", type=float, default=0.1)
+    scaling.add_argument("--no-isolate", action="store_true", help="Run all cases in this process instead of a fresh process each.")
+    scaling.set_defaults(func=_scaling)
+
+    imports = subparsers.add_parser("imports", help="Measure the import times in fresh interpreters and check them against their budgets.")
+    imports.add_argument("--output", type=Path, default=Path("imports.json"), help="Path of the JSON report.")
+    imports.add_argument("--statements", nargs="+", default=list(IMPORT_BUDGETS), help="Import statements to measure.")
+    imports.add_argument("--repeat", type=int, default=3, help="Number of fresh interpreters per statement.")
+    imports.set_defaults(func=_imports)
+
+    compare = subparsers.add_parser("compare", help="Compare two reports of the same kind.")
+    compare.add_argument("baseline", type=Path)
+    compare.add_argument("candidate", type=Path)
+    compare.add_argument("--metric", default="min", help="The measurement to compare, e.g., 'min' of micro or 'tracemalloc_multiple' of scaling reports.")
+    compare.set_defaults(func=_compare)
+
+    args = parser.parse_args(argv)
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+DTYPES = ("int64", "float64", "datetime64", "object", "category")
+OPTIONAL_DTYPES = ("string[pyarrow]",)  # require optional dependencies, so they are not benchmarked by default
+INDEX_TYPES = ("range", "shuffled", "string")
+
+_WORDS = np.array(["alpha", "beta", "gamma", "delta", "epsilon", "zeta", "eta", "theta", "iota", "kappa", "lambda", "mu"])
+
+
+def make_column(dtype: str, n_rows: int, random_generator: np.random.Generator) -> pd.Series:
+    """Returns `n_rows` synthetic values of the given dtype, one of `DTYPES` or `OPTIONAL_DTYPES`.
+
+    Strings consist of two words separated by a space, so that all string error types, including Permutate, can be applied.
+    Categorical columns contain ten such strings as categories.
+    """
+    if dtype == "int64":
+        return pd.Series(random_generator.integers(0, 1_000, n_rows))
+
+    if dtype == "float64":
+        return pd.Series(random_generator.normal(100.0, 15.0, n_rows))
+
+    if dtype == "datetime64":
+        return pd.Series(pd.Timestamp("2025-01-01") + pd.to_timedelta(random_generator.integers(0, 365 * 24 * 3600, n_rows), unit="s"))
+
+    if dtype in ("object", "category"):
+        n_unique = 10 if dtype == "category" else n_rows
+        words = random_generator.choice(_WORDS, size=(2, min(n_unique, n_rows)))
+        uniques = np.char.add(np.char.add(words[0], " "), np.char.add(words[1], np.arange(words.shape[1]).astype(str))).astype(object)
+        values = uniques if dtype == "object" else uniques[random_generator.integers(0, len(uniques), n_rows)]
+        return pd.Series(values, dtype=dtype)
+
+    if dtype == "string[pyarrow]":
+        return make_column("object", n_rows, random_generator).astype(dtype)
+
+    msg = f"Unsupported dtype {dtype}. Supported dtypes are {DTYPES + OPTIONAL_DTYPES}."
+    raise ValueError(msg)
+
+
+def make_index(index_type: str, n_rows: int, random_generator: np.random.Generator) -> pd.Index:
+    """Returns an index of `n_rows` labels of the given type, one of `INDEX_TYPES`."""
+    if index_type == "range":
+        return pd.RangeIndex(n_rows)
+
+    if index_type == "shuffled":
+        return pd.Index(random_generator.permutation(n_rows))
+
+    if index_type == "string":
+        return pd.Index(np.char.add("row-", np.arange(n_rows).astype(str)).astype(object))
+
+    msg = f"Unsupported index type {index_type}. Supported index types are {INDEX_TYPES}."
+    raise ValueError(msg)
+
+
+def make_frame(dtype: str, n_rows: int, index_type: str = "range", seed: int = 0) -> pd.DataFrame:
+    """Returns a synthetic DataFrame with the column 'x' of the given dtype and the float column 'y' that error mechanisms can condition on."""
+    random_generator = np.random.default_rng(seed)
+    index = make_index(index_type, n_rows, random_generator)
+    x = make_column(dtype, n_rows, random_generator)
+    y = make_column("float64", n_rows, random_generator)
+
+    return pd.DataFrame({"x": x.array, "y": y.array}, index=index)
+
+
+def make_mixed_frame(n_rows: int, n_columns: int, seed: int = 0) -> pd.DataFrame:
+    """Returns a synthetic DataFrame whose columns cycle through all `DTYPES`, named after their position and dtype, e.g., '0_int64'."""
+    random_generator = np.random.default_rng(seed)
+    columns = {f"{i}_{DTYPES[i % len(DTYPES)]}": make_column(DTYPES[i % len(DTYPES)], n_rows, random_generator).array for i in range(n_columns)}
+    return pd.DataFrame(columns)
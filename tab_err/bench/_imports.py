@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import dataclasses
+import json
+import subprocess
+import sys
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+IMPORT_BUDGETS: dict[str, float | None] = {
+    "import tab_err": 0.05,
+    "from tab_err.error_type import Typo": None,
+    "from tab_err.api import mid_level": None,
+    "from tab_err.api import high_level": None,
+}
+"""The measured import statements and their budgets in seconds. Statements that import pandas have no budget, as pandas dominates them."""
+
+_MEASURE = """
+import json, sys, time
+before = set(sys.modules)
+start = time.perf_counter()
+exec(sys.argv[1])
+elapsed = time.perf_counter() - start
+print(json.dumps([elapsed, sorted({name.split(".")[0] for name in set(sys.modules) - before})]))
+"""
+
+
+@dataclasses.dataclass
+class ImportResult:
+    """Measurements of one import statement in fresh interpreters.
+
+    Attributes:
+        statement (str): The import statement.
+        times (list[float]): Wall times of the statement in seconds, one per fresh interpreter.
+        packages (list[str]): The top-level packages the statement imported, e.g., whether it imported pandas.
+        budget (float | None): The budget of the statement in seconds, None if it has none.
+    """
+
+    statement: str
+    times: list[float]
+    packages: list[str]
+    budget: float | None
+
+    @property
+    def within_budget(self: ImportResult) -> bool:
+        """Whether the fastest import stayed within the budget. Statements without budget are always within it."""
+        return self.budget is None or min(self.times) <= self.budget
+
+    def to_dict(self: ImportResult) -> dict[str, Any]:
+        """Serializes the ImportResult to a dict, including the minimal time and whether it stayed within the budget."""
+        return {**dataclasses.asdict(self), "min": min(self.times), "within_budget": self.within_budget}
+
+
+def measure_import(statement: str, repeat: int = 3) -> ImportResult:
+    """Measures the wall time of an import statement in `repeat` fresh interpreters, so that no module is imported before."""
+    times = []
+    packages: list[str] = []
+    for _ in range(repeat):
+        completed = subprocess.run([sys.executable, "-c", _MEASURE, statement], capture_output=True, text=True, check=True)  # noqa: S603
+        elapsed, packages = json.loads(completed.stdout)
+        times.append(elapsed)
+
+    return ImportResult(statement, times, packages, IMPORT_BUDGETS.get(statement))
+
+
+def run_import_benchmarks(statements: Sequence[str] = tuple(IMPORT_BUDGETS), repeat: int = 3) -> list[ImportResult]:
+    """Measures the import statements, by default all of `IMPORT_BUDGETS`."""
+    return [measure_import(statement, repeat) for statement in statements]
@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+import dataclasses
+import time
+import tracemalloc
+import warnings
+from typing import TYPE_CHECKING, Any, Callable
+
+from tab_err import error_mechanism, error_type
+from tab_err.bench._data import DTYPES, INDEX_TYPES, make_frame
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
+    import pandas as pd
+
+    from tab_err import ErrorMechanism, ErrorType
+
+SIZES = (10**3, 10**4, 10**5, 10**6, 10**7)
+ERROR_RATES = (0.01, 0.1, 0.5)
+
+ERROR_TYPES: dict[str, Callable[[], ErrorType]] = {
+    "AddDelta": lambda: error_type.AddDelta(seed=0),
+    "CategorySwap": lambda: error_type.CategorySwap(seed=0),
+    "Extraneous": lambda: error_type.Extraneous(seed=0),
+    "MissingValue": lambda: error_type.MissingValue(seed=0),
+    "Mistype": lambda: error_type.Mistype(seed=0),
+    "Mojibake": lambda: error_type.Mojibake(seed=0),
+    "Outlier": lambda: error_type.Outlier(seed=0),
+    "Permutate": lambda: error_type.Permutate(seed=0),
+    "Replace": lambda: error_type.Replace(config={"replace_what": "a", "replace_with": "4"}, seed=0),
+    "Typo": lambda: error_type.Typo(seed=0),
+    "WrongUnit": lambda: error_type.WrongUnit(seed=0),
+}
+
+ERROR_MECHANISMS: dict[str, Callable[[], ErrorMechanism]] = {
+    "ECAR": lambda: error_mechanism.ECAR(seed=0),
+    "ENAR": lambda: error_mechanism.ENAR(seed=0),
+    "EAR": lambda: error_mechanism.EAR(condition_to_column="x", seed=0),
+    "SoftENAR": lambda: error_mechanism.SoftENAR(seed=0),
+}
+
+
+@dataclasses.dataclass
+class BenchmarkResult:
+    """Measurements of one benchmark case.
+
+    Attributes:
+        benchmark (str): Name of the benchmark, e.g., 'error_type/Typo' or 'error_mechanism/ENAR'.
+        dtype (str): The dtype of the column that errors are inserted into.
+        n_rows (int): Number of rows of the synthetic DataFrame.
+        error_rate (float): The error rate of the case.
+        index_type (str): The type of the DataFrame's index.
+        times (list[float]): Wall times of the repetitions in seconds.
+        tracemalloc_peak (int | None): Peak of the memory allocated during an additional repetition, traced by tracemalloc. None if the
+            case failed.
+        error (str | None): The error message if the case failed, None otherwise.
+    """
+
+    benchmark: str
+    dtype: str
+    n_rows: int
+    error_rate: float
+    index_type: str
+    times: list[float] = dataclasses.field(default_factory=list)
+    tracemalloc_peak: int | None = None
+    error: str | None = None
+
+    @property
+    def key(self: BenchmarkResult) -> tuple[str, str, int, float, str]:
+        """Identifies the case across reports."""
+        return (self.benchmark, self.dtype, self.n_rows, self.error_rate, self.index_type)
+
+    def to_dict(self: BenchmarkResult) -> dict[str, Any]:
+        """Serializes the BenchmarkResult to a dict, including the minimum and median time."""
+        times = sorted(self.times)
+        return {
+            **dataclasses.asdict(self),
+            "min": times[0] if times else None,
+            "median": times[len(times) // 2] if times else None,
+        }
+
+
+def _time(setup: Callable[[], Callable[[], Any]], repeat: int) -> list[float]:
+    """Calls the function returned by `setup` `repeat` times and returns the wall time of each call, excluding the setup."""
+    times = []
+    for _ in range(repeat):
+        function = setup()
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+
+    return times
+
+
+def _trace(setup: Callable[[], Callable[[], Any]]) -> int:
+    """Calls the function returned by `setup` once while tracemalloc traces it and returns the peak of the allocated memory."""
+    function = setup()
+    tracemalloc.start()
+    try:
+        function()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def _run_case(result: BenchmarkResult, setup: Callable[[], Callable[[], Any]], repeat: int) -> BenchmarkResult:
+    try:
+        result.times = _time(setup, repeat)
+        result.tracemalloc_peak = _trace(setup)
+    except (TypeError, ValueError) as error:
+        result.error = f"{type(error).__name__}: {error}"
+
+    return result
+
+
+def _error_type_setup(factory: Callable[[], ErrorType], data: pd.DataFrame, error_mask: pd.DataFrame) -> Callable[[], Callable[[], Any]]:
+    def setup() -> Callable[[], Any]:
+        instance = factory()
+        return lambda: instance.apply(data, error_mask, "x")
+
+    return setup
+
+
+def _error_mechanism_setup(factory: Callable[[], ErrorMechanism], data: pd.DataFrame, error_rate: float) -> Callable[[], Callable[[], Any]]:
+    def setup() -> Callable[[], Any]:
+        instance = factory()
+        column = "y" if instance.condition_to_column == "x" else "x"  # EAR samples 'y' conditioned on the benchmarked column
+        return lambda: instance.sample(data, column, error_rate)
+
+    return setup
+
+
+def run_micro_benchmarks(  # noqa: PLR0913
+    *,
+    sizes: Sequence[int] = SIZES,
+    dtypes: Sequence[str] = DTYPES,
+    error_rates: Sequence[float] = ERROR_RATES,
+    index_types: Sequence[str] = INDEX_TYPES,
+    repeat: int = 3,
+    selection: Iterable[str] | None = None,
+) -> list[BenchmarkResult]:
+    """Benchmarks every ErrorType and ErrorMechanism on synthetic columns.
+
+    ErrorTypes are applied to the cells of a mask that ECAR sampled beforehand, and only to columns whose dtype they support.
+    Each repetition uses a new instance, so that no state, e.g., cached sort orders, is carried over between repetitions.
+    The peak memory is traced in an additional repetition, so that tracing does not slow down the timed ones.
+
+    Args:
+        sizes (Sequence[int], optional): Numbers of rows. Defaults to 1e3 to 1e7 rows.
+        dtypes (Sequence[str], optional): dtypes of the column errors are inserted into, elements of `DTYPES`. Defaults to all.
+        error_rates (Sequence[float], optional): Error rates. Defaults to 0.01, 0.1, and 0.5.
+        index_types (Sequence[str], optional): Types of the DataFrame's index, elements of `INDEX_TYPES`. Defaults to all.
+        repeat (int, optional): Number of repetitions of each case. Defaults to 3.
+        selection (Iterable[str] | None, optional): Names of the ErrorTypes and ErrorMechanisms to benchmark. Defaults to None, i.e., all.
+
+    Returns:
+        list[BenchmarkResult]: The measurements of all cases.
+    """
+    selected = set(selection) if selection is not None else set(ERROR_TYPES) | set(ERROR_MECHANISMS)
+    results = []
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")  # error types warn about their default configurations
+
+        for n_rows in sizes:
+            for dtype in dtypes:
+                for index_type in index_types:
+                    data = make_frame(dtype, n_rows, index_type)
+
+                    for error_rate in error_rates:
+                        error_mask = error_mechanism.ECAR(seed=0).sample(data, "x", error_rate)
+
+                        for name, type_factory in ERROR_TYPES.items():
+                            if name not in selected:
+                                continue
+
+                            try:
+                                type_factory().check_dtype(data["x"].dtype, "x")
+                            except (TypeError, ValueError):
+                                continue
+
+                            result = BenchmarkResult(f"error_type/{name}", dtype, n_rows, error_rate, index_type)
+                            results.append(_run_case(result, _error_type_setup(type_factory, data, error_mask), repeat))
+
+                        for name, mechanism_factory in ERROR_MECHANISMS.items():
+                            if name in selected:
+                                result = BenchmarkResult(f"error_mechanism/{name}", dtype, n_rows, error_rate, index_type)
+                                results.append(_run_case(result, _error_mechanism_setup(mechanism_factory, data, error_rate), repeat))
+
+    return results
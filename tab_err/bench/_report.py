@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import datetime as dt
+import json
+import platform
+import sys
+from importlib.metadata import PackageNotFoundError, version
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _package_version(package: str) -> str | None:
+    try:
+        return version(package)
+    except PackageNotFoundError:
+        return None
+
+
+def collect_metadata() -> dict[str, Any]:
+    """Returns the environment of a benchmark run, so that reports of different machines or versions can be told apart."""
+    return {
+        "timestamp": dt.datetime.now(tz=dt.timezone.utc).isoformat(),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "tab_err": _package_version("tab_err"),
+        "pandas": _package_version("pandas"),
+        "numpy": _package_version("numpy"),
+    }
+
+
+def write_report(path: Path, kind: str, results: list[dict[str, Any]]) -> None:
+    """Writes the results of a benchmark run together with its metadata to a JSON file."""
+    report = {"kind": kind, "metadata": collect_metadata(), "results": results}
+    path.write_text(json.dumps(report, indent=2, default=str))
+
+
+def read_report(path: Path) -> dict[str, Any]:
+    """Reads a report written by `write_report`."""
+    return json.loads(path.read_text())
+
+
+def compare_reports(baseline: dict[str, Any], candidate: dict[str, Any], key_fields: tuple[str, ...], metric: str) -> list[dict[str, Any]]:
+    """Matches the results of two reports by `key_fields` and returns the ratio candidate / baseline of `metric` for each match.
+
+    Ratios above 1 mean that the candidate is slower or uses more memory than the baseline.
+    """
+    baseline_results = {tuple(result[field] for field in key_fields): result for result in baseline["results"]}
+    comparison = []
+
+    for result in candidate["results"]:
+        key = tuple(result[field] for field in key_fields)
+        if key not in baseline_results or not result.get(metric) or not baseline_results[key].get(metric):
+            continue
+
+        comparison.append(
+            {
+                **dict(zip(key_fields, key)),
+                "baseline": baseline_results[key][metric],
+                "candidate": result[metric],
+                "ratio": result[metric] / baseline_results[key][metric],
+            }
+        )
+
+    return comparison
@@ -0,0 +1,214 @@
+from __future__ import annotations
+
+import contextlib
+import dataclasses
+import multiprocessing
+import sys
+import time
+import tracemalloc
+import warnings
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable
+
+from tab_err import ErrorModel, error_mechanism, error_type
+from tab_err.api import MidLevelConfig, high_level, low_level, mid_level, parallel
+from tab_err.bench._data import make_mixed_frame
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    import pandas as pd
+
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None  # type: ignore[assignment]
+
+APIS = ("low_level", "mid_level", "high_level", "parallel")
+ROWS = (10**4, 10**5, 10**6)
+COLUMNS = (5, 20)
+MODELS_PER_COLUMN = (1, 2, 4)
+
+# Error types that the mid-level benchmark applies, in this order, to the columns whose dtype they support
+_MID_LEVEL_ERROR_TYPES = (error_type.CategorySwap, error_type.Typo, error_type.Outlier, error_type.AddDelta, error_type.MissingValue)
+
+
+@dataclasses.dataclass
+class ScalingResult:
+    """Measurements of one end-to-end case.
+
+    Attributes:
+        api (str): The API that was called, one of `APIS`.
+        n_rows (int): Number of rows of the synthetic DataFrame.
+        n_columns (int): Number of columns of the synthetic DataFrame.
+        n_error_models_per_column (int): Number of error models per column. The low-level API always applies one error model to one column.
+        input_bytes (int): Memory used by the synthetic DataFrame.
+        wall_time (float | None): Wall time of the call in seconds, measured without tracing memory allocations. None if the call failed.
+        tracemalloc_peak (int | None): Peak of the memory allocated during the call, traced by tracemalloc. None if the call failed.
+        rss_peak (int | None): Growth of the resident set size of the process from the start of the call to its peak, None if it cannot be measured.
+            Only Linux allows resetting the peak, elsewhere it is a lower bound that is only meaningful when the case runs in a fresh process.
+            The memory of the worker processes of the parallel API is not included.
+        error (str | None): The error message if the call failed, None otherwise.
+    """
+
+    api: str
+    n_rows: int
+    n_columns: int
+    n_error_models_per_column: int
+    input_bytes: int
+    wall_time: float | None = None
+    tracemalloc_peak: int | None = None
+    rss_peak: int | None = None
+    error: str | None = None
+
+    def to_dict(self: ScalingResult) -> dict[str, Any]:
+        """Serializes the ScalingResult to a dict, including the peak memory as multiple of the input size."""
+        return {
+            **dataclasses.asdict(self),
+            "tracemalloc_multiple": self.tracemalloc_peak / self.input_bytes if self.tracemalloc_peak is not None else None,
+            "rss_multiple": self.rss_peak / self.input_bytes if self.rss_peak is not None else None,
+        }
+
+
+def _mid_level_config(data: pd.DataFrame, n_error_models_per_column: int, error_rate: float) -> MidLevelConfig:
+    """Returns a config that applies the first supported error type of `_MID_LEVEL_ERROR_TYPES` with ECAR to every column."""
+    columns = {}
+    for column in data.columns:
+        for error_type_class in _MID_LEVEL_ERROR_TYPES:
+            try:
+                error_type_class().check_dtype(data[column].dtype, column)
+            except (TypeError, ValueError):
+                continue
+
+            columns[column] = [
+                ErrorModel(error_mechanism.ECAR(seed=i), error_type_class(seed=i), error_rate / n_error_models_per_column)
+                for i in range(n_error_models_per_column)
+            ]
+            break
+
+    return MidLevelConfig(columns)
+
+
+def _api_call(api: str, data: pd.DataFrame, n_error_models_per_column: int, error_rate: float) -> Callable[[], Any]:
+    if api == "low_level":
+        return lambda: low_level.create_errors(data, data.columns[0], error_rate, error_mechanism.ENAR(seed=0), error_type.AddDelta(seed=0))
+
+    if api == "mid_level":
+        config = _mid_level_config(data, n_error_models_per_column, error_rate)
+        return lambda: mid_level.create_errors(data, config)
+
+    if api == "high_level":
+        return lambda: high_level.create_errors(data, error_rate, n_error_models_per_column=n_error_models_per_column, seed=0)
+
+    if api == "parallel":
+        config = _mid_level_config(data, n_error_models_per_column, error_rate)
+        return lambda: parallel.create_errors(data, config)
+
+    msg = f"Unsupported API {api}. Supported APIs are {APIS}."
+    raise ValueError(msg)
+
+
+def _read_proc_status(field: str) -> int | None:
+    """Returns a memory field of /proc/self/status in bytes, None if it cannot be read, e.g., on other operating systems than Linux."""
+    try:
+        with Path("/proc/self/status").open() as status:
+            for line in status:
+                if line.startswith(f"{field}:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        return None
+
+    return None
+
+
+def _reset_peak_rss() -> None:
+    """Resets the peak resident set size of the process on Linux. Elsewhere, the peak of the whole process lifetime is measured."""
+    with contextlib.suppress(OSError):
+        Path("/proc/self/clear_refs").write_text("5")
+
+
+def _peak_rss() -> int | None:
+    """Returns the peak resident set size of the process in bytes, None if it cannot be measured."""
+    peak_rss = _read_proc_status("VmHWM")
+    if peak_rss is not None or resource is None:
+        return peak_rss
+
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return max_rss if sys.platform == "darwin" else max_rss * 1024  # bytes on macOS, kilobytes elsewhere
+
+
+def run_scaling_case(api: str, n_rows: int, n_columns: int, n_error_models_per_column: int, error_rate: float = 0.1) -> ScalingResult:
+    """Measures the wall time and peak memory of one call of an API on a synthetic DataFrame with mixed dtypes.
+
+    The growth of the resident set size is most accurate if the case runs in a fresh process, see `run_scaling_benchmarks`.
+    """
+    data = make_mixed_frame(n_rows, n_columns)
+    result = ScalingResult(api, n_rows, n_columns, n_error_models_per_column, input_bytes=int(data.memory_usage(deep=True).sum()))
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")  # error types warn about their default configurations
+
+        try:
+            call = _api_call(api, data, n_error_models_per_column, error_rate)
+            _reset_peak_rss()
+            rss_before = _read_proc_status("VmRSS") or _peak_rss()
+            start = time.perf_counter()
+            call()
+            result.wall_time = time.perf_counter() - start
+            rss_after = _peak_rss()
+            result.rss_peak = rss_after - rss_before if rss_before is not None and rss_after is not None else None
+
+            call = _api_call(api, data, n_error_models_per_column, error_rate)
+            tracemalloc.start()
+            try:
+                call()
+                _, result.tracemalloc_peak = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+        except (TypeError, ValueError) as error:
+            result.error = f"{type(error).__name__}: {error}"
+
+    return result
+
+
+def run_scaling_benchmarks(  # noqa: PLR0913
+    *,
+    apis: Sequence[str] = APIS,
+    rows: Sequence[int] = ROWS,
+    columns: Sequence[int] = COLUMNS,
+    models_per_column: Sequence[int] = MODELS_PER_COLUMN,
+    error_rate: float = 0.1,
+    isolate: bool = True,
+) -> list[ScalingResult]:
+    """Sweeps the APIs over the numbers of rows, columns, and error models per column of synthetic DataFrames with mixed dtypes.
+
+    Args:
+        apis (Sequence[str], optional): The APIs to benchmark, elements of `APIS`. Defaults to all.
+        rows (Sequence[int], optional): Numbers of rows. Defaults to 1e4 to 1e6.
+        columns (Sequence[int], optional): Numbers of columns. Defaults to 5 and 20.
+        models_per_column (Sequence[int], optional): Numbers of error models per column. Defaults to 1, 2, and 4.
+        error_rate (float, optional): The error rate of each column. Defaults to 0.1.
+        isolate (bool, optional): Whether to run every case in a fresh process, so that cases do not share memory and, outside of
+            Linux, the growth of the resident set size can be measured. Defaults to True.
+
+    Returns:
+        list[ScalingResult]: The measurements of all cases.
+    """
+    cases = [
+        (api, n_rows, n_columns, n_models if api != "low_level" else 1)
+        for api in apis
+        for n_rows in rows
+        for n_columns in columns
+        for n_models in (models_per_column if api != "low_level" else models_per_column[:1])
+    ]
+
+    if not isolate:
+        return [run_scaling_case(*case, error_rate=error_rate) for case in cases]
+
+    results = []
+    context = multiprocessing.get_context("spawn")
+    for case in cases:
+        with context.Pool(processes=1, maxtasksperchild=1) as pool:
+            results.append(pool.apply(run_scaling_case, (*case, error_rate)))
+
+    return results
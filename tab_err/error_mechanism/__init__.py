@@ -1,3 +1,23 @@
-from tab_err.error_mechanism._ear import EAR
-from tab_err.error_mechanism._ecar import ECAR
-from tab_err.error_mechanism._enar import ENAR
+from typing import TYPE_CHECKING
+
+from tab_err._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    attributes={
+        "EAR": "._ear",
+        "ECAR": "._ecar",
+        "ENAR": "._enar",
+        "ErrorMechanism": "._error_mechanism",
+        "RowCorrelated": "._row_correlated",
+        "SoftENAR": "._soft_enar",
+    },
+)
+
+if TYPE_CHECKING:
+    from tab_err.error_mechanism._ear import EAR
+    from tab_err.error_mechanism._ecar import ECAR
+    from tab_err.error_mechanism._enar import ENAR
+    from tab_err.error_mechanism._error_mechanism import ErrorMechanism
+    from tab_err.error_mechanism._row_correlated import RowCorrelated
+    from tab_err.error_mechanism._soft_enar import SoftENAR
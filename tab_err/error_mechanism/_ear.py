@@ -3,11 +3,14 @@ from __future__ import annotations
 import warnings
 from typing import TYPE_CHECKING
 
-from tab_err._utils import check_error_rate, get_column, get_column_str
+from tab_err._utils import get_column_label, get_column_labels
 
 from ._error_mechanism import ErrorMechanism
 
 if TYPE_CHECKING:
+    from collections.abc import Hashable
+
+    import numpy as np
     import pandas as pd
 
 
@@ -18,64 +21,57 @@ class EAR(ErrorMechanism):
         Errors are assumed to be completely independent of the data distribution
     """
 
-    def _sample(self: EAR, data: pd.DataFrame, column: str | int, error_rate: float, error_mask: pd.DataFrame) -> pd.DataFrame:
-        """Creates an error mask according to the `Erroneous At Random` error mechanism.
+    def _sample_positions(self: EAR, data: pd.DataFrame | np.ndarray, column: str | int, n_errors: int, error_free: np.ndarray) -> np.ndarray:
+        """Selects cells according to the `Erroneous At Random` error mechanism.
 
         Description:
             A random index is chosen using a random number generator to create a range of indices.
-            The error free data is then sorted by the value in the conditioning column and the error mask is generated by selecting a contiguous block of
-                sorted entries, thereby having similar values, and marking these entries `True` in the mask.
+            The error free data is then sorted by the value in the conditioning column and the cells are selected as a contiguous block of
+                sorted entries, thereby having similar values.
+            If `condition_to_column` is a list of columns, the data is sorted by the first column, then by the second one, and so on,
+                so that errors depend on combinations of values, e.g., of a region and a date.
             This ensures that occurrence of errors is related to the value of the another `column`.
 
         Args:
-            data (pd.DataFrame): `DataFrame` containins the column to add errors to
-            column (str | int): The column of `data` to create an error mask for
-            error_rate (float): Proportion of rows to be affected by errors; in ranse [0,1]
-            error_mask (pd.DataFrame): A Pandas `DataFrame` with the same index & columns as `data` that will be modified and returned
+            data (pd.DataFrame | np.ndarray): `DataFrame` containins the column to add errors to, or a numeric 2-D or structured array
+            column (str | int): The column of `data` to select cells of
+            n_errors (int): Number of cells to select
+            error_free (np.ndarray): Boolean array that is `True` at the rows whose cell in `column` does not contain an error yet
 
         Raises:
             ValueError: If there are fewer than two columns in `data`, a `ValueError` will be returned
-            ValueError: If there are insufficient entries to add errors to with respect to the error rate, a `ValueError` will be returned
 
         Returns:
-            pd.DataFrame: A Pandas `DataFrame` with `True` values at entries where an error should be introduced, `False` otherwise
+            np.ndarray: Row positions of the selected cells, sorted by the values in the conditioning columns
         """
-        check_error_rate(error_rate)
+        return self._select_block(data, self._get_block_columns(data, column), n_errors, error_free)
 
-        if len(data.columns) < 2:  # noqa: PLR2004
-            msg = "The data into which error at random (EAR) are to be injected requires at least 2 columns."
-            raise ValueError(msg)
+    def _get_block_columns(self: EAR, data: pd.DataFrame | np.ndarray, column: str | int) -> tuple[Hashable, ...]:
+        """EAR selects a block of the values sorted by `condition_to_column`, which is drawn randomly from the other columns if it is None.
 
-        if self.condition_to_column is None:
-            col = get_column_str(data, column)
-            column_selection = [x for x in data.columns if x != col]
-            condition_to_column = self._random_generator.choice(column_selection)
-            warnings.warn(
-                "The user did not specify 'condition_to_column', the column on which the EAR Mechanism conditions the error distribution. "
-                + f"Randomly select column '{condition_to_column}'.",
-                stacklevel=1,
-            )
-        else:
-            condition_to_column = get_column_str(data, self.condition_to_column)
-
-        se_data = get_column(data, column)
-        se_mask = get_column(error_mask, column)
-        n_errors = int(se_data.size * error_rate)
-
-        se_mask_error_free = se_mask[~se_mask]
-        data_column_error_free = data.loc[se_mask_error_free.index, :]
-
-        if len(se_mask_error_free) < n_errors:
-            msg = f"The error rate of {error_rate} requires {n_errors} error-free cells. "
-            msg += f"However, only {len(se_mask_error_free)} error-free cells are available."
+        Raises:
+            ValueError: If there are fewer than two columns in `data`, or `condition_to_column` is an empty list, a `ValueError` will be returned
+        """
+        if len(get_column_labels(data)) < 2:  # noqa: PLR2004
+            msg = "The data into which error at random (EAR) are to be injected requires at least 2 columns."
             raise ValueError(msg)
 
-        # we offset the upper bound of the lower_error_index by a) the existing number of errors in the row, and b) the number of errors to-be generated.
-        upper_bound = len(se_data) - sum(se_mask) - n_errors  # upper bound = length of data - current number of errors - number of errors to be generated
-        lower_error_index = self._random_generator.integers(0, upper_bound) if upper_bound > 0 else 0
-        error_index_range = range(lower_error_index, lower_error_index + n_errors)
-        selected_rows = data_column_error_free.sort_values(by=condition_to_column).iloc[error_index_range, :]  # Sort by the condition_to_column values
-
-        se_mask.loc[selected_rows.index] = True
-
-        return error_mask
+        if isinstance(self.condition_to_column, list):
+            if len(self.condition_to_column) == 0:
+                msg = "'condition_to_column' needs to contain at least one column if it is a list."
+                raise ValueError(msg)
+
+            return tuple(get_column_label(data, condition) for condition in self.condition_to_column)
+
+        if self.condition_to_column is not None:
+            return (get_column_label(data, self.condition_to_column),)
+
+        col = get_column_label(data, column)
+        column_selection = [x for x in get_column_labels(data) if x != col]
+        condition_to_column = self._random_generator.choice(column_selection)  # type: ignore[arg-type]
+        warnings.warn(
+            "The user did not specify 'condition_to_column', the column on which the EAR Mechanism conditions the error distribution. "
+            + f"Randomly select column '{condition_to_column}'.",
+            stacklevel=1,
+        )
+        return (condition_to_column,)
@@ -1,30 +1,65 @@
 from __future__ import annotations
 
-from abc import ABC, abstractmethod
+from abc import ABC
 from typing import TYPE_CHECKING
 
+import numpy as np
 import pandas as pd
 
-from tab_err._utils import seed_randomness_and_get_generator
+from tab_err._observer import Stage
+from tab_err._polars import PolarsColumns, accepts_polars_columns
+from tab_err._utils import (
+    SortOrderCache,
+    check_error_rate,
+    check_error_rates_ascending,
+    count_errors,
+    get_column,
+    get_column_label,
+    get_column_labels,
+    get_column_str,
+    get_numeric_sort_keys,
+    get_sort_order,
+    seed_randomness_and_get_generator,
+)
 
 if TYPE_CHECKING:
-    import numpy as np
+    from collections.abc import Hashable, Sequence
 
+    from tab_err._observer import Observer
 
-class ErrorMechanism(ABC):
-    """Error Mechanism Abstract Base Class."""
 
-    def __init__(self: ErrorMechanism, condition_to_column: int | str | None = None, seed: int | None = None) -> None:
+APPROXIMATE_SAMPLE_SIZE = 10_000
+"""Number of values that approximate block selection samples to choose the value at which a block starts."""
+
+
+class ErrorMechanism(ABC):  # noqa: B024
+    """Error Mechanism Abstract Base Class.
+
+    Subclasses implement `_sample_positions`. Subclasses of earlier versions that implement
+    `_sample(data, column, error_rate, error_mask) -> pd.DataFrame` instead, which marks the selected cells in 'error_mask', are still supported
+    for DataFrames. Their cells are ordered by row, and arrays and the parallel API are not supported for them.
+    """
+
+    def __init__(
+        self: ErrorMechanism, condition_to_column: int | str | list[int | str] | None = None, seed: int | None = None, *, approximate: bool = False
+    ) -> None:
         """Initialization method of the Error Mechanism class; defines the general initialization for ErrorMechanism objects.
 
         Args:
-            condition_to_column (int | str | None, optional): For EAR class implementation, determines which column errors are derived from. Defaults to None.
+            condition_to_column (int | str | list[int | str] | None, optional): For EAR class implementation, determines which column errors are
+                derived from. A list of columns orders the rows by the first column, then by the second one, and so on. Defaults to None.
             seed (int | None, optional): Random seed. Defaults to None.
+            approximate (bool, optional): For ENAR and EAR, selects blocks of numeric, datetime, or categorical columns without sorting them,
+                see `_select_approximate_block`. Defaults to False.
 
         Attributes:
-            condition_to_column (int | str | None, optional): For EAR class implementation, determines which column errors are derived from. Defaults to None.
+            condition_to_column (int | str | list[int | str] | None, optional): For EAR class implementation, determines which columns errors are
+                derived from. Defaults to None.
+            approximate (bool): For ENAR and EAR, whether blocks are selected approximately.
             _seed (int | None, optional): Random seed. Defaults to None.
             _random_generator (np.random.Generator): The random error generator for choosing entries at which to generate an error.
+            _sort_order_cache (SortOrderCache | None): Sort orders of the sampled DataFrame's columns, reused across calls of `sample` if it is
+                set, e.g., to the shared cache of `high_level.create_errors_many`. Defaults to None, i.e., every call sorts.
 
         Raises:
             TypeError: Raised if the seed is not int or None.
@@ -34,29 +69,36 @@ class ErrorMechanism(ABC):
             raise TypeError(msg)
 
         self.condition_to_column = condition_to_column
+        self.approximate = approximate
 
         self._seed = seed
         self._random_generator: np.random.Generator
+        self._sort_order_cache: SortOrderCache | None = None
 
+    @accepts_polars_columns
     def sample(
         self: ErrorMechanism,
         data: pd.DataFrame,
         column: str | int,
         error_rate: float,
         error_mask: pd.DataFrame | None = None,
+        observer: Observer | None = None,
     ) -> pd.DataFrame:
         """Returns an error mask for locations to introduce errors in a pandas DataFrame.
 
         Description:
-            Does error checking for the abstract method '_sample'.
+            Checks the arguments and creates an empty error mask if none is given.
             Assigns the _random_generator attribute.
-            Calls subclass _sample method.
+            Marks the cells selected by the _sample_priority method, which calls the subclass _sample_positions method, or the
+                `_sample` method of subclasses that implement the error mask based interface of earlier versions.
 
         Args:
-            data (pd.DataFrame): DataFrame containing the column to add errors to
+            data (pd.DataFrame): DataFrame containing the column to add errors to. Of a polars.DataFrame, only the columns that are sampled by are
+                converted to pandas, and the mask is returned as polars.DataFrame.
             column (str | int): The column of 'data' to create an error mask for
             error_rate (float): Percentage of rows to be affected by errors in range [0,1].
             error_mask (pd.DataFrame | None, optional): An existing error mask to add more errors to in the case of the mid-/high-level APIs. Defaults to None.
+            observer (Observer | None, optional): Receives a StageEvent of the sampling, e.g., a StageCollector. Defaults to None.
 
         Raises:
             ValueError: If error rate is out of the [0,1] interval, a ValueError is thrown
@@ -66,11 +108,137 @@ class ErrorMechanism(ABC):
         Returns:
             pd.DataFrame: Updated dataframe with the generated error mask
         """
+        error_mask = self._prepare_sampling(data, error_rate, error_mask)
+        if observer is None:
+            return self._mark_positions(error_mask, column, self._sample_priority(data, column, error_rate, error_mask))
+
+        with Stage(observer, "ErrorMechanism.sample", type(self).__name__, column, n_cells=len(data)) as stage:
+            positions = self._sample_priority(data, column, error_rate, error_mask)
+            error_mask = self._mark_positions(error_mask, column, positions)
+            stage.n_changed = len(positions)
+
+        return error_mask
+
+    @accepts_polars_columns
+    def sample_priority(
+        self: ErrorMechanism,
+        data: pd.DataFrame,
+        column: str | int,
+        error_rate: float,
+        error_mask: pd.DataFrame | None = None,
+        observer: Observer | None = None,
+    ) -> np.ndarray:
+        """Returns the row positions that `sample` marks as erroneous, in the order of their priority.
+
+        Description:
+            Every prefix of the returned positions is a valid sample for a lower error rate. Masks that are derived from prefixes
+            are therefore nested, i.e., every cell that is erroneous at a lower error rate is also erroneous at a higher one.
+
+        Args:
+            data (pd.DataFrame): DataFrame containing the column to add errors to
+            column (str | int): The column of 'data' to create an error mask for
+            error_rate (float): Percentage of rows to be affected by errors in range [0,1].
+            error_mask (pd.DataFrame | None, optional): An existing error mask whose erroneous cells are excluded from sampling. Defaults to None.
+            observer (Observer | None, optional): Receives a StageEvent of the sampling, e.g., a StageCollector. Defaults to None.
+
+        Returns:
+            np.ndarray: Row positions of `int(len(data) * error_rate)` error-free cells of 'column', ordered by priority.
+        """
+        error_mask = self._prepare_sampling(data, error_rate, error_mask)
+        if observer is None:
+            return self._sample_priority(data, column, error_rate, error_mask)
+
+        with Stage(observer, "ErrorMechanism.sample", type(self).__name__, column, n_cells=len(data)) as stage:
+            positions = self._sample_priority(data, column, error_rate, error_mask)
+            stage.n_changed = len(positions)
+
+        return positions
+
+    @accepts_polars_columns
+    def sample_sweep(
+        self: ErrorMechanism,
+        data: pd.DataFrame,
+        column: str | int,
+        error_rates: Sequence[float],
+        error_mask: pd.DataFrame | None = None,
+    ) -> list[pd.DataFrame]:
+        """Returns one nested error mask per error rate, drawing the random priority of the cells only once.
+
+        Description:
+            The cells are sampled once at the highest error rate using `sample_priority`, and the mask of each error rate marks
+            a prefix of them. ECAR draws a uniform random order of the cells, whereas ENAR and EAR select one contiguous block
+            of sorted values whose lower part is used for lower error rates.
+
+        Args:
+            data (pd.DataFrame): DataFrame containing the column to add errors to
+            column (str | int): The column of 'data' to create error masks for
+            error_rates (Sequence[float]): Percentages of rows to be affected by errors in range [0,1], sorted in ascending order.
+            error_mask (pd.DataFrame | None, optional): An existing error mask to add more errors to. It is not modified. Defaults to None.
+
+        Raises:
+            ValueError: If 'error_rates' is empty, not sorted in ascending order, or contains an error rate out of the [0,1] interval.
+
+        Returns:
+            list[pd.DataFrame]: One error mask per element of 'error_rates', in the same order.
+        """
+        check_error_rates_ascending(error_rates)
+
+        error_mask = self._prepare_sampling(data, error_rates[-1], error_mask)
+        positions = self._sample_priority(data, column, error_rates[-1], error_mask)
+        column_position = error_mask.columns.get_loc(get_column_str(error_mask, column))
+
+        masks = []
+        for error_rate in error_rates:
+            mask = error_mask.copy()
+            mask.iloc[positions[: int(len(mask) * error_rate)], column_position] = True
+            masks.append(mask)
+
+        return masks
+
+    def sample_array_priority(
+        self: ErrorMechanism,
+        data: np.ndarray,
+        column: str | int,
+        error_rate: float,
+        error_mask: np.ndarray | None = None,
+    ) -> np.ndarray:
+        """NumPy counterpart of `sample_priority` that samples cells of a numeric 2-D array or structured array without creating pandas objects.
+
+        Args:
+            data (np.ndarray): A 2-D array, or a 1-D structured array whose fields are the columns
+            column (str | int): The column position of a 2-D array, or the field name or position of a structured array
+            error_rate (float): Percentage of rows to be affected by errors in range [0,1].
+            error_mask (np.ndarray | None, optional): A boolean array of shape (rows, columns) whose erroneous cells are excluded from sampling.
+                Defaults to None.
+
+        Raises:
+            ValueError: If the error rate is out of the [0,1] interval or the array is empty, a ValueError is thrown.
+
+        Returns:
+            np.ndarray: Row positions of `int(len(data) * error_rate)` error-free cells of 'column', ordered by priority.
+        """
+        check_error_rate(error_rate)
+        if len(data) == 0:
+            msg = "'data' needs to be a non-empty array."
+            raise ValueError(msg)
+
+        if self.condition_to_column is not None and len(get_column_labels(data)) < 2:  # noqa: PLR2004
+            msg = "'data' need at least 2 columns if 'condition_to_column' is given."
+            raise ValueError(msg)
+
+        column_position = get_column_labels(data).index(get_column_label(data, column))
+        error_free = np.ones(len(data), dtype=bool) if error_mask is None else ~error_mask[:, column_position]
+
+        self._random_generator = seed_randomness_and_get_generator(self._seed)
+        return self._sample_positions(data, column, count_errors(len(error_free), int(error_free.sum()), error_rate), error_free)
+
+    def _prepare_sampling(self: ErrorMechanism, data: pd.DataFrame, error_rate: float, error_mask: pd.DataFrame | None) -> pd.DataFrame:
+        """Checks the arguments of the sampling methods, assigns the _random_generator attribute, and returns the error mask to sample on top of."""
         if error_rate < 0 or error_rate > 1:
             error_rate_msg = "'error_rate' need to be float: 0 <= error_rate <= 1."
             raise ValueError(error_rate_msg)
 
-        if not isinstance(data, pd.DataFrame) or data.empty:
+        if not isinstance(data, (pd.DataFrame, PolarsColumns)) or data.empty:
             data_msg = "'data' needs to be a non-empty DataFrame."
             raise TypeError(data_msg)
 
@@ -87,18 +255,168 @@ class ErrorMechanism(ABC):
             error_mask = pd.DataFrame(data=False, index=data.index, columns=data.columns)
 
         self._random_generator = seed_randomness_and_get_generator(self._seed)
-        return self._sample(data, column, error_rate, error_mask)
+        return error_mask
 
-    @abstractmethod
-    def _sample(self: ErrorMechanism, data: pd.DataFrame, column: str | int, error_rate: float, error_mask: pd.DataFrame) -> pd.DataFrame:
-        """Abstract method for the creation of an error mask over a given Pandas DataFrame.
+    @staticmethod
+    def _mark_positions(error_mask: pd.DataFrame, column: str | int, positions: np.ndarray) -> pd.DataFrame:
+        """Marks the cells selected by `_sample_priority` in an error mask.
+
+        Args:
+            error_mask (pd.DataFrame): A Pandas `DataFrame` with the same index & columns as `data` that will be modified and returned
+            column (str | int): The column of `error_mask` to mark the cells of
+            positions (np.ndarray): The row positions of the cells to mark
+
+        Returns:
+            pd.DataFrame: A Pandas `DataFrame` with `True` values at entries where an error should be introduced, `False` otherwise
+        """
+        error_mask.iloc[positions, error_mask.columns.get_loc(get_column_str(error_mask, column))] = True
+        return error_mask
+
+    def _sample_priority(self: ErrorMechanism, data: pd.DataFrame, column: str | int, error_rate: float, error_mask: pd.DataFrame) -> np.ndarray:
+        """Counts the errors to insert, checks that enough error-free cells are available, and calls the subclass _sample_positions method.
 
         Args:
             data (pd.DataFrame): DataFrame containing the column to add errors to
             column (str | int): The column of `data` to create an error mask for
             error_rate (float): Proportion of rows to be affected by errors; in range [0,1]
-            error_mask (pd.DataFrame): A Pandas `DataFrame` with the same index & columns as `data` that will be modified and returned
+            error_mask (pd.DataFrame): A Pandas `DataFrame` with the same index & columns as `data` whose erroneous cells are excluded
+
+        Raises:
+            ValueError: If there are insufficient entries to add errors to with respect to the error rate, a ValueError will be returned
 
         Returns:
-            pd.DataFrame: A Pandas `DataFrame` with `True` values at entries where an error should be introduced, `False` otherwise
+            np.ndarray: Row positions of the selected cells, ordered by priority.
         """
+        check_error_rate(error_rate)
+        error_free = ~get_column(error_mask, column).to_numpy()
+
+        legacy_sample = getattr(self, "_sample", None)
+        if legacy_sample is not None:  # Subclasses of earlier versions mark the selected cells in a copy of the error mask
+            legacy_data = data.to_pandas() if isinstance(data, PolarsColumns) else data
+            return np.flatnonzero(get_column(legacy_sample(legacy_data, column, error_rate, error_mask.copy()), column).to_numpy(dtype=bool) & error_free)
+
+        return self._sample_positions(data, column, count_errors(len(error_free), int(error_free.sum()), error_rate), error_free)
+
+    def _select_block(
+        self: ErrorMechanism, data: pd.DataFrame | np.ndarray, block_columns: tuple[Hashable, ...], n_errors: int, error_free: np.ndarray
+    ) -> np.ndarray:
+        """Selects a random contiguous block of `n_errors` error-free cells sorted by `block_columns`, for mechanisms that select similar values.
+
+        The rows are sorted by a lexsort over the factorized codes of `block_columns`, whose first column is the primary key. If a
+        `_sort_order_cache` is set, the sort order is cached per tuple of columns, so that later samples only filter out the cells that contain errors.
+        If `approximate` is set and a single column has more error-free cells than `APPROXIMATE_SAMPLE_SIZE` and numeric sort keys,
+        the block is selected by `_select_approximate_block`.
+
+        Args:
+            data (pd.DataFrame | np.ndarray): DataFrame containing the columns to sort by, or a numeric 2-D or structured array
+            block_columns (tuple[Hashable, ...]): The labels of the columns whose values errors depend on, as returned by `get_column_labels`
+            n_errors (int): Number of cells to select
+            error_free (np.ndarray): Boolean array that is `True` at the rows whose cell does not contain an error yet
+
+        Returns:
+            np.ndarray: Row positions of the selected cells, sorted by the values of `block_columns`
+        """
+        # When the mid-level or high-level API samples on top of an existing error mask, only rows that do not contain errors yet are sampled.
+        if self.approximate and len(block_columns) == 1 and error_free.sum() > APPROXIMATE_SAMPLE_SIZE:
+            keys = get_numeric_sort_keys(data, block_columns[0])
+            if keys is not None:
+                return self._select_approximate_block(keys, n_errors, error_free)
+
+        sort_order = self._get_sort_order(data, block_columns)
+        lower_error_index = self._draw_block_start(n_errors, int(error_free.sum()))
+        sorted_error_free = sort_order[error_free[sort_order]]  # Positions of error-free values, sorted
+
+        return sorted_error_free[lower_error_index : lower_error_index + n_errors]
+
+    def _select_approximate_block(self: ErrorMechanism, keys: np.ndarray, n_errors: int, error_free: np.ndarray) -> np.ndarray:
+        """Selects a block of `n_errors` error-free cells with similar values in O(n), without sorting all values.
+
+        Description:
+            The rank at which the block starts is drawn as for exact blocks. The value at this rank is estimated by the same quantile of
+            `APPROXIMATE_SAMPLE_SIZE` values sampled with replacement. The block consists of the `n_errors` smallest cells from this value on,
+            found by partitioning instead of sorting, with ties broken by row as in exact blocks. If fewer cells remain from this value on,
+            the block consists of the `n_errors` largest cells. Only the selected cells are sorted to order them by priority.
+
+        Error bounds:
+            The number of selected cells is exact, so the achieved error rate equals the one of exact blocks. Only the position of the block
+            is approximate. By the Dvoretzky-Kiefer-Wolfowitz inequality, with probability of at least 1 - delta, the share of error-free
+            cells below the block deviates from the drawn share by at most sqrt(ln(2 / delta) / (2 * APPROXIMATE_SAMPLE_SIZE)), i.e.,
+            by at most 1.4 percentage points for delta = 0.05, plus the share of the cells whose value equals the first value of the block,
+            because the block starts at the first of them.
+
+        Args:
+            keys (np.ndarray): Float values of all rows that sort as the values of the column errors depend on, NaN for missing values
+            n_errors (int): Number of cells to select
+            error_free (np.ndarray): Boolean array that is `True` at the rows whose cell does not contain an error yet
+
+        Returns:
+            np.ndarray: Row positions of the selected cells, sorted by their keys
+        """
+        candidates = np.flatnonzero(error_free)
+        candidate_keys = keys[candidates]
+        start_rank = self._draw_block_start(n_errors, len(candidates))
+
+        sample = np.sort(candidate_keys[self._random_generator.integers(0, len(candidates), size=APPROXIMATE_SAMPLE_SIZE)])
+        start_value = sample[start_rank * APPROXIMATE_SAMPLE_SIZE // len(candidates)]
+        from_start = np.isnan(candidate_keys) if np.isnan(start_value) else ~(candidate_keys < start_value)  # NaN sort last
+
+        if from_start.sum() >= n_errors:
+            block = np.flatnonzero(from_start)[_smallest(candidate_keys[from_start], n_errors)]
+        else:
+            block = np.setdiff1d(np.arange(len(candidates)), _smallest(candidate_keys, len(candidates) - n_errors), assume_unique=True)
+
+        return candidates[block[np.argsort(candidate_keys[block], kind="stable")]]
+
+    def _get_sort_order(self: ErrorMechanism, data: pd.DataFrame | np.ndarray, columns: tuple[Hashable, ...]) -> np.ndarray:
+        """Returns the sort order of `data` by `columns`, from `_sort_order_cache` if one is set."""
+        if self._sort_order_cache is None:
+            return get_sort_order(data, columns)
+
+        return self._sort_order_cache.get(data, columns)
+
+    def _draw_block_start(self: ErrorMechanism, n_errors: int, n_error_free: int) -> int:
+        """Draws the rank among the sorted error-free cells at which the block of `_select_block` starts."""
+        return int(self._random_generator.integers(0, n_error_free - n_errors)) if n_error_free > n_errors else 0
+
+    def _get_block_columns(self: ErrorMechanism, data: pd.DataFrame | np.ndarray, column: str | int) -> tuple[Hashable, ...] | None:  # noqa: ARG002
+        """Returns the labels of the columns whose sort order `_select_block` selects a block of, or None if the mechanism does not select blocks.
+
+        Mechanisms that select blocks override it. It may draw from `_random_generator`, before the block start is drawn. The row-partitioned
+        executor of `tab_err.api.parallel` uses it to select the same block as `_sample_positions` without sorting the whole column at once.
+        """
+        return None
+
+    def _sample_positions(self: ErrorMechanism, data: pd.DataFrame | np.ndarray, column: str | int, n_errors: int, error_free: np.ndarray) -> np.ndarray:  # noqa: ARG002
+        """Selects the row positions of the cells to insert errors into. Subclasses implement it, or `_sample` of earlier versions.
+
+        Implementations access `data` only through the helpers of `tab_err._utils` that support DataFrames and arrays, e.g., `get_column_labels`
+        and `SortOrderCache`, so that they serve both `sample_priority` and `sample_array_priority`.
+
+        Args:
+            data (pd.DataFrame | np.ndarray): DataFrame containing the column to add errors to, or a numeric 2-D or structured array
+            column (str | int): The column of `data` to select cells of
+            n_errors (int): Number of cells to select. At least `n_errors` cells are error-free.
+            error_free (np.ndarray): Boolean array that is `True` at the rows whose cell in `column` does not contain an error yet
+
+        Raises:
+            TypeError: If the subclass does not implement it, e.g., because it implements `_sample` of earlier versions, which does not support arrays.
+
+        Returns:
+            np.ndarray: `n_errors` row positions of error-free cells, ordered by priority such that every prefix is a valid selection of fewer cells.
+        """
+        msg = f"{type(self).__name__} does not implement '_sample_positions', which is required to sample NumPy arrays."
+        raise TypeError(msg)
+
+
+def _smallest(keys: np.ndarray, k: int) -> np.ndarray:
+    """Returns the ascending positions of the `k` smallest `keys` in O(n), where NaN is largest and ties are broken by position."""
+    if k >= len(keys):
+        return np.arange(len(keys))
+
+    if k == 0:
+        return np.array([], dtype=np.int64)
+
+    threshold = np.partition(keys, k - 1)[k - 1]
+    below, tied = (~np.isnan(keys), np.isnan(keys)) if np.isnan(threshold) else (keys < threshold, keys == threshold)
+
+    return np.sort(np.concatenate([np.flatnonzero(below), np.flatnonzero(tied)[: k - int(below.sum())]]))
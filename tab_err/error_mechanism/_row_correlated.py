@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pandas as pd
+
+from tab_err._observer import observe_stage
+from tab_err._utils import count_errors, get_column_str
+
+from ._error_mechanism import ErrorMechanism
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from tab_err._observer import Observer
+
+
+class RowCorrelated(ErrorMechanism):
+    """`ErrorMechanism` subclass that corrupts several columns of the same rows, e.g., the records of a bad ingestion batch.
+
+    Description:
+        `sample_rows` and `sample_row_positions` draw the erroneous rows once, completely at random, and then assign each of them
+        a number of columns drawn from `column_count_probabilities` and that many distinct columns, for all rows at once. Random numbers
+        are only drawn for the erroneous rows and their columns, instead of one sampling pass over all rows per column.
+        Per column, e.g., in the `ErrorModel`s of the mid-level API, the rows are selected completely at random from a random order of
+        all rows that only depends on the seed, so that seeded instances select the same rows of all columns at equal error rates.
+    """
+
+    def __init__(self: RowCorrelated, seed: int | None = None, *, column_count_probabilities: Sequence[float] | None = None) -> None:
+        """Initialization method of the RowCorrelated class.
+
+        Args:
+            seed (int | None, optional): Random seed. Defaults to None.
+            column_count_probabilities (Sequence[float] | None, optional): The probabilities that an erroneous row has errors in 1, 2, ...
+                of the sampled columns. Counts above the number of sampled columns are capped to it. Defaults to None, i.e., all columns.
+
+        Attributes:
+            column_count_probabilities (list[float] | None): The probabilities of the numbers of erroneous columns per erroneous row.
+
+        Raises:
+            TypeError: Raised if the seed is not int or None.
+            ValueError: Raised if 'column_count_probabilities' is empty, has negative probabilities, or does not sum up to 1.
+        """
+        super().__init__(seed=seed)
+
+        if column_count_probabilities is not None:
+            probabilities = np.asarray(column_count_probabilities, dtype=np.float64)
+            if len(probabilities) == 0 or (probabilities < 0).any() or not np.isclose(probabilities.sum(), 1.0):
+                msg = f"'column_count_probabilities' is: {list(column_count_probabilities)} and should be non-negative probabilities that sum up to 1."
+                raise ValueError(msg)
+
+        self.column_count_probabilities = None if column_count_probabilities is None else list(column_count_probabilities)
+
+    def sample_rows(
+        self: RowCorrelated,
+        data: pd.DataFrame,
+        columns: Sequence[str | int],
+        error_rate: float,
+        error_mask: pd.DataFrame | None = None,
+        observer: Observer | None = None,
+    ) -> pd.DataFrame:
+        """Returns an error mask that marks the erroneous cells of `columns` in the erroneous rows, set in a single pass.
+
+        Args:
+            data (pd.DataFrame): DataFrame containing the columns to add errors to
+            columns (Sequence[str | int]): The columns of 'data' that the erroneous rows have errors in
+            error_rate (float): Percentage of rows to be affected by errors in range [0,1].
+            error_mask (pd.DataFrame | None, optional): An existing error mask to add more errors to. Rows with an error in one of
+                `columns` are not sampled. It is not modified. Defaults to None.
+            observer (Observer | None, optional): Receives a StageEvent of the sampling, e.g., a StageCollector. Defaults to None.
+
+        Raises:
+            ValueError: If the error rate is out of the [0,1] interval or requires more rows than are error-free in all `columns`.
+            TypeError: If 'data' is not a non-empty DataFrame.
+
+        Returns:
+            pd.DataFrame: A copy of the error mask with the new erroneous cells set to `True`.
+        """
+        error_mask = self._prepare_sampling(data, error_rate, error_mask)
+        with observe_stage(observer, "ErrorMechanism.sample", type(self).__name__, None, n_cells=len(data) * len(columns)) as stage:
+            column_positions = [error_mask.columns.get_loc(get_column_str(error_mask, column)) for column in columns]
+            rows, cell_columns = self._sample_cells(_get_erroneous_rows(error_mask, column_positions), len(columns), error_rate)
+
+            mask = error_mask.to_numpy(dtype=bool, copy=True)
+            mask[rows, np.asarray(column_positions, dtype=np.intp)[cell_columns]] = True
+            if stage is not None:
+                stage.n_changed = len(rows)
+
+        return pd.DataFrame(mask, index=error_mask.index, columns=error_mask.columns)
+
+    def sample_row_positions(
+        self: RowCorrelated,
+        data: pd.DataFrame,
+        columns: Sequence[str | int],
+        error_rate: float,
+        error_mask: pd.DataFrame | None = None,
+        observer: Observer | None = None,
+    ) -> dict[str | int, np.ndarray]:
+        """Returns the row positions of the erroneous cells of each of `columns`, grouped from the sampled cells without scanning the columns.
+
+        Args:
+            data (pd.DataFrame): DataFrame containing the columns to add errors to
+            columns (Sequence[str | int]): The columns of 'data' that the erroneous rows have errors in
+            error_rate (float): Percentage of rows to be affected by errors in range [0,1].
+            error_mask (pd.DataFrame | None, optional): An existing error mask whose rows with an error in one of `columns` are not sampled.
+                Defaults to None.
+            observer (Observer | None, optional): Receives a StageEvent of the sampling, e.g., a StageCollector. Defaults to None.
+
+        Raises:
+            ValueError: If the error rate is out of the [0,1] interval or requires more rows than are error-free in all `columns`.
+            TypeError: If 'data' is not a non-empty DataFrame.
+
+        Returns:
+            dict[str | int, np.ndarray]: The ascending row positions of the erroneous cells of each of `columns`, by the given column.
+        """
+        error_mask = self._prepare_sampling(data, error_rate, error_mask)
+        with observe_stage(observer, "ErrorMechanism.sample", type(self).__name__, None, n_cells=len(data) * len(columns)) as stage:
+            column_positions = [error_mask.columns.get_loc(get_column_str(error_mask, column)) for column in columns]
+            rows, cell_columns = self._sample_cells(_get_erroneous_rows(error_mask, column_positions), len(columns), error_rate)
+
+            order = np.lexsort((rows, cell_columns))
+            bounds = np.cumsum(np.bincount(cell_columns, minlength=len(columns)))[:-1]
+            positions = dict(zip(columns, np.split(rows[order], bounds)))
+            if stage is not None:
+                stage.n_changed = len(rows)
+
+        return positions
+
+    def _sample_cells(self: RowCorrelated, erroneous_rows: np.ndarray, n_columns: int, error_rate: float) -> tuple[np.ndarray, np.ndarray]:
+        """Draws the erroneous rows and their columns in bulk.
+
+        Args:
+            erroneous_rows (np.ndarray): Boolean array that is `True` at the rows that have an error in one of the sampled columns
+            n_columns (int): Number of sampled columns
+            error_rate (float): Percentage of rows to be affected by errors in range [0,1].
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: The row positions and the positions among the sampled columns of the erroneous cells.
+        """
+        error_free_rows = np.flatnonzero(~erroneous_rows)
+        n_rows = count_errors(len(erroneous_rows), len(error_free_rows), error_rate)
+        rows = self._random_generator.choice(error_free_rows, n_rows, replace=False)
+
+        if self.column_count_probabilities is None or n_columns == 0:
+            return np.repeat(rows, n_columns), np.tile(np.arange(n_columns), n_rows)
+
+        probabilities = np.asarray(self.column_count_probabilities) / np.sum(self.column_count_probabilities)
+        counts = np.minimum(self._random_generator.choice(len(probabilities), n_rows, p=probabilities) + 1, n_columns)
+
+        # The first `count` columns of a random permutation of the columns of each row
+        permutations = self._random_generator.permuted(np.tile(np.arange(n_columns), (n_rows, 1)), axis=1)
+        row_indices, ranks = np.nonzero(np.arange(n_columns) < counts[:, None])
+        return rows[row_indices], permutations[row_indices, ranks]
+
+    def _sample_positions(
+        self: RowCorrelated,
+        data: pd.DataFrame | np.ndarray,  # noqa: ARG002
+        column: str | int,  # noqa: ARG002
+        n_errors: int,
+        error_free: np.ndarray,
+    ) -> np.ndarray:
+        """Selects the cells of a single column completely at random, in a random order of all rows that only depends on the seed.
+
+        Args:
+            data (pd.DataFrame | np.ndarray): DataFrame containing the column to add errors to, or a numeric 2-D or structured array
+            column (str | int): The column of `data` to select cells of
+            n_errors (int): Number of cells to select
+            error_free (np.ndarray): Boolean array that is `True` at the rows whose cell in `column` does not contain an error yet
+
+        Returns:
+            np.ndarray: Row positions of the selected cells in the random order of the rows
+        """
+        order = self._random_generator.permutation(len(error_free))
+        return order[error_free[order]][:n_errors]
+
+
+def _get_erroneous_rows(error_mask: pd.DataFrame, column_positions: list[int]) -> np.ndarray:
+    """Returns a boolean array that is `True` at the rows of `error_mask` with an error in one of the columns at `column_positions`.
+
+    The cells with errors are found in one scan of the mask, which is faster than reducing the rows of the selected columns.
+    """
+    cells = np.flatnonzero(error_mask.to_numpy(dtype=bool))
+    erroneous_rows = np.zeros(len(error_mask), dtype=bool)
+    erroneous_rows[cells[np.isin(cells % error_mask.shape[1], column_positions)] // error_mask.shape[1]] = True
+    return erroneous_rows
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pandas as pd
+
+from tab_err._utils import get_array_column, get_column_label, get_numeric_sort_keys
+
+from ._error_mechanism import ErrorMechanism
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable
+
+
+class SoftENAR(ErrorMechanism):
+    """`ErrorMechanism` subclass implementing a soft `Erroneous Not At Random` error mechanism.
+
+    Description:
+        Errors depend on the values of the column itself, or on those of `condition_to_column` if it is given, but unlike ENAR
+        and EAR, which select a contiguous block of similar values, every row can be selected. The weight of a row is a logistic
+        function of its standardized value, so that large values are more likely erroneous for a positive `steepness` and small
+        values for a negative one.
+    """
+
+    def __init__(
+        self: SoftENAR,
+        condition_to_column: int | str | list[int | str] | None = None,
+        seed: int | None = None,
+        *,
+        steepness: float = 1.0,
+        intercept: float = 0.0,
+    ) -> None:
+        """Initialization method of the SoftENAR class.
+
+        Args:
+            condition_to_column (int | str | list[int | str] | None, optional): The column whose values errors depend on. A list of columns weights
+                the rows by their ranks sorted by the first column, then by the second one, and so on. Defaults to None, which uses the column itself.
+            seed (int | None, optional): Random seed. Defaults to None.
+            steepness (float, optional): The slope of the logistic function in standard deviations of the values. With 0, errors are
+                completely at random. Defaults to 1.0.
+            intercept (float, optional): The logit of the weight of a row with the mean value. Missing values get this weight as well. Defaults to 0.0.
+
+        Attributes:
+            steepness (float): The slope of the logistic function in standard deviations of the values.
+            intercept (float): The logit of the weight of a row with the mean value.
+
+        Raises:
+            TypeError: Raised if the seed is not int or None.
+        """
+        super().__init__(condition_to_column, seed)
+        self.steepness = steepness
+        self.intercept = intercept
+
+    def _sample_positions(self: SoftENAR, data: pd.DataFrame | np.ndarray, column: str | int, n_errors: int, error_free: np.ndarray) -> np.ndarray:
+        """Selects cells according to the soft `Erroneous Not At Random` error mechanism.
+
+        Description:
+            The values are standardized to z-scores and a row has the weight sigmoid(`intercept` + `steepness` * z). Exactly `n_errors`
+            error-free rows are drawn without replacement with probabilities proportional to their weights, using the Gumbel-top-k trick:
+            each row's log-weight is perturbed by independent Gumbel noise, and the `n_errors` rows with the largest perturbed scores are
+            found by partitioning instead of sorting, in O(n). Only the selected rows are sorted by their scores, so that every prefix is a
+            sample of fewer rows. Columns without numeric sort keys, e.g., strings, are weighted by the ranks of their sorted values.
+
+        Args:
+            data (pd.DataFrame | np.ndarray): DataFrame containing the column to add errors to, or a numeric 2-D or structured array
+            column (str | int): The column of `data` to select cells of
+            n_errors (int): Number of cells to select
+            error_free (np.ndarray): Boolean array that is `True` at the rows whose cell in `column` does not contain an error yet
+
+        Returns:
+            np.ndarray: Row positions of the selected cells, in the order in which they are drawn
+        """
+        candidates = np.flatnonzero(error_free)
+        keys = self._get_keys(data, self._get_conditioning_columns(data, column))[candidates]
+
+        log_weights = -np.logaddexp(0, -(self.intercept + self.steepness * _standardize(keys)))  # log(sigmoid(x)), stable for large |x|
+        scores = log_weights + self._random_generator.gumbel(size=len(candidates))
+
+        selected = np.argpartition(-scores, n_errors - 1)[:n_errors] if 0 < n_errors < len(candidates) else np.arange(len(candidates))[:n_errors]
+        return candidates[selected[np.argsort(-scores[selected], kind="stable")]]
+
+    def _get_conditioning_columns(self: SoftENAR, data: pd.DataFrame | np.ndarray, column: str | int) -> tuple[Hashable, ...]:
+        """Returns the labels of `condition_to_column`, which may be a list of columns, or of `column` itself if it is None."""
+        if self.condition_to_column is None:
+            return (get_column_label(data, column),)
+
+        if isinstance(self.condition_to_column, list):
+            return tuple(get_column_label(data, condition) for condition in self.condition_to_column)
+
+        return (get_column_label(data, self.condition_to_column),)
+
+    def _get_keys(self: SoftENAR, data: pd.DataFrame | np.ndarray, labels: tuple[Hashable, ...]) -> np.ndarray:
+        """Returns float values of a single column for all rows, otherwise the ranks of the rows sorted by `labels`, with NaN for missing values."""
+        keys = get_numeric_sort_keys(data, labels[0]) if len(labels) == 1 else None
+        if keys is not None:
+            return keys
+
+        ranks = np.empty(len(data), dtype=np.float64)
+        ranks[self._get_sort_order(data, labels)] = np.arange(len(data))
+        for label in labels:
+            values = get_array_column(data, label) if isinstance(data, np.ndarray) else data[label]  # type: ignore[arg-type]
+            ranks[np.asarray(pd.isna(values))] = np.nan
+        return ranks
+
+
+def _standardize(keys: np.ndarray) -> np.ndarray:
+    """Returns the z-scores of `keys`, with 0 for NaN and for keys without variance."""
+    finite = np.isfinite(keys)
+    if not finite.any():
+        return np.zeros(len(keys))
+
+    std = keys[finite].std()
+    z_scores = (keys - keys[finite].mean()) / std if std > 0 else np.zeros(len(keys))
+    return np.where(finite, z_scores, 0.0)
@@ -1,13 +1,62 @@
-from tab_err.error_type._add_delta import AddDelta
-from tab_err.error_type._category_swap import CategorySwap
-from tab_err.error_type._config import ErrorTypeConfig
-from tab_err.error_type._error_type import ErrorType
-from tab_err.error_type._extraneous import Extraneous
-from tab_err.error_type._missing import MissingValue
-from tab_err.error_type._mistype import Mistype
-from tab_err.error_type._mojibake import Mojibake
-from tab_err.error_type._outlier import Outlier
-from tab_err.error_type._permutate import Permutate
-from tab_err.error_type._replace import Replace
-from tab_err.error_type._typo import Typo
-from tab_err.error_type._wrong_unit import WrongUnit
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING
+
+from tab_err._lazy import attach
+
+# Registry of the ErrorTypes by class name and the modules that define them. Each error type is imported when it is first used.
+_ERROR_TYPES = {
+    "AddDelta": "._add_delta",
+    "CategorySwap": "._category_swap",
+    "Extraneous": "._extraneous",
+    "MissingValue": "._missing",
+    "Mistype": "._mistype",
+    "Mojibake": "._mojibake",
+    "Outlier": "._outlier",
+    "Permutate": "._permutate",
+    "Replace": "._replace",
+    "Typo": "._typo",
+    "WrongUnit": "._wrong_unit",
+}
+
+__getattr__, __dir__, __all__ = attach(__name__, attributes={**_ERROR_TYPES, "ErrorType": "._error_type", "ErrorTypeConfig": "._config"})
+__all__ += ["ERROR_TYPE_NAMES", "get_error_type"]
+
+ERROR_TYPE_NAMES = tuple(_ERROR_TYPES)
+"""The class names of all ErrorTypes, which `get_error_type` resolves."""
+
+
+def get_error_type(name: str) -> type[ErrorType]:
+    """Returns the ErrorType class with the given class name, importing only the module that defines it.
+
+    Args:
+        name (str): The class name of the ErrorType, one of `ERROR_TYPE_NAMES`, e.g., "Typo".
+
+    Raises:
+        KeyError: If no ErrorType has the given name.
+
+    Returns:
+        type[ErrorType]: The ErrorType class.
+    """
+    if name not in _ERROR_TYPES:
+        msg = f"There is no ErrorType named '{name}'. Valid names are {ERROR_TYPE_NAMES}."
+        raise KeyError(msg)
+
+    return getattr(importlib.import_module(_ERROR_TYPES[name], __name__), name)
+
+
+if TYPE_CHECKING:
+    from tab_err.error_type._add_delta import AddDelta
+    from tab_err.error_type._category_swap import CategorySwap
+    from tab_err.error_type._config import ErrorTypeConfig
+    from tab_err.error_type._error_type import ErrorType
+    from tab_err.error_type._extraneous import Extraneous
+    from tab_err.error_type._missing import MissingValue
+    from tab_err.error_type._mistype import Mistype
+    from tab_err.error_type._mojibake import Mojibake
+    from tab_err.error_type._outlier import Outlier
+    from tab_err.error_type._permutate import Permutate
+    from tab_err.error_type._replace import Replace
+    from tab_err.error_type._typo import Typo
+    from tab_err.error_type._wrong_unit import WrongUnit
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import warnings
+from typing import Any
 
+import numpy as np
 import pandas as pd
 from pandas.api.types import is_datetime64_dtype, is_numeric_dtype
 
@@ -25,38 +27,72 @@ class AddDelta(ErrorType):
         """Returns all column names with numeric dtype elements."""
         return data.select_dtypes(include=["number", "datetime64"]).columns.tolist()
 
-    def _apply(self: AddDelta, data: pd.DataFrame, error_mask: pd.DataFrame, column: int | str) -> pd.Series:
+    def _get_output_dtype(self: AddDelta, dtype: Any) -> Any:  # noqa: ANN401
+        """Integer columns become float columns unless the delta is an integer, boolean columns become object columns."""
+        if isinstance(dtype, np.dtype) and dtype.kind == "b":
+            return np.dtype("object")
+
+        if isinstance(dtype, np.dtype) and dtype.kind in "iu" and not isinstance(self.config.add_delta_value, int):
+            return np.dtype("float64")
+
+        return dtype
+
+    def _fit_statistics(self: AddDelta, series: pd.Series) -> dict[str, Any]:
+        """Returns the mean and standard deviation of 'series', of seconds since the UNIX epoch for datetimes."""
+        if is_datetime64_dtype(series):
+            series = series.astype("int64") // 10**9
+
+        return {"mean": series.mean(), "std": series.std()}
+
+    def _sample_config(self: AddDelta, series: pd.Series) -> None:
+        """Samples the delta from the values of 'series' if `add_delta_value` is not configured."""
+        if self.config.add_delta_value is not None:
+            return
+
+        if is_datetime64_dtype(series):
+            series = series.astype("int64") // 10**9
+
+        self._sample_delta(series.to_numpy(), self._get_statistics(series), f"column: {series.name}")
+
+    def _sample_delta(self: AddDelta, values: np.ndarray, statistics: dict[str, Any], source: str) -> None:
+        """Samples `add_delta_value` as a random one of 'values', standardized with the mean and standard deviation in 'statistics'."""
+        msg = f"self.config.add_delta_value is none, sampling a random delta value uniformly from the range of {source}."
+        warnings.warn(msg, stacklevel=4)
+        # Ensures a smaller value than uniform sampling
+        self.config.add_delta_value = (self._random_generator.choice(values) - statistics["mean"]) / statistics["std"]
+
+    def _apply_series(self: AddDelta, series: pd.Series, mask: np.ndarray) -> pd.Series:
         """Applies the AddDelta ErrorType to a column of data.
 
         Args:
-            data (pd.DataFrame): DataFrame containing the column to add errors to.
-            error_mask (pd.DataFrame): A Pandas DataFrame with the same index & columns as 'data' that will be modified and returned.
-            column (int | str): The column of 'data' to create an error mask for.
+            series (pd.Series): The column to add errors to.
+            mask (np.ndarray): A boolean array of the same length as 'series' that is True where errors are introduced.
 
         Raises:
             ValueError: If the add_delta_value is None, a ValueError will be thrown.
 
         Returns:
-            pd.Series: The data column, 'column', after AddDelta errors at the locations specified by 'error_mask' are introduced.
+            pd.Series: 'series' after AddDelta errors at the locations specified by 'mask' are introduced.
         """
-        series = get_column(data, column).copy()
-        series_mask = get_column(error_mask, column)
+        self._sample_config(series)
+        series = series.copy()
         was_datetime = False  # Default was_datetime to false -- changes occur only in the special case of datetime
 
         if is_datetime64_dtype(series):  # Convert to int (number of seconds) if datetime
             series = series.astype("int64") // 10**9
             was_datetime = True
 
-        if self.config.add_delta_value is None:
-            msg = f"self.config.add_delta_value is none, sampling a random delta value uniformly from the range of column: {column}."
-            warnings.warn(msg, stacklevel=2)
-            self.config.add_delta_value = (
-                self._random_generator.choice(series) - series.mean()
-            ) / series.std()  # Ensures a smaller value than uniform sampling
-
-        series = series.where(~series_mask, series + self.config.add_delta_value)  # Avoids in-place modification
+        series = series.where(~mask, series + self.config.add_delta_value)  # Avoids in-place modification
 
         if was_datetime:  # Convert back to datetime if it was initially
             series = pd.to_datetime(series, unit="s")
 
         return series
+
+    def _apply_array(self: AddDelta, values: np.ndarray, mask: np.ndarray) -> np.ndarray:
+        """Adds the delta to the masked values. Samples the delta like `_apply_series` if it is not configured."""
+        if self.config.add_delta_value is None:
+            statistics = self._statistics if self._statistics is not None else {"mean": np.nanmean(values), "std": np.nanstd(values, ddof=1)}
+            self._sample_delta(values, statistics, "the values")
+
+        return np.where(mask, values + self.config.add_delta_value, values)
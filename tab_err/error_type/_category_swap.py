@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import random
+from typing import TYPE_CHECKING
 
 import pandas as pd
 
@@ -8,6 +9,9 @@ from tab_err._utils import get_column
 
 from ._error_type import ErrorType
 
+if TYPE_CHECKING:
+    import numpy as np
+
 
 class CategorySwap(ErrorType):
     """Simulate incorrect labels in a column that contains categorical values."""
@@ -46,21 +50,20 @@ class CategorySwap(ErrorType):
 
         return valid_columns
 
-    def _apply(self: CategorySwap, data: pd.DataFrame, error_mask: pd.DataFrame, column: int | str) -> pd.Series:
+    def _apply_series(self: CategorySwap, series: pd.Series, mask: np.ndarray) -> pd.Series:
         """Applies the CategorySwap ErrorType to a column of data.
 
         Args:
-            data (pd.DataFrame): DataFrame containing the column to add errors to.
-            error_mask (pd.DataFrame): A Pandas DataFrame with the same index & columns as 'data' that will be modified and returned.
-            column (int | str): The column of 'data' to create an error mask for.
+            series (pd.Series): The column to add errors to.
+            mask (np.ndarray): A boolean array of the same length as 'series' that is True where errors are introduced.
 
         Raises:
             ValueError: If the value for parameter 'config.mislabel_weighing' is invalid (not 'uniform' or 'frequency'), a ValueError will be thrown.
 
         Returns:
-            pd.Series: The data column, 'column', after CategorySwap errors at the locations specified by 'error_mask' are introduced.
+            pd.Series: 'series' after CategorySwap errors at the locations specified by 'mask' are introduced.
         """
-        series = get_column(data, column).copy()
+        series = series.copy()
 
         if self.config.mislabel_weighing == "uniform":
 
@@ -77,6 +80,5 @@ class CategorySwap(ErrorType):
             msg = "Invalid value for parameter 'config.mislabel_weighing'. Allowed values are: 'uniform', 'frequency'."
             raise ValueError(msg)
 
-        series_mask = get_column(error_mask, column)
-        series.loc[series_mask] = series.loc[series_mask].apply(sample_label)
+        series.loc[mask] = series.loc[mask].apply(sample_label)
         return series
@@ -3,17 +3,30 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING, Any
 
-from tab_err._utils import seed_randomness_and_get_generator
+import numpy as np
+import pandas as pd
 
+from tab_err._observer import Stage
+from tab_err._utils import get_column, map_unique, seed_randomness_and_get_generator
+
+from . import get_error_type
 from ._config import ErrorTypeConfig
 
 if TYPE_CHECKING:
-    import numpy as np
-    import pandas as pd
+    from collections.abc import Callable
+
+    from tab_err._observer import Observer
 
 
 class ErrorType(ABC):
-    """Error Type Abstract Base Class."""
+    """Error Type Abstract Base Class.
+
+    Attributes:
+        value_deterministic (bool): Whether the error of a value depends only on the value, given the configuration and the random choices the
+            ErrorType makes once per application. Such ErrorTypes map each unique masked value only once in `_map_values`. Defaults to False.
+    """
+
+    value_deterministic = False
 
     def __init__(self: ErrorType, config: ErrorTypeConfig | dict | None = None, seed: int | None = None) -> None:
         """Initialization method of ErrorType class.
@@ -45,31 +58,171 @@ class ErrorType(ABC):
 
         self._seed = seed
         self._random_generator: np.random.Generator
+        self._statistics: dict[str, Any] | None = None
 
-    def apply(self: ErrorType, data: pd.DataFrame, error_mask: pd.DataFrame, column: str | int) -> pd.Series:
-        """Applies an ErrorType to a column of 'data'. Does type and shape checking and creates a random number generator.
+    def apply(self: ErrorType, data: pd.DataFrame, error_mask: pd.DataFrame, column: str | int, observer: Observer | None = None) -> pd.Series:
+        """Applies an ErrorType to a column of 'data'. Checks the shapes and is a wrapper around `apply_series`.
 
         Args:
             data (pd.DataFrame): The Pandas DataFrame containing the column where errors are to be introduced.
             error_mask (pd.DataFrame): The Pandas DataFrame containing the error mask for 'column'.
             column (str | int): The index in the 'data' and 'error_mask' DataFrames where errors are to be introduced.
+            observer (Observer | None, optional): Receives a StageEvent of the application, e.g., a StageCollector. Defaults to None.
 
         Returns:
             pd.Series: The data column, 'column', after errors of ErrorType at the locations specified by 'error_mask' are introduced.
         """
-        self._check_type(data, column)
-
         if data.shape != error_mask.shape:
             msg = f"The shape of 'data': {data.shape} was different from the shape of 'error_mask': {error_mask.shape}. They should be the same."
             raise ValueError(msg)
 
+        return self.apply_series(get_column(data, column), get_column(error_mask, column).to_numpy(dtype=bool), observer=observer)
+
+    def apply_series(
+        self: ErrorType, series: pd.Series, mask: np.ndarray, rng: np.random.Generator | None = None, *, observer: Observer | None = None
+    ) -> pd.Series:
+        """Applies an ErrorType to a Series where a boolean array is True, without DataFrames for the data and the error mask.
+
+        Args:
+            series (pd.Series): The column where errors are to be introduced.
+            mask (np.ndarray): A boolean array of the same length as 'series' that is True where errors are to be introduced.
+            rng (np.random.Generator | None, optional): The random number generator the ErrorType draws from, e.g., one that a driver reuses
+                across calls. ErrorTypes that draw from the `random` module are not affected by it. Defaults to None, which creates a generator
+                from the seed of the ErrorType and seeds the `random` module.
+            observer (Observer | None, optional): Receives a StageEvent of the application, e.g., a StageCollector. Defaults to None.
+
+        Raises:
+            ValueError: If the lengths of 'series' and 'mask' differ.
+
+        Returns:
+            pd.Series: A new Series with the index and name of 'series' and errors of ErrorType where 'mask' is True.
+        """
+        self._check_type(series.to_frame(), series.name if isinstance(series.name, str) else 0)
+        mask = np.asarray(mask, dtype=bool)
+
+        if mask.shape != (len(series),):
+            msg = f"The shape of 'mask': {mask.shape} was different from the length of 'series': {len(series)}. They should be the same."
+            raise ValueError(msg)
+
+        self._random_generator = seed_randomness_and_get_generator(self._seed) if rng is None else rng
+        if observer is None:
+            return self._apply_series(series, mask)
+
+        with Stage(observer, "ErrorType.apply", type(self).__name__, series.name, n_cells=len(series)) as stage:
+            result = self._apply_series(series, mask)
+            stage.n_changed = int(mask.sum())
+
+        return result
+
+    def apply_array(self: ErrorType, values: np.ndarray, mask: np.ndarray) -> np.ndarray:
+        """NumPy counterpart of `apply` that inserts errors into a 1-D numeric array without creating pandas objects.
+
+        Only ErrorTypes that implement `_apply_array` support arrays. With the same seed, they insert the same errors as `apply` does into a
+        column with the same values.
+
+        Args:
+            values (np.ndarray): The 1-D array with integer or floating point values where errors are to be introduced.
+            mask (np.ndarray): A boolean array of the same length as 'values' that is True where errors are to be introduced.
+
+        Raises:
+            TypeError: If the ErrorType does not support arrays or 'values' is not numeric.
+            ValueError: If the shapes of 'values' and 'mask' differ.
+
+        Returns:
+            np.ndarray: A new array with the errors. Its dtype is the one that `get_output_dtype` returns for the dtype of 'values', unless
+                errors in integers are not integers, which keeps them floats, as in integer columns.
+        """
+        if values.dtype.kind not in "iuf":
+            msg = f"The values with dtype: {values.dtype} are not integers or floating point numbers. Cannot apply {type(self).__name__} to arrays."
+            raise TypeError(msg)
+
+        if values.shape != mask.shape:
+            msg = f"The shape of 'values': {values.shape} was different from the shape of 'mask': {mask.shape}. They should be the same."
+            raise ValueError(msg)
+
         self._random_generator = seed_randomness_and_get_generator(self._seed)
-        return self._apply(data, error_mask, column)
+        result = self._apply_array(values, mask)
+        output_dtype = self.get_output_dtype(values.dtype)
+
+        if output_dtype.kind in "iu" and result.dtype.kind == "f" and not np.array_equal(result, np.trunc(result)):
+            return result
+
+        return result.astype(output_dtype, copy=False)
+
+    def _apply_array(self: ErrorType, values: np.ndarray, mask: np.ndarray) -> np.ndarray:  # noqa: ARG002
+        """Inserts errors into the numeric array 'values' where 'mask' is True. ErrorTypes that support `apply_array` override it.
+
+        Raises:
+            TypeError: If the ErrorType does not support arrays.
+        """
+        msg = f"{type(self).__name__} does not support NumPy arrays."
+        raise TypeError(msg)
+
+    def fit(self: ErrorType, series: pd.Series) -> ErrorType:
+        """Computes the statistics of 'series' that the ErrorType derives its parameters from, e.g., the quartiles of Outlier.
+
+        Later applications use the fitted statistics instead of computing them from the column they are applied to, which saves
+        recomputing them for every batch of a column and keeps the parameters the same across batches. ErrorTypes that do not derive
+        parameters from the column ignore it.
+
+        Args:
+            series (pd.Series): The column the statistics are computed from, e.g., the whole column of the training data.
+
+        Returns:
+            ErrorType: The ErrorType itself.
+        """
+        self._check_type(series.to_frame(), series.name if isinstance(series.name, str) else 0)
+        self._statistics = self._fit_statistics(series)
+        return self
+
+    def _fit_statistics(self: ErrorType, series: pd.Series) -> dict[str, Any] | None:  # noqa: ARG002
+        """Returns the statistics of 'series' that `_apply_series` uses, or None if the ErrorType does not derive parameters from the column."""
+        return None
+
+    def _sample_config(self: ErrorType, series: pd.Series) -> None:  # noqa: B027
+        """Draws the config parameters that are not configured and default to values drawn from 'series'. By default, there are none."""
+
+    def _get_statistics(self: ErrorType, series: pd.Series) -> dict[str, Any]:
+        """Returns the fitted statistics, or the statistics of 'series' if the ErrorType was not fitted."""
+        statistics = self._statistics if self._statistics is not None else self._fit_statistics(series)
+        if statistics is None:
+            msg = f"{type(self).__name__} does not derive statistics from the column."
+            raise TypeError(msg)
+
+        return statistics
+
+    def _map_values(self: ErrorType, series: pd.Series, function: Callable[[Any], Any]) -> pd.Series:
+        """Applies `function` to each value of 'series', once per unique value if the ErrorType is `value_deterministic`."""
+        if self.value_deterministic:
+            return map_unique(series, function)
+
+        return series.apply(function)
 
     def get_valid_columns(self: ErrorType, data: pd.DataFrame) -> list[str | int]:
         """Finds the valid columns to which the error type can be applied. Wrapper around _get_valid_columns."""
         return self._get_valid_columns(data)
 
+    def check_dtype(self: ErrorType, dtype: Any, column: str | int = "column") -> None:  # noqa: ANN401
+        """Checks without data whether the ErrorType can be applied to a column of the given dtype. Raises a TypeError or ValueError otherwise.
+
+        Args:
+            dtype (Any): The dtype of the column, e.g., an element of `DataFrame.dtypes`.
+            column (str | int, optional): The name of the column, used in error messages. Defaults to "column".
+        """
+        self._check_type(pd.DataFrame({column: pd.Series(dtype=dtype)}), column if isinstance(column, str) else 0)
+
+    def get_output_dtype(self: ErrorType, dtype: Any) -> Any:  # noqa: ANN401
+        """Returns the dtype that a column of the given dtype is expected to have after the ErrorType was applied to it.
+
+        Some transitions depend on the data, e.g., whether scaled integers remain integers. The returned dtype is the one
+        that applies in the common case. Wrapper around _get_output_dtype.
+        """
+        return self._get_output_dtype(pd.api.types.pandas_dtype(dtype))
+
+    def _get_output_dtype(self: ErrorType, dtype: Any) -> Any:  # noqa: ANN401
+        """Returns the expected dtype after the ErrorType was applied. By default, ErrorTypes keep the dtype of the column."""
+        return dtype
+
     @staticmethod
     @abstractmethod
     def _check_type(data: pd.DataFrame, column: str | int) -> None:
@@ -84,18 +237,30 @@ class ErrorType(ABC):
     def _get_valid_columns(self: ErrorType, data: pd.DataFrame) -> list[str | int]:
         """Finds the valid columns to which the error type can be applied."""
 
-    @abstractmethod
-    def _apply(self: ErrorType, data: pd.DataFrame, error_mask: pd.DataFrame, column: str | int) -> pd.Series:
-        """Abstract method for the application of an ErrorType to the cells in 'data' where 'error_mask' is True.
+    def _apply_series(self: ErrorType, series: pd.Series, mask: np.ndarray) -> pd.Series:
+        """Applies the ErrorType to the values of 'series' where 'mask' is True. Subclasses implement it, or `_apply` of earlier versions.
+
+        Subclasses of earlier versions implement `_apply(data, error_mask, column)`, which is called with one-column DataFrames of 'series'
+        and 'mask'.
 
         Args:
-            data (pd.DataFrame): The Pandas DataFrame containing the column where errors are to be introduced.
-            error_mask (pd.DataFrame): The Pandas DataFrame containing the error mask for 'column'.
-            column (str | int): The index in the 'data' and 'error_mask' DataFrames where errors are to be introduced.
+            series (pd.Series): The column where errors are to be introduced. Implementations must not modify it.
+            mask (np.ndarray): A boolean array of the same length as 'series' that is True where errors are to be introduced.
+
+        Raises:
+            TypeError: If the subclass implements neither `_apply_series` nor `_apply`.
 
         Returns:
-            pd.Series: The data column, 'column', after errors of ErrorType at the locations specified by 'error_mask' are introduced.
+            pd.Series: A new Series with the index and name of 'series' and errors of ErrorType where 'mask' is True.
         """
+        legacy_apply = getattr(self, "_apply", None)
+        if legacy_apply is None:
+            msg = f"{type(self).__name__} implements neither '_apply_series' nor '_apply'."
+            raise TypeError(msg)
+
+        data = series.to_frame()
+        error_mask = pd.DataFrame(mask, index=data.index, columns=data.columns)
+        return legacy_apply(data, error_mask, series.name if isinstance(series.name, str) else 0).rename(series.name)
 
     def to_dict(self: ErrorType) -> dict[str, Any]:
         """Serialized the ErrorType object into a dictionary.
@@ -118,7 +283,4 @@ class ErrorType(ABC):
         Returns:
             ErrorType: An ErrorType object deserialized from the dictionary.
         """
-        error_type_name = data["error_type"]
-        error_type_class = globals()[error_type_name]
-
-        return error_type_class(data["config"])
+        return get_error_type(data["error_type"])(data["config"])
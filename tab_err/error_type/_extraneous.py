@@ -2,19 +2,22 @@ from __future__ import annotations
 
 import string
 import warnings
-from typing import TYPE_CHECKING
+from typing import Any
 
-from tab_err._utils import get_column
+import numpy as np
+import pandas as pd
 
-from ._error_type import ErrorType
+from tab_err._arrow import is_arrow_string_dtype, map_arrow_strings, pa, pc, transform_masked_arrow_strings
+from tab_err._categorical import is_categorical_dtype, transform_masked_categories
 
-if TYPE_CHECKING:
-    import pandas as pd
+from ._error_type import ErrorType
 
 
 class Extraneous(ErrorType):
     """Adds Extraneous strings around the values in a column."""
 
+    value_deterministic = True
+
     def _generate_value_template_string(self: Extraneous, min_n: int = 0, max_n: int = 2) -> str:
         """Generates the value template string. Prepends and appends a random number of characters to the {value} string."""
         n1 = self._random_generator.integers(min_n + 1, max_n + 1)  # Random number of characters - guaranteed one
@@ -33,23 +36,26 @@ class Extraneous(ErrorType):
         """Returns all column names with string dtype elements. Necessary for high level API."""
         return data.select_dtypes(include=["string", "object"]).columns.to_list()
 
-    def _apply(self: Extraneous, data: pd.DataFrame, error_mask: pd.DataFrame, column: int | str) -> pd.Series:
+    def _get_output_dtype(self: Extraneous, dtype: Any) -> Any:  # noqa: ANN401
+        """Numeric, boolean, and datetime columns become object columns because they contain strings afterwards."""
+        if isinstance(dtype, np.dtype) and dtype.kind in "biufcmM":
+            return np.dtype("object")
+
+        return dtype
+
+    def _apply_series(self: Extraneous, series: pd.Series, mask: np.ndarray) -> pd.Series:
         """Applies the Extraneous ErrorType to a column of data.
 
         Args:
-            data (pd.DataFrame): DataFrame containing the column to add errors to.
-            error_mask (pd.DataFrame): A Pandas DataFrame with the same index & columns as 'data' that will be modified and returned.
-            column (int | str): The column of 'data' to create an error mask for.
+            series (pd.Series): The column to add errors to.
+            mask (np.ndarray): A boolean array of the same length as 'series' that is True where errors are introduced.
 
         Raises:
             ValueError: If extraneous_value_template does not contain the placeholder value, a ValueError will be thrown.
 
         Returns:
-            pd.Series: The data column, 'column', after Extraneous errors at the locations specified by 'error_mask' are introduced.
+            pd.Series: 'series' after Extraneous errors at the locations specified by 'mask' are introduced.
         """
-        series = get_column(data, column).copy()
-        series_mask = get_column(error_mask, column)
-
         if self.config.extraneous_value_template is None:
             msg = "self.config.extraneous_value_template is not set. Choosing a random string augmentation."
             warnings.warn(msg, stacklevel=2)
@@ -60,5 +66,28 @@ class Extraneous(ErrorType):
             msg += "{value}. Please add it for a valid format."
             raise ValueError(msg)
 
-        series.loc[series_mask] = series.loc[series_mask].apply(lambda x: self.config.extraneous_value_template.format(value=x))
+        template = self.config.extraneous_value_template
+        if is_arrow_string_dtype(series.dtype):
+            return transform_masked_arrow_strings(series, mask, lambda values: _format_arrow_strings(values, template))
+
+        if is_categorical_dtype(series.dtype):
+            return transform_masked_categories(series, mask, lambda x: template.format(value=x), unique=self.value_deterministic)
+
+        series = series.copy()
+        series.loc[mask] = self._map_values(series.loc[mask], lambda x: template.format(value=x))
         return series
+
+
+def _format_arrow_strings(values: pa.Array, template: str) -> pa.Array:
+    """Formats Arrow strings with the template by joining its parts with pyarrow.compute. Missing values become "<NA>", as when formatting `pd.NA`."""
+    parts = template.split("{value}")
+    values = pc.fill_null(values, str(pd.NA))
+
+    if any(brace in part for part in parts for brace in "{}"):  # other replacement fields or escaped braces need str.format
+        return map_arrow_strings(values, lambda x: template.format(value=x), unique=True)
+
+    arguments: list[pa.Array | pa.Scalar] = [pa.scalar(parts[0], type=values.type)]
+    for part in parts[1:]:
+        arguments.extend([values, pa.scalar(part, type=values.type)])
+
+    return pc.binary_join_element_wise(*arguments, pa.scalar("", type=values.type))
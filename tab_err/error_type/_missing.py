@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+from typing import Any
+
+import numpy as np
 import pandas as pd
 from pandas.api.types import is_string_dtype
 
-from tab_err._utils import get_column
+from tab_err._arrow import from_arrow, is_arrow_string_dtype, pa, pc, to_arrow
+from tab_err._categorical import is_categorical_dtype
 
 from ._error_type import ErrorType
 
@@ -26,24 +30,59 @@ class MissingValue(ErrorType):
         """If the config mising value is None, returns all columns. Otherwise, only the columns with the same type."""
         return data.columns.to_list() if self.config.missing_value is None else data.select_dtypes(include=["object", "string"]).columns.to_list()
 
-    def _apply(self: MissingValue, data: pd.DataFrame, error_mask: pd.DataFrame, column: int | str) -> pd.Series:
+    def _get_output_dtype(self: MissingValue, dtype: Any) -> Any:  # noqa: ANN401
+        """Integer columns become float columns, boolean and string columns become object columns. Arrow-backed strings and categories stay as they are.
+
+        A configured missing value keeps the dtype, apart from becoming a category of categorical columns.
+        """
+        missing_value = self.config.missing_value
+        if isinstance(dtype, pd.CategoricalDtype) and missing_value is not None and missing_value not in dtype.categories:
+            return pd.CategoricalDtype(dtype.categories.append(pd.Index([missing_value])), ordered=dtype.ordered)
+
+        if missing_value is not None or is_arrow_string_dtype(dtype):
+            return dtype
+
+        if isinstance(dtype, np.dtype) and dtype.kind in "iu":
+            return np.dtype("float64")
+
+        if (isinstance(dtype, np.dtype) and dtype.kind == "b") or isinstance(dtype, pd.StringDtype):
+            return np.dtype("object")
+
+        return dtype
+
+    def _apply_series(self: MissingValue, series: pd.Series, mask: np.ndarray) -> pd.Series:
         """Applies the MissingValue ErrorType to a column of data.
 
         Args:
-            data (pd.DataFrame): DataFrame containing the column to add errors to.
-            error_mask (pd.DataFrame): A Pandas DataFrame with the same index & columns as 'data' that will be modified and returned.
-            column (int | str): The column of 'data' to create an error mask for.
+            series (pd.Series): The column to add errors to.
+            mask (np.ndarray): A boolean array of the same length as 'series' that is True where errors are introduced.
 
         Returns:
-            pd.Series: The data column, 'column', after MissingValue errors at the locations specified by 'error_mask' are introduced.
+            pd.Series: 'series' after MissingValue errors at the locations specified by 'mask' are introduced.
         """
-        series = get_column(data, column).copy()
-        series_mask = get_column(error_mask, column)
+        # Arrow arrays have a validity bitmap, so missing values keep the dtype
+        if is_arrow_string_dtype(series.dtype) and (self.config.missing_value is None or isinstance(self.config.missing_value, str)):
+            values = to_arrow(series)
+            result = pc.if_else(pa.array(mask, type=pa.bool_()), pa.scalar(self.config.missing_value, type=values.type), values)
+            return from_arrow(result, like=series)
 
+        # Categorical columns keep their codes, a configured missing value becomes a category
+        if is_categorical_dtype(series.dtype):
+            missing_value = self.config.missing_value
+            series = series if missing_value is None or missing_value in series.cat.categories else series.cat.add_categories([missing_value])
+            series = series.copy()
+            series[mask] = missing_value
+            return series
+
+        series = series.copy()
         if is_string_dtype(series) and self.config.missing_value is None:  # Strings are finicky
-            series[series_mask] = pd.NA
+            series[mask] = pd.NA
             series = series.astype(str)
         else:
-            series[series_mask] = self.config.missing_value
+            series[mask] = self.config.missing_value
 
         return series
+
+    def _apply_array(self: MissingValue, values: np.ndarray, mask: np.ndarray) -> np.ndarray:
+        """Inserts NaN, or the configured missing value, at the masked values. Integer arrays become float arrays to hold NaN."""
+        return np.where(mask, np.nan if self.config.missing_value is None else self.config.missing_value, values)
@@ -1,8 +1,8 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
-from tab_err._utils import get_column
+import numpy as np
 
 from ._error_type import ErrorType
 
@@ -26,22 +26,25 @@ class Mistype(ErrorType):
         """Returns all column names of columns with dtypes other than object. This is necessary for the high level API."""
         return [col_name for col_name in data.columns.tolist() if data[col_name].dtype != "object"]
 
-    def _apply(self: Mistype, data: pd.DataFrame, error_mask: pd.DataFrame, column: int | str) -> pd.Series:
+    def _get_output_dtype(self: Mistype, dtype: Any) -> Any:  # noqa: ANN401, ARG002
+        """Mistype always casts the corrupted column to an object dtype."""
+        return np.dtype("object")
+
+    def _apply_series(self: Mistype, series: pd.Series, mask: np.ndarray) -> pd.Series:
         """Applies the Mistype ErrorType to a column of data. Note that the dtype of the column is changed by this operation.
 
         Args:
-            data (pd.DataFrame): DataFrame containing the column to add errors to.
-            error_mask (pd.DataFrame): A Pandas DataFrame with the same index & columns as 'data' that will be modified and returned.
-            column (int | str): The column of 'data' to create an error mask for.
+            series (pd.Series): The column to add errors to.
+            mask (np.ndarray): A boolean array of the same length as 'series' that is True where errors are introduced.
 
         Raises:
             TypeError: If the type supplied by the user in the config is not supported, a TypeError will be thrown.
             TypeError: If no type is supplied by the user in the config, and the series' datatype is 'object', a TypeError will be thrown.
 
         Returns:
-            pd.Series: The data column, 'column', after Mistype errors at the locations specified by 'error_mask' are introduced.
+            pd.Series: 'series' after Mistype errors at the locations specified by 'mask' are introduced.
         """
-        series = get_column(data, column).copy()
+        series = series.copy()
         supported_dtypes = ["object", "string", "int64", "Int64", "float64", "Float64"]
 
         if self.config.mistype_dtype is not None:
@@ -73,7 +76,6 @@ class Mistype(ErrorType):
             # NOTE(PJ): not sure about this logic, there might be a better way to do this.
 
         series = series.astype("object")
-        series_mask = get_column(error_mask, column)
-        series.loc[series_mask] = series.loc[series_mask].astype(target_dtype)
+        series.loc[mask] = series.loc[mask].astype(target_dtype)
 
         return series
@@ -5,17 +5,22 @@ from typing import TYPE_CHECKING
 
 from pandas.api.types import is_string_dtype
 
+from tab_err._arrow import is_arrow_string_dtype, map_arrow_strings, transform_masked_arrow_strings
+from tab_err._categorical import is_categorical_dtype, transform_masked_categories
 from tab_err._utils import get_column
 
 from ._error_type import ErrorType
 
 if TYPE_CHECKING:
+    import numpy as np
     import pandas as pd
 
 
 class Mojibake(ErrorType):
     """Inserts mojibake into a column containing strings."""
 
+    value_deterministic = True
+
     @staticmethod
     def _check_type(data: pd.DataFrame, column: int | str) -> None:
         series = get_column(data, column)
@@ -28,16 +33,15 @@ class Mojibake(ErrorType):
         """Returns all column names with string dtype elements."""
         return data.select_dtypes(include=["string", "object"]).columns.to_list()
 
-    def _apply(self: Mojibake, data: pd.DataFrame, error_mask: pd.DataFrame, column: int | str) -> pd.Series:
+    def _apply_series(self: Mojibake, series: pd.Series, mask: np.ndarray) -> pd.Series:
         """Applies the Mojibake ErrorType to a column of data.
 
         Args:
-            data (pd.DataFrame): DataFrame containing the column to add errors to.
-            error_mask (pd.DataFrame): A Pandas DataFrame with the same index & columns as 'data' that will be modified and returned.
-            column (int | str): The column of 'data' to create an error mask for.
+            series (pd.Series): The column to add errors to.
+            mask (np.ndarray): A boolean array of the same length as 'series' that is True where errors are introduced.
 
         Returns:
-            pd.Series: The data column, 'column', after Mojibake errors at the locations specified by 'error_mask' are introduced.
+            pd.Series: 'series' after Mojibake errors at the locations specified by 'mask' are introduced.
         """
         # Top 10 most used encodings on the internet
         # https://w3techs.com/technologies/overview/character_encoding
@@ -57,7 +61,6 @@ class Mojibake(ErrorType):
             "iso-8859-2": top10 - {"iso-8859-2", "windows-1250", "iso-8859-1", "windows-1252"},
         }
 
-        series = get_column(data, column).copy()
         encoding_sender = self.config.encoding_sender
         encoding_receiver = self.config.encoding_receiver
 
@@ -67,8 +70,18 @@ class Mojibake(ErrorType):
             encoding_sender = random.choice(list(top10))
             encoding_receiver = random.choice(list(encodings[encoding_sender]))
 
-        series_mask = get_column(error_mask, column)
-        series.loc[series_mask] = (
-            series.loc[series_mask].apply(lambda x: x.encode(encoding_sender, errors="ignore")).apply(lambda x: x.decode(encoding_receiver, errors="ignore"))
-        )
+        if is_arrow_string_dtype(series.dtype):
+
+            def garble(x: str) -> str:
+                return x.encode(encoding_sender, errors="ignore").decode(encoding_receiver, errors="ignore")
+
+            return transform_masked_arrow_strings(series, mask, lambda values: map_arrow_strings(values, garble, unique=True))
+
+        if is_categorical_dtype(series.dtype):
+            return transform_masked_categories(
+                series, mask, lambda x: x.encode(encoding_sender, errors="ignore").decode(encoding_receiver, errors="ignore"), unique=True
+            )
+
+        series = series.copy()
+        series.loc[mask] = self._map_values(series.loc[mask], lambda x: x.encode(encoding_sender, errors="ignore").decode(encoding_receiver, errors="ignore"))
         return series
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from typing import Any
+
 import numpy as np
 import pandas as pd
 from pandas.api.types import is_datetime64_dtype, is_integer_dtype, is_numeric_dtype
@@ -38,29 +40,64 @@ class Outlier(ErrorType):
         """Returns all column names with numeric dtype elements."""
         return data.select_dtypes(include=["number", "datetime64"]).columns.tolist()
 
-    def _apply(self: Outlier, data: pd.DataFrame, error_mask: pd.DataFrame, column: int | str) -> pd.Series:
+    def _fit_statistics(self: Outlier, series: pd.Series) -> dict[str, Any]:
+        """Returns the mean and quartiles of 'series', of nanoseconds since the UNIX epoch for datetimes."""
+        if is_datetime64_dtype(series):
+            series = series.astype("int64")
+
+        return {"mean": series.mean(), "q1": series.quantile(0.25), "q3": series.quantile(0.75)}
+
+    def _apply_series(self: Outlier, series: pd.Series, mask: np.ndarray) -> pd.Series:
         """Applies the Outlier ErrorType to a column of data.
 
         Args:
-            data (pd.DataFrame): DataFrame containing the column to add errors to.
-            error_mask (pd.DataFrame): A Pandas DataFrame with the same index & columns as 'data' that will be modified and returned.
-            column (int | str): The column of 'data' to create an error mask for.
+            series (pd.Series): The column to add errors to.
+            mask (np.ndarray): A boolean array of the same length as 'series' that is True where errors are introduced.
 
         Returns:
-            pd.Series: The data column, 'column', after Outlier errors at the locations specified by 'error_mask' are introduced.
+            pd.Series: 'series' after Outlier errors at the locations specified by 'mask' are introduced.
         """
-        # Get the column series and mask
-        series = get_column(data, column).copy()
-        series_mask = get_column(error_mask, column)
+        statistics = self._get_statistics(series)
         was_datetime = False  # Default to false -- changes to code only occur if the series is datetime
 
         if is_datetime64_dtype(series):  # Convert to int if datetime (ns since UNIX epoch) -- We need to add robustness against intmax/floatmax
             series = series.astype("int64")
             was_datetime = True
 
-        mean_value = series.mean()
-        q1 = series.quantile(0.25)
-        q3 = series.quantile(0.75)
+        values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+        outliers = self._push_outliers(values, mask, statistics, is_integer=is_integer_dtype(series))
+
+        series = series.copy()
+        series.loc[mask] = outliers[mask]
+
+        if was_datetime:  # Handle datetime objects
+            series = pd.to_datetime(series)
+
+        return series
+
+    def _apply_array(self: Outlier, values: np.ndarray, mask: np.ndarray) -> np.ndarray:
+        """Pushes the masked values outside of the IQR boundaries and adds Gaussian noise, as `_apply_series` does."""
+        if self._statistics is not None:
+            statistics = self._statistics
+        else:
+            q1, q3 = np.nanquantile(values, [0.25, 0.75])
+            statistics = {"mean": np.nanmean(values), "q1": q1, "q3": q3}
+
+        return self._push_outliers(values.astype(np.float64), mask, statistics, is_integer=values.dtype.kind in "iu")
+
+    def _push_outliers(self: Outlier, values: np.ndarray, mask: np.ndarray, statistics: dict[str, Any], *, is_integer: bool) -> np.ndarray:
+        """Pushes the masked values outside of the IQR boundaries and adds Gaussian noise.
+
+        Args:
+            values (np.ndarray): The float values of the column, with NaN for missing values.
+            mask (np.ndarray): A boolean array of the same length as 'values' that is True where errors are introduced.
+            statistics (dict[str, Any]): The mean and quartiles of the column.
+            is_integer (bool): Whether the column contains integers, whose outliers are rounded to integers.
+
+        Returns:
+            np.ndarray: A float array with the outliers where 'mask' is True and 'values' elsewhere.
+        """
+        mean_value, q1, q3 = statistics["mean"], statistics["q1"], statistics["q3"]
         iqr = q3 - q1
 
         upper_boundary = q3 + 1.5 * iqr
@@ -70,32 +107,24 @@ class Outlier(ErrorType):
         perturbation_upper = self.config.outlier_coefficient * (upper_boundary - mean_value)
         perturbation_lower = self.config.outlier_coefficient * (mean_value - lower_boundary)
 
-        if is_integer_dtype(series):  # round float to int when series is int
+        if is_integer:  # round float to int when values are int
             perturbation_upper = np.ceil(perturbation_upper)
             perturbation_lower = np.floor(perturbation_lower)
 
         # Get masks for the different outlier types depending on the mean
-        mask_lower = (series < mean_value) & series_mask
-        mask_upper = (series > mean_value) & series_mask
-        mask_equal = (series == mean_value) & series_mask
+        mask_equal = (values == mean_value) & mask
+        result = values.copy()
 
         # Apply the constant perturbation to the respective mask
-        series.loc[mask_lower] -= perturbation_lower
-        series.loc[mask_upper] += perturbation_upper
+        result[(values < mean_value) & mask] -= perturbation_lower
+        result[(values > mean_value) & mask] += perturbation_upper
 
         # Handle the mean values with a coin flip
         coin_flips = self._random_generator.random(mask_equal.sum())
-        series.loc[mask_equal] += np.where(coin_flips > self.config.outlier_coin_flip_threshold, perturbation_upper, -perturbation_lower)
+        result[mask_equal] += np.where(coin_flips > self.config.outlier_coin_flip_threshold, perturbation_upper, -perturbation_lower)
 
         # Apply Gaussian noise to simulate the increase in measurement error of the outliers
-        noise_std = self.config.outlier_noise_coeff * iqr
+        noise = self._random_generator.normal(loc=0, scale=self.config.outlier_noise_coeff * iqr, size=mask.sum())
+        result[mask] += np.rint(noise) if is_integer else noise
 
-        if is_integer_dtype(series):  # round float to int when series is int
-            series.loc[series_mask] += np.rint(self._random_generator.normal(loc=0, scale=noise_std, size=series_mask.sum()))
-        else:
-            series.loc[series_mask] += self._random_generator.normal(loc=0, scale=noise_std, size=series_mask.sum())
-
-        if was_datetime:  # Handle datetime objects
-            series = pd.to_datetime(series)
-
-        return series
+        return result
@@ -5,11 +5,13 @@ from typing import TYPE_CHECKING
 
 from pandas.api.types import is_string_dtype
 
+from tab_err._arrow import is_arrow_string_dtype, map_arrow_strings, pa, pc, to_arrow, transform_masked_arrow_strings
 from tab_err._utils import get_column
 
 from ._error_type import ErrorType
 
 if TYPE_CHECKING:
+    import numpy as np
     import pandas as pd
 
 
@@ -35,6 +37,11 @@ def _check_column_format_consistency(separator_counts: list[int], column: int |
 class Permutate(ErrorType):
     """Permutates the parts of a compound value in a column."""
 
+    @property
+    def value_deterministic(self: Permutate) -> bool:  # type: ignore[override]
+        """Permutations by a fixed pattern are value-deterministic, whereas random permutations are drawn per value."""
+        return self.config.permutation_pattern is not None or self.config.permutation_automation_pattern == "fixed"
+
     @staticmethod
     def _check_type(data: pd.DataFrame, column: int | str) -> None:
         series = get_column(data, column)
@@ -63,42 +70,57 @@ class Permutate(ErrorType):
 
         return self.config.permutation_separator.join(new_string_as_part_list)
 
-    def _apply(self: Permutate, data: pd.DataFrame, error_mask: pd.DataFrame, column: int | str) -> pd.Series:
+    def _apply_series(self: Permutate, series: pd.Series, mask: np.ndarray) -> pd.Series:
         """Applies the `Permutate` `ErrorType` to a column of data.
 
         Args:
-            data (pd.DataFrame): DataFrame containing the column to add errors to.
-            error_mask (pd.DataFrame): A Pandas DataFrame with the same index & columns as 'data' that will be modified and returned.
-            column (int | str): The column of 'data' to create an error mask for.
+            series (pd.Series): The column to add errors to.
+            mask (np.ndarray): A boolean array of the same length as 'series' that is True where errors are introduced.
 
         Raises:
             ValueError: If the column conatins values not supported by the seperator, a ValueError will be thrown.
             ValueError: If a fixed_permutation_pattern is selected and all values are not formatted the same way, a ValueError will be thrown.
 
         Returns:
-            pd.Series: The data column, 'column', after Permutate errors at the locations specified by 'error_mask' are introduced.
+            pd.Series: 'series' after Permutate errors at the locations specified by 'mask' are introduced.
         """
-        series = get_column(data, column).copy()
-        series_mask = get_column(error_mask, column)
+        if is_arrow_string_dtype(series.dtype):
+            separator_counts = pc.count_substring(pc.drop_null(to_arrow(series)), self.config.permutation_separator).to_pylist()
+        else:
+            separator_counts = [x.count(self.config.permutation_separator) for x in series.dropna()]
 
-        separator_counts = [x.count(self.config.permutation_separator) for x in series.dropna()]
         for i, count in enumerate(separator_counts):
             if count == 0:
-                msg = f'Cannot permutate values, because column {column} contains value "{series[i]}" that is not separated by the separator '
+                msg = f'Cannot permutate values, because column {series.name} contains value "{series[i]}" that is not separated by the separator '
                 msg += f'"{self.config.permutation_separator}". To use another separator, define it in the ErrorTypeConfig.'
                 raise ValueError(msg)
 
+        new_pattern: list[int] | None = None
         if self.config.permutation_pattern is not None:  # Permutation of each entry from pattern.
-            _check_column_format_consistency(separator_counts, column)
+            _check_column_format_consistency(separator_counts, series.name)
             new_pattern = self.config.permutation_pattern
-            series.loc[series_mask] = series.loc[series_mask].apply(self._fixed_pattern_function, args=(new_pattern,))
 
         elif self.config.permutation_automation_pattern == "fixed":  # Fixed permutation -- random once, applied to all.
-            _check_column_format_consistency(separator_counts, column)
+            _check_column_format_consistency(separator_counts, series.name)
             new_pattern = _generate_shuffle_pattern(separator_counts[0])
-            series.loc[series_mask] = series.loc[series_mask].apply(self._fixed_pattern_function, args=(new_pattern,))
 
+        if is_arrow_string_dtype(series.dtype):
+            return transform_masked_arrow_strings(series, mask, lambda values: self._permutate_arrow_strings(values, new_pattern))
+
+        series = series.copy()
+        if new_pattern is not None:
+            series.loc[mask] = self._map_values(series.loc[mask], lambda x: self._fixed_pattern_function(x, new_pattern))
         else:  # Random permutation -- random for each entry.
-            series.loc[series_mask] = series.loc[series_mask].apply(self._random_pattern_function)
+            series.loc[mask] = series.loc[mask].apply(self._random_pattern_function)
 
         return series
+
+    def _permutate_arrow_strings(self: Permutate, values: pa.Array, new_pattern: list[int] | None) -> pa.Array:
+        """Permutates Arrow strings by a fixed pattern with pyarrow.compute kernels, or randomly per value if `new_pattern` is None."""
+        if new_pattern is None:
+            return map_arrow_strings(values, self._random_pattern_function)
+
+        parts = pc.split_pattern(values, self.config.permutation_separator)
+        return pc.binary_join_element_wise(
+            *[pc.list_element(parts, index) for index in new_pattern], pa.scalar(self.config.permutation_separator, type=values.type)
+        )
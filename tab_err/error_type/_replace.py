@@ -5,17 +5,22 @@ from typing import TYPE_CHECKING
 
 from pandas.api.types import is_string_dtype
 
+from tab_err._arrow import is_arrow_string_dtype, pc, transform_masked_arrow_strings
+from tab_err._categorical import is_categorical_dtype, transform_masked_categories
 from tab_err._utils import get_column
 
 from ._error_type import ErrorType
 
 if TYPE_CHECKING:
+    import numpy as np
     import pandas as pd
 
 
 class Replace(ErrorType):
     """Replace a part of strings within a column."""
 
+    value_deterministic = True
+
     @staticmethod
     def _check_type(data: pd.DataFrame, column: int | str) -> None:
         series = get_column(data, column)
@@ -28,25 +33,36 @@ class Replace(ErrorType):
         """Returns column names with string dtype elements."""
         return data.select_dtypes(include=["string", "object"]).columns.to_list()
 
-    def _apply(self: Replace, data: pd.DataFrame, error_mask: pd.DataFrame, column: int | str) -> pd.Series:
+    def _sample_config(self: Replace, series: pd.Series) -> None:
+        """Samples `replace_what` from a random value of 'series' if it is not configured."""
+        if self.config.replace_what is None:
+            msg = "The 'replace_what' parameter is not configured, defaulting to a random character from the given series. Replacements are not guaranteed."
+            warnings.warn(msg, stacklevel=3)
+            random_row = self._random_generator.choice(series.index)
+            self.config.replace_what = self._random_generator.choice(list(series[random_row]))
+
+    def _apply_series(self: Replace, series: pd.Series, mask: np.ndarray) -> pd.Series:
         """Applies the Replace ErrorType to a column of data.
 
         Args:
-            data (pd.DataFrame): DataFrame containing the column to add errors to.
-            error_mask (pd.DataFrame): A Pandas DataFrame with the same index & columns as 'data' that will be modified and returned.
-            column (int | str): The column of 'data' to create an error mask for.
+            series (pd.Series): The column to add errors to.
+            mask (np.ndarray): A boolean array of the same length as 'series' that is True where errors are introduced.
 
         Returns:
-            pd.Series: The data column, 'column', after Replace errors at the locations specified by 'error_mask' are introduced.
+            pd.Series: 'series' after Replace errors at the locations specified by 'mask' are introduced.
         """
-        series = get_column(data, column).copy()
-        series_mask = get_column(error_mask, column)
+        self._sample_config(series)
 
-        if self.config.replace_what is None:
-            msg = "The 'replace_what' parameter is not configured, defaulting to a random character from the given series. Replacements are not guaranteed."
-            warnings.warn(msg, stacklevel=2)
-            random_row = self._random_generator.choice(series.index)
-            self.config.replace_what = self._random_generator.choice(list(series[random_row]))
+        if is_arrow_string_dtype(series.dtype):
+            return transform_masked_arrow_strings(
+                series, mask, lambda values: pc.replace_substring(values, pattern=self.config.replace_what, replacement=self.config.replace_with)
+            )
+
+        if is_categorical_dtype(series.dtype):
+            return transform_masked_categories(
+                series, mask, lambda x: x.replace(self.config.replace_what, self.config.replace_with), unique=self.value_deterministic
+            )
 
-        series.loc[series_mask] = series.loc[series_mask].apply(lambda x: x.replace(self.config.replace_what, self.config.replace_with))
+        series = series.copy()
+        series.loc[mask] = self._map_values(series.loc[mask], lambda x: x.replace(self.config.replace_what, self.config.replace_with))
         return series
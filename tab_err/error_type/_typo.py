@@ -5,11 +5,14 @@ from typing import TYPE_CHECKING
 
 from pandas.api.types import is_string_dtype
 
+from tab_err._arrow import is_arrow_string_dtype, map_arrow_strings, transform_masked_arrow_strings
+from tab_err._categorical import is_categorical_dtype, transform_masked_categories
 from tab_err._utils import get_column
 
 from ._error_type import ErrorType
 
 if TYPE_CHECKING:
+    import numpy as np
     import pandas as pd
 
 
@@ -37,25 +40,29 @@ class Typo(ErrorType):
         """Returns column names with string dtype elements."""
         return data.select_dtypes(include=["string", "object"]).columns.to_list()
 
-    def _apply(self: Typo, data: pd.DataFrame, error_mask: pd.DataFrame, column: int | str) -> pd.Series:
+    def _apply_series(self: Typo, series: pd.Series, mask: np.ndarray) -> pd.Series:
         """Applies the Typo ErrorType to a column of data.
 
         Args:
-            data (pd.DataFrame): DataFrame containing the column to add errors to.
-            error_mask (pd.DataFrame): A Pandas DataFrame with the same index & columns as 'data' that will be modified and returned.
-            column (int | str): The column of 'data' to create an error mask for.
+            series (pd.Series): The column to add errors to.
+            mask (np.ndarray): A boolean array of the same length as 'series' that is True where errors are introduced.
         typo_error_period: specifies how frequent typo corruptions are - see class description for details.
 
         Returns:
-            pd.Series: The data column, 'column', after Typo errors at the locations specified by 'error_mask' are introduced.
+            pd.Series: 'series' after Typo errors at the locations specified by 'mask' are introduced.
         """
-        series = get_column(data, column).copy()
-        series_mask = get_column(error_mask, column)
 
         def butterfn(x: str) -> str:
             return typo(x, self.config.typo_error_period, self.config.typo_keyboard_layout)
 
-        series.loc[series_mask] = series.loc[series_mask].apply(butterfn)
+        if is_arrow_string_dtype(series.dtype):
+            return transform_masked_arrow_strings(series, mask, lambda values: map_arrow_strings(values, butterfn))
+
+        if is_categorical_dtype(series.dtype):
+            return transform_masked_categories(series, mask, butterfn)
+
+        series = series.copy()
+        series.loc[mask] = series.loc[mask].apply(butterfn)
         return series
 
 
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 import warnings
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
+import numpy as np
 from pandas.api.types import is_numeric_dtype
 
 from tab_err._utils import get_column
@@ -16,6 +17,8 @@ if TYPE_CHECKING:
 class WrongUnit(ErrorType):
     """Simulate a column containing values that are scaled because they are not stored in the same unit."""
 
+    value_deterministic = True
+
     @staticmethod
     def _check_type(data: pd.DataFrame, column: int | str) -> None:
         series = get_column(data, column)
@@ -28,24 +31,44 @@ class WrongUnit(ErrorType):
         """Returns all column names with numeric dtype elements."""
         return data.select_dtypes(include=["number"]).columns.tolist()
 
-    def _apply(self: WrongUnit, data: pd.DataFrame, error_mask: pd.DataFrame, column: int | str) -> pd.Series:
+    def _get_output_dtype(self: WrongUnit, dtype: Any) -> Any:  # noqa: ANN401
+        """Boolean columns become object columns, other numeric columns keep their dtype."""
+        if isinstance(dtype, np.dtype) and dtype.kind == "b":
+            return np.dtype("object")
+
+        return dtype
+
+    def _apply_series(self: WrongUnit, series: pd.Series, mask: np.ndarray) -> pd.Series:
         """Applies the WrongUnit ErrorType to a column of data.
 
         Args:
-            data (pd.DataFrame): DataFrame containing the column to add errors to.
-            error_mask (pd.DataFrame): A Pandas DataFrame with the same index & columns as 'data' that will be modified and returned.
-            column (int | str): The column of 'data' to create an error mask for.
+            series (pd.Series): The column to add errors to.
+            mask (np.ndarray): A boolean array of the same length as 'series' that is True where errors are introduced.
 
         Returns:
-            pd.Series: The data column, 'column', after Replace errors at the locations specified by 'error_mask' are introduced.
+            pd.Series: 'series' after Replace errors at the locations specified by 'mask' are introduced.
         """
         if self.config.wrong_unit_scaling is None:
             msg = "No scaling function was supplied for WrongUnit, defaulting to multiplication by 10.0."
             warnings.warn(msg, stacklevel=2)
             self.config.wrong_unit_scaling = lambda x: 10.0 * x
 
-        series = get_column(data, column).copy()
-        series_mask = get_column(error_mask, column)
+        series = series.copy()
 
-        series.loc[series_mask] = series.loc[series_mask].apply(self.config.wrong_unit_scaling)
+        series.loc[mask] = self._map_values(series.loc[mask], self.config.wrong_unit_scaling)
         return series
+
+    def _apply_array(self: WrongUnit, values: np.ndarray, mask: np.ndarray) -> np.ndarray:
+        """Scales the masked values. The scaling function is called once with all masked values, or per value if it does not support arrays."""
+        if self.config.wrong_unit_scaling is None:
+            msg = "No scaling function was supplied for WrongUnit, defaulting to multiplication by 10.0."
+            warnings.warn(msg, stacklevel=3)
+            self.config.wrong_unit_scaling = lambda x: 10.0 * x
+
+        result = values.astype(np.float64)  # scaled integers are floats, which `apply_array` only converts back if they are integers
+        try:
+            result[mask] = self.config.wrong_unit_scaling(values[mask])
+        except TypeError:  # e.g., math functions only accept scalars
+            result[mask] = [self.config.wrong_unit_scaling(value) for value in values[mask]]
+
+        return result
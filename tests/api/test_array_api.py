@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from tab_err import ErrorModel, error_mechanism, error_type
+from tab_err.api import array, mid_level
+
+
+def _config(columns: tuple[int | str, int | str, int | str]) -> dict:
+    """A configuration with all supported error mechanisms and error types, including two error models in one column."""
+    first, second, third = columns
+    return {
+        first: [
+            ErrorModel(error_mechanism.ENAR(seed=1), error_type.AddDelta(seed=1), 0.2),
+            ErrorModel(error_mechanism.ECAR(seed=2), error_type.MissingValue(seed=2), 0.1),
+        ],
+        second: [ErrorModel(error_mechanism.EAR(condition_to_column=first, seed=3), error_type.Outlier(seed=3), 0.3)],
+        third: [ErrorModel(error_mechanism.ECAR(seed=4), error_type.WrongUnit({"wrong_unit_scaling": lambda x: x * 1000}, seed=4), 0.25)],
+    }
+
+
+class TestArrayAPI:
+    """Tests the NumPy array front end."""
+
+    @pytest.mark.parametrize("dtype", ["float64", "int64"])
+    def test_same_errors_as_mid_level(self, dtype: str) -> None:
+        """Test that the errors are the ones that the mid-level API inserts into a DataFrame with the same values."""
+        data = np.random.default_rng(0).normal(100, 10, size=(200, 3)).astype(dtype)
+
+        dirty_data, error_mask = array.create_errors(data, _config((0, 1, 2)))
+        expected_dirty_data, expected_error_mask = mid_level.create_errors(pd.DataFrame(data), _config((0, 1, 2)))
+
+        assert dirty_data.dtype == np.float64
+        assert (error_mask == expected_error_mask.to_numpy()).all()
+        assert np.allclose(dirty_data, expected_dirty_data.to_numpy(dtype=float), equal_nan=True)
+        assert np.array_equal(data, np.random.default_rng(0).normal(100, 10, size=(200, 3)).astype(dtype))  # not mutated
+
+    def test_structured_array(self) -> None:
+        """Test that fields of structured arrays are denoted by name or position and keep or promote their dtypes."""
+        data = np.zeros(100, dtype=[("x", "f4"), ("y", "i8"), ("z", "i8")])
+        data["x"] = np.linspace(0, 1, 100)
+        data["y"] = np.arange(100)
+        data["z"] = np.arange(100)
+
+        config = {
+            "y": [ErrorModel(error_mechanism.ENAR(seed=1), error_type.MissingValue(), 0.2)],
+            2: [ErrorModel(error_mechanism.EAR(condition_to_column="x", seed=2), error_type.Outlier(seed=2), 0.1)],
+        }
+        dirty_data, error_mask = array.create_errors(data, config)
+
+        assert dirty_data.dtype == np.dtype([("x", "f4"), ("y", "f8"), ("z", "i8")])
+        assert error_mask.sum(axis=0).tolist() == [0, 20, 10]
+        assert np.isnan(dirty_data["y"]).sum() == error_mask[:, 1].sum()
+        assert (dirty_data["z"] != data["z"]).sum() <= error_mask[:, 2].sum()
+
+    def test_unsupported_input(self) -> None:
+        """Test that unsupported error types, non-numeric arrays, and unknown columns raise errors."""
+        data = np.ones((10, 2))
+
+        with pytest.raises(TypeError):
+            array.create_errors(data, {0: [ErrorModel(error_mechanism.ECAR(), error_type.Typo(), 0.5)]})
+        with pytest.raises(TypeError):
+            array.create_errors(data.astype(str), {0: [ErrorModel(error_mechanism.ECAR(), error_type.AddDelta(), 0.5)]})
+        with pytest.raises(KeyError):
+            array.create_errors(data, {"a": [ErrorModel(error_mechanism.ECAR(), error_type.AddDelta(), 0.5)]})
+        with pytest.raises(KeyError, match="position 2"):
+            array.create_errors(data, {2: [ErrorModel(error_mechanism.ECAR(), error_type.AddDelta(), 0.5)]})
+        with pytest.raises(KeyError, match="position 1"):
+            array.create_errors(np.ones(10, dtype=[("x", "f8")]), {1: [ErrorModel(error_mechanism.ECAR(), error_type.AddDelta(), 0.5)]})
+
+    def test_scaled_integers(self) -> None:
+        """Test that errors in integer arrays that are not integers stay floats, and that error types without array support raise TypeErrors."""
+        values = np.arange(10)
+        mask = values % 2 == 1
+
+        scaled = error_type.WrongUnit({"wrong_unit_scaling": lambda x: x * 1.5}).apply_array(values, mask)
+        assert scaled.dtype == np.float64
+        np.testing.assert_array_equal(scaled, np.where(mask, values * 1.5, values))
+        assert error_type.WrongUnit({"wrong_unit_scaling": lambda x: x * 10}).apply_array(values, mask).dtype == np.int64
+
+        with pytest.raises(TypeError, match="Typo does not support"):
+            error_type.Typo().apply_array(values, mask)
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from tab_err import ErrorModel, error_mechanism, error_type
+from tab_err.api import ResultCache, high_level, low_level, mid_level
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _config(seed: int | None = 1) -> dict:
+    """A configuration of a numeric and a string column, created anew for each call, as each run of an experiment would."""
+    return {
+        "B": [ErrorModel(error_mechanism.EAR(condition_to_column="A", seed=seed), error_type.AddDelta(seed=seed), 0.3)],
+        "C": [ErrorModel(error_mechanism.ECAR(seed=seed), error_type.Typo(seed=seed), 0.2)],
+    }
+
+
+class TestResultCache:
+    """Tests the ResultCache of the APIs."""
+
+    def test_mid_level_hit(self, test_data: dict[str, pd.DataFrame], tmp_path: Path) -> None:
+        """Test that a repeated call loads the result of the first call, memory-mapped, and that modifying it does not modify the cache."""
+        data = test_data["data_100rows_3columns"]
+        cache = ResultCache(tmp_path)
+
+        with pytest.warns(UserWarning, match="add_delta_value is none"):
+            data_dirty, error_mask = mid_level.create_errors(data, _config(), cache=cache)
+        cached_data_dirty, cached_error_mask = mid_level.create_errors(data, _config(), cache=cache)
+
+        assert len(cache) == 1
+        pd.testing.assert_frame_equal(cached_data_dirty, data_dirty)
+        pd.testing.assert_frame_equal(cached_error_mask, error_mask)
+        values = cached_data_dirty["B"].to_numpy()
+        while values is not None and not isinstance(values, np.memmap):
+            values = values.base
+        assert isinstance(values, np.memmap)
+
+        cached_data_dirty.loc[0, "B"] = -1.0
+        pd.testing.assert_frame_equal(mid_level.create_errors(data, _config(), cache=cache)[0], data_dirty)
+
+        other_data = data.assign(B=data["B"] + 1)
+        with pytest.warns(UserWarning, match="add_delta_value is none"):
+            mid_level.create_errors(other_data, _config(), cache=cache)
+        assert len(cache) == 2  # noqa: PLR2004
+
+    def test_low_and_high_level(self, test_data: dict[str, pd.DataFrame], tmp_path: Path) -> None:
+        """Test that the low- and high-level APIs are cached, and that calls with random errors are not."""
+        data = test_data["data_100rows_3columns"]
+        cache = ResultCache(tmp_path)
+        error_types = [error_type.MissingValue(seed=2), error_type.Typo(seed=2)]
+
+        expected = low_level.create_errors(data, "C", 0.5, error_mechanism.ENAR(seed=2), error_types[1], cache=cache)
+        cached = low_level.create_errors(data, "C", 0.5, error_mechanism.ENAR(seed=2), error_types[1], cache=cache)
+        pd.testing.assert_frame_equal(cached[0], expected[0])
+
+        # Excluded error mechanisms without seed do not make the errors random
+        expected = high_level.create_errors(
+            data, 0.3, error_types_to_include=error_types, error_mechanisms_to_exclude=[error_mechanism.EAR()], seed=3, cache=cache
+        )
+        cached = high_level.create_errors(
+            data, 0.3, error_types_to_include=error_types, error_mechanisms_to_exclude=[error_mechanism.EAR()], seed=3, cache=cache
+        )
+        pd.testing.assert_frame_equal(cached[1], expected[1])
+
+        n_entries = len(cache)
+        high_level.create_errors(data, 0.3, error_types_to_include=error_types, cache=cache)
+        high_level.create_errors(data, 0.3, error_types_to_include=[error_type.MissingValue()], seed=3, cache=cache)
+        with pytest.warns(UserWarning, match="add_delta_value is none"):
+            mid_level.create_errors(data, _config(seed=None), cache=cache)
+        assert len(cache) == n_entries == 2  # noqa: PLR2004
+
+    def test_lru_eviction(self, test_data: dict[str, pd.DataFrame], tmp_path: Path) -> None:
+        """Test that the least recently used entries are evicted when the entries exceed the maximum size."""
+        data = test_data["data_100rows_3columns"]
+
+        def config(seed: int) -> mid_level.MidLevelConfig:
+            return mid_level.MidLevelConfig({"A": [ErrorModel(error_mechanism.ECAR(seed=seed), error_type.MissingValue(seed=seed), 0.1)]})
+
+        mid_level.create_errors(data, config(0), cache=ResultCache(tmp_path))
+        entry_size = sum(path.stat().st_size for path in next(tmp_path.iterdir()).iterdir())
+        cache = ResultCache(tmp_path, max_bytes=int(2.5 * entry_size))
+
+        mid_level.create_errors(data, config(1), cache=cache)
+        mid_level.create_errors(data, config(0), cache=cache)  # a hit, which makes the entry of seed 0 more recently used than that of seed 1
+        mid_level.create_errors(data, config(2), cache=cache)
+
+        keys = [cache.key(data, "mid_level.create_errors", config(seed)) for seed in range(3)]
+        assert len(cache) == 2  # noqa: PLR2004
+        assert [key is not None and cache.load(key) is not None for key in keys] == [True, False, True]
+
+        with pytest.raises(ValueError, match="positive integer"):
+            ResultCache(tmp_path, max_bytes=0)
+        cache.clear()
+        assert len(cache) == 0
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from tab_err import ErrorModel, StageCollector, error_mechanism, error_type
+from tab_err.api import cost, high_level
+
+
+@pytest.fixture
+def schema() -> pd.Series:
+    """The dtypes of an integer, a float, a string, and a categorical column."""
+    return pd.Series({"A": np.dtype("int64"), "B": np.dtype("float64"), "C": np.dtype("object"), "D": pd.CategoricalDtype(["x", "y", "z"])})
+
+
+class TestEstimate:
+    """Tests the cost estimates of the mid- and high-level APIs."""
+
+    def test_estimate_mid_level(self, schema: pd.Series) -> None:
+        """Test the numbers of changed cells, the dtype changes, and the cost of the error models, without data."""
+        config = {
+            "A": [ErrorModel(error_mechanism.ECAR(), error_type.MissingValue(), 0.1), ErrorModel(error_mechanism.ENAR(), error_type.Outlier(), 0.2)],
+            "C": [ErrorModel(error_mechanism.EAR(condition_to_column="B"), error_type.Typo(), 0.3)],
+        }
+        n_rows = 1_000_000
+
+        estimate = cost.estimate(schema, n_rows, config)
+
+        assert [(step.column, step.error_mechanism, step.error_type, step.n_changed) for step in estimate.steps] == [
+            ("A", "ECAR", "MissingValue", 100_000),
+            ("A", "ENAR", "Outlier", 200_000),
+            ("C", "EAR", "Typo", 300_000),
+        ]
+        assert [step.output_dtype for step in estimate.steps] == [np.dtype("float64"), np.dtype("float64"), np.dtype("object")]
+        assert estimate.output_dtypes.to_dict() == {**schema.to_dict(), "A": np.dtype("float64")}
+        assert estimate.time == pytest.approx(sum(step.time for step in estimate.steps))
+        assert all(step.time > 0 and step.peak_memory > 0 for step in estimate.steps)
+        assert estimate.peak_memory > max(step.peak_memory for step in estimate.steps)
+        assert estimate.to_frame()["n_changed"].sum() == 600_000  # noqa: PLR2004
+
+        larger_estimate = cost.estimate(schema, 10 * n_rows, config)
+        assert larger_estimate.time > estimate.time
+        assert larger_estimate.peak_memory > estimate.peak_memory
+
+    def test_cost_models(self, schema: pd.Series) -> None:
+        """Test that the given cost models are used, and that classes without cost model get the most expensive one of their dtype."""
+        cost_models = {
+            ("ECAR", "int64"): cost.CostModel(1.0, 0.0, 0.0, 0.0, 0.0, 0.0),
+            ("MissingValue", "int64"): cost.CostModel(0.0, 0.0, 0.5, 0.0, 0.0, 8.0),
+            ("Typo", "int64"): cost.CostModel(0.0, 1.0, 0.0, 0.0, 16.0, 0.0),
+        }
+
+        estimate = cost.estimate(schema, 100, {"A": [ErrorModel(error_mechanism.ECAR(), error_type.MissingValue(), 0.1)]}, cost_models)
+        assert estimate.time == pytest.approx(1.0 + 0.5 * 10)
+        assert estimate.steps[0].peak_memory == 8 * 10
+
+        estimate = cost.estimate(schema, 100, {"A": [ErrorModel(error_mechanism.ECAR(), error_type.AddDelta(), 0.1)]}, cost_models)
+        assert estimate.time == pytest.approx(1.0 + (1.0 + 100 + 0.5 * 10))
+        assert estimate.steps[0].peak_memory == 16 * 100 + 8 * 10
+
+    def test_estimate_high_level(self) -> None:
+        """Test that the high-level estimate is of the error models that the high-level API draws with the same seed."""
+        random_generator = np.random.default_rng(0)
+        data = pd.DataFrame(
+            {
+                "A": random_generator.integers(0, 100, 100),
+                "B": random_generator.random(100),
+                "C": random_generator.choice(["foo", "bar"], 100).astype(object),
+                "D": pd.Categorical(random_generator.choice(["x", "y", "z"], 100), categories=["x", "y", "z"]),
+            }
+        )
+        error_types = [error_type.MissingValue(seed=1), error_type.Typo(seed=1), error_type.CategorySwap(seed=1)]
+        collector = StageCollector()
+        high_level.create_errors(data, 0.4, 2, error_types_to_include=error_types, seed=5, observer=collector)
+
+        estimate = cost.estimate_high_level(data.dtypes, 1_000_000, 0.4, 2, error_types_to_include=error_types, seed=5)
+
+        applied = [(event.column, event.component) for event in collector.events if event.stage in ("ErrorMechanism.sample", "ErrorType.apply")]
+        estimated = [(step.column, name) for step in estimate.steps for name in (step.error_mechanism, step.error_type)]
+        assert estimated == applied
+        assert all(step.n_changed == 200_000 for step in estimate.steps)  # noqa: PLR2004
+
+    def test_invalid_arguments(self, schema: pd.Series) -> None:
+        """Test that invalid numbers of rows and configurations that the job would reject raise errors."""
+        config = {"A": [ErrorModel(error_mechanism.ECAR(), error_type.Typo(), 0.1)]}
+
+        with pytest.raises(ValueError, match="positive integer"):
+            cost.estimate(schema, 0, {})
+        with pytest.raises(KeyError, match="does not exist"):
+            cost.estimate(schema, 10, {"E": [ErrorModel(error_mechanism.ECAR(), error_type.MissingValue(), 0.1)]})
+        with pytest.raises(TypeError):
+            cost.estimate(schema, 10, config)
+
+    def test_fit_cost_models(self) -> None:
+        """Test that the cost models recover linear costs of a report."""
+        results = [
+            {"benchmark": "error_type/Typo", "dtype": "object", "n_rows": n_rows, "error_rate": error_rate, "error": None, "tracemalloc_peak": 8 * n_rows}
+            | {"times": [0.5 + 1e-6 * n_rows + 1e-4 * int(n_rows * error_rate)]}
+            for n_rows in (1_000, 10_000, 100_000)
+            for error_rate in (0.1, 0.5)
+        ]
+
+        cost_models = cost.fit_cost_models({"kind": "micro", "results": results})
+
+        cost_model = cost_models["Typo", "object"]
+        assert (cost_model.seconds, cost_model.seconds_per_row, cost_model.seconds_per_cell) == pytest.approx((0.5, 1e-6, 1e-4))
+        assert cost_model.memory(50, 5) == pytest.approx(400)
+
+        with pytest.raises(ValueError, match="'micro' report"):
+            cost.fit_cost_models({"kind": "scaling", "results": []})
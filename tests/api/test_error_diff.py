@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from tab_err import ErrorDiff, ErrorModel, error_mechanism, error_type
+from tab_err.api import mid_level
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@pytest.fixture
+def data() -> pd.DataFrame:
+    """A DataFrame with integer, float, categorical, string, datetime, and Arrow-backed string columns."""
+    random_generator = np.random.default_rng(0)
+    return pd.DataFrame(
+        {
+            "i": random_generator.integers(0, 100, size=200),
+            "f": random_generator.normal(size=200),
+            "c": pd.Categorical(random_generator.choice(["x", "y"], size=200)),
+            "s": random_generator.choice(["foo bar", "baz"], size=200),
+            "t": pd.date_range("2025-01-01", periods=200, freq="h"),
+            "p": pd.array(random_generator.choice(["ab", "cd"], size=200), dtype="string[pyarrow]"),
+        }
+    )
+
+
+def _config() -> dict:
+    """A configuration whose error types change the dtypes of some columns."""
+    return {
+        "i": [ErrorModel(error_mechanism.ECAR(seed=1), error_type.MissingValue(), 0.1)],
+        "f": [
+            ErrorModel(error_mechanism.ENAR(seed=2), error_type.Outlier(seed=2), 0.2),
+            ErrorModel(error_mechanism.EAR(condition_to_column="i", seed=5), error_type.Mistype(), 0.1),
+        ],
+        "c": [ErrorModel(error_mechanism.ECAR(seed=3), error_type.Extraneous({"extraneous_value_template": "_{value}"}), 0.3)],
+        "s": [ErrorModel(error_mechanism.ECAR(seed=4), error_type.Typo(seed=4), 0.3)],
+        "t": [ErrorModel(error_mechanism.ECAR(seed=6), error_type.AddDelta({"add_delta_value": 60}), 0.1)],
+        "p": [ErrorModel(error_mechanism.ECAR(seed=7), error_type.MissingValue(), 0.1)],
+    }
+
+
+class TestErrorDiff:
+    """Tests the ErrorDiff and the mid-level API that creates it."""
+
+    def test_replay_and_invert(self, data: pd.DataFrame) -> None:
+        """Test that an ErrorDiff replays the data with errors and the error mask of create_errors and inverts them to the clean data."""
+        data_dirty, error_mask = mid_level.create_errors(data, _config())
+        error_diff = mid_level.create_error_diff(data, _config())
+
+        assert error_diff.n_errors == error_mask.to_numpy().sum()
+        pd.testing.assert_frame_equal(error_diff.replay(data), data_dirty)
+        pd.testing.assert_frame_equal(error_diff.error_mask(data), error_mask)
+        pd.testing.assert_frame_equal(error_diff.invert(data_dirty), data)
+        pd.testing.assert_frame_equal(ErrorDiff.from_frames(data, data_dirty, error_mask).replay(data), data_dirty)
+
+    def test_save_and_load(self, data: pd.DataFrame, tmp_path: Path) -> None:
+        """Test that a saved ErrorDiff loads with the dtypes of its values, and that pickled values need to be allowed."""
+        data_dirty, _ = mid_level.create_errors(data, _config())
+        error_diff = mid_level.create_error_diff(data, _config())
+        error_diff.save(tmp_path / "errors.npz")
+
+        with pytest.raises(ValueError, match="allow_pickle"):
+            ErrorDiff.load(tmp_path / "errors.npz")  # Mistype leaves values of mixed types
+
+        loaded = ErrorDiff.load(tmp_path / "errors.npz", allow_pickle=True)
+        pd.testing.assert_frame_equal(loaded.replay(data), data_dirty)
+        pd.testing.assert_frame_equal(loaded.invert(data_dirty), data)
+
+        config = {"p": _config()["p"]}
+        mid_level.create_error_diff(data, config).save(tmp_path / "strings.npz")
+        pd.testing.assert_frame_equal(ErrorDiff.load(tmp_path / "strings.npz").replay(data), mid_level.create_errors(data, config)[0])
+
+    def test_without_original_values(self, data: pd.DataFrame) -> None:
+        """Test that an ErrorDiff without original values cannot be inverted."""
+        error_diff = mid_level.create_error_diff(data, _config(), keep_original=False)
+
+        with pytest.raises(ValueError, match="keep_original"):
+            error_diff.invert(error_diff.replay(data))
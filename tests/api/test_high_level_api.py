@@ -2,7 +2,8 @@ import numpy as np
 import pandas as pd
 import pytest
 
-from tab_err.api.high_level import create_errors
+from tab_err import error_mechanism
+from tab_err.api.high_level import create_errors, create_errors_many
 
 
 class TestHighLevelAPI:
@@ -102,3 +103,32 @@ class TestHighLevelAPI:
         assert pytest.approx(error_rate) == data_4rows_5columns_error_mask.to_numpy().mean()
         assert pytest.approx(error_rate) == data_10rows_3columns_error_mask.to_numpy().mean()
         assert pytest.approx(error_rate) == data_100rows_3columns_error_mask.to_numpy().mean()
+
+    def test_create_errors_many(self, test_data: dict[str, pd.DataFrame]) -> None:
+        """Test that create_errors_many yields the same variants as calling create_errors once per seed."""
+        seeds = [1, 2, 3]
+        error_rate = 0.5
+
+        for n_jobs in [1, 2]:
+            variants = create_errors_many(test_data["data_100rows_3columns"], error_rate, seeds=seeds, n_error_models_per_column=2, n_jobs=n_jobs)
+
+            for seed, (modified_data, error_mask) in zip(seeds, variants):
+                expected_data, expected_error_mask = create_errors(test_data["data_100rows_3columns"], error_rate, n_error_models_per_column=2, seed=seed)
+                pd.testing.assert_frame_equal(modified_data, expected_data)
+                pd.testing.assert_frame_equal(error_mask, expected_error_mask)
+
+    def test_create_errors_many_checks_arguments_eagerly(self, test_data: dict[str, pd.DataFrame]) -> None:
+        """Test that create_errors_many checks its arguments when it is called, not when the first variant is requested."""
+        with pytest.raises(ValueError, match="error rate"):
+            create_errors_many(test_data["data_100rows_3columns"], 5.0, seeds=[1])
+        with pytest.raises(ValueError, match="n_jobs"):
+            create_errors_many(test_data["data_100rows_3columns"], 0.5, seeds=[1], n_jobs=0)
+
+    def test_create_errors_many_keeps_included_mechanisms(self, test_data: dict[str, pd.DataFrame]) -> None:
+        """Test that the error mechanisms passed to create_errors_many do not get the sort order cache of its variants."""
+        mechanisms = [error_mechanism.ENAR(seed=42), error_mechanism.EAR(condition_to_column="A", seed=42)]
+
+        for _ in create_errors_many(test_data["data_100rows_3columns"], 0.2, seeds=[1, 2], error_mechanisms_to_include=mechanisms):
+            pass
+
+        assert all(mechanism._sort_order_cache is None for mechanism in mechanisms)  # noqa: SLF001
@@ -1,8 +1,9 @@
+import numpy as np
 import pandas as pd
 import pytest
 
 from tab_err import error_mechanism, error_type
-from tab_err.api.low_level import create_errors
+from tab_err.api.low_level import create_errors, create_errors_sweep
 
 
 class TestLowLevelAPI:
@@ -22,3 +23,44 @@ class TestLowLevelAPI:
             # Assert that the error masks have the correct proportion of True to False - Note only one column is errored
             assert pytest.approx(error_rate / 3.0) == data_100rows_3columns_error_mask.to_numpy().mean()
             assert pytest.approx(error_rate / 3.0) == data_10rows_3columns_error_mask.to_numpy().mean()
+
+    def test_create_errors_sweep(self, test_data: dict[str, pd.DataFrame]) -> None:
+        """Test that create_errors_sweep returns nested error masks and only adds errors to newly masked cells."""
+        error_rates = [0.1, 0.2, 0.5, 1.0]
+
+        for mechanism in [error_mechanism.ECAR(seed=42), error_mechanism.ENAR(seed=42), error_mechanism.EAR(condition_to_column="B", seed=42)]:
+            variants = list(create_errors_sweep(test_data["data_100rows_3columns"], "A", error_rates, mechanism, error_type.AddDelta(seed=42)))
+            assert len(variants) == len(error_rates)
+
+            clean_data = test_data["data_100rows_3columns"]
+            previous_data, previous_error_mask = None, None
+            for error_rate, (modified_data, error_mask) in zip(error_rates, variants):
+                assert pytest.approx(error_rate / 3.0) == error_mask.to_numpy().mean()
+                pd.testing.assert_series_equal(modified_data["A"][~error_mask["A"]], clean_data["A"][~error_mask["A"]], check_dtype=False)
+
+                if previous_error_mask is not None:  # masks are nested and previous errors are kept
+                    assert (error_mask | ~previous_error_mask).all().all()
+                    pd.testing.assert_series_equal(modified_data["A"][previous_error_mask["A"]], previous_data["A"][previous_error_mask["A"]])
+                previous_data, previous_error_mask = modified_data, error_mask
+
+    def test_create_errors_sweep_random_stream(self, test_data: dict[str, pd.DataFrame]) -> None:
+        """Test that the error type draws the errors of all increments from one random stream instead of reseeding it per increment."""
+        data = test_data["data_100rows_3columns"]
+        (_, first_mask), (modified_data, error_mask) = create_errors_sweep(data, "B", [0.1, 0.2], error_mechanism.ECAR(seed=1), error_type.Outlier(seed=1))
+        increments = [first_mask["B"].to_numpy(), (error_mask["B"] & ~first_mask["B"]).to_numpy()]
+
+        random_generator = np.random.default_rng(1)
+        expected = data["B"]
+        for increment in increments:
+            expected = error_type.Outlier(seed=1).apply_series(expected, increment, random_generator)
+        pd.testing.assert_series_equal(modified_data["B"], expected)
+
+        reseeded = error_type.Outlier(seed=1).apply_series(error_type.Outlier(seed=1).apply_series(data["B"], increments[0]), increments[1])
+        assert not reseeded.equals(modified_data["B"])
+
+    def test_create_errors_sweep_unsorted_error_rates(self, test_data: dict[str, pd.DataFrame]) -> None:
+        """Test that create_errors_sweep and sample_sweep require error rates in ascending order."""
+        with pytest.raises(ValueError, match="ascending"):
+            next(create_errors_sweep(test_data["data_100rows_3columns"], "A", [0.5, 0.1], error_mechanism.ECAR(), error_type.AddDelta()))
+        with pytest.raises(ValueError, match="ascending"):
+            error_mechanism.ECAR().sample_sweep(test_data["data_100rows_3columns"], "A", [0.5, 0.1])
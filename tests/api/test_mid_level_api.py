@@ -0,0 +1,169 @@
+import warnings
+
+import pandas as pd
+import pytest
+
+from tab_err import ErrorModel, error_mechanism, error_type
+from tab_err._utils import derive_seeded_copy
+from tab_err.api import MidLevelConfig
+from tab_err.api.mid_level import append_errors, create_errors, create_errors_sweep, create_row_errors
+
+
+class TestMidLevelAPI:
+    """Tests the mid-level API."""
+
+    def test_create_errors_sweep(self, test_data: dict[str, pd.DataFrame]) -> None:
+        """Test that create_errors_sweep returns nested error masks at the scaled error rates."""
+        config = MidLevelConfig(
+            {
+                "A": [
+                    ErrorModel(error_mechanism.ENAR(seed=42), error_type.AddDelta(seed=42), 0.4),
+                    ErrorModel(error_mechanism.ECAR(seed=42), error_type.Outlier(seed=42), 0.4),
+                ],
+                "C": [ErrorModel(error_mechanism.EAR(condition_to_column="A", seed=42), error_type.Typo(seed=42), 0.5)],
+            }
+        )
+        scales = [0.0, 0.5, 1.0]
+
+        previous_error_mask = None
+        for scale, (modified_data, error_mask) in zip(scales, create_errors_sweep(test_data["data_100rows_3columns"], config, scales)):
+            assert pytest.approx(0.8 * scale) == error_mask["A"].mean()
+            assert pytest.approx(0.5 * scale) == error_mask["C"].mean()
+            assert not error_mask["B"].any()
+            assert (modified_data["C"][error_mask["C"]] != test_data["data_100rows_3columns"]["C"][error_mask["C"]]).all()
+
+            if previous_error_mask is not None:
+                assert (error_mask | ~previous_error_mask).all().all()  # masks are nested
+            previous_error_mask = error_mask
+
+    def test_compile(self, test_data: dict[str, pd.DataFrame]) -> None:
+        """Test that a compiled plan returns the same result as create_errors and validates the config up front."""
+        data = test_data["data_100rows_3columns"]
+        config = MidLevelConfig(
+            {
+                0: [
+                    ErrorModel(error_mechanism.ENAR(seed=42), error_type.AddDelta(config={"add_delta_value": 2}, seed=42), 0.2),
+                    ErrorModel(error_mechanism.ECAR(seed=42), error_type.Mistype(seed=42), 0.3),
+                ],
+                "C": [ErrorModel(error_mechanism.EAR(condition_to_column="A", seed=42), error_type.Typo(seed=42), 0.5)],
+            }
+        )
+        plan = config.compile(data.dtypes)
+
+        assert [step.column for step in plan.steps] == ["A", "A", "C"]
+        for _ in range(2):
+            modified_data, error_mask = plan.run(data)
+            expected_data, expected_error_mask = create_errors(data, config)
+            pd.testing.assert_frame_equal(modified_data, expected_data)
+            pd.testing.assert_frame_equal(error_mask, expected_error_mask)
+            pd.testing.assert_series_equal(modified_data.dtypes, plan.output_dtypes)
+
+        with pytest.raises(ValueError, match="schema"):
+            plan.run(data.astype({"A": "float64"}))
+
+    def test_compile_resolves_defaults(self, test_data: dict[str, pd.DataFrame]) -> None:
+        """Test that compile draws the parameters that would be drawn while running once, in copies of the error models."""
+        data = test_data["data_100rows_3columns"]
+        config = MidLevelConfig(
+            {
+                "A": [ErrorModel(error_mechanism.EAR(seed=42), error_type.AddDelta(seed=42), 0.2)],
+                "C": [ErrorModel(error_mechanism.ECAR(seed=42), error_type.Replace(config={"replace_with": "#"}, seed=42), 0.5)],
+            }
+        )
+        with pytest.warns(UserWarning, match="condition_to_column"):
+            plan = config.compile(data)
+
+        assert plan.steps[0].error_model.error_mechanism.condition_to_column in {"B", "C"}
+        assert plan.steps[0].error_model.error_type.config.add_delta_value is not None
+        assert plan.steps[1].error_model.error_type.config.replace_what is not None
+        assert config.columns["A"][0].error_mechanism.condition_to_column is None
+        assert config.columns["A"][0].error_type.config.add_delta_value is None
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            first_data, first_error_mask = plan.run(data)
+            second_data, second_error_mask = plan.run(data)
+        pd.testing.assert_frame_equal(first_data, second_data)
+        pd.testing.assert_frame_equal(first_error_mask, second_error_mask)
+
+    def test_compile_invalid_config(self, test_data: dict[str, pd.DataFrame]) -> None:
+        """Test that compiling an invalid config fails without touching data."""
+        schema = test_data["data_100rows_3columns"].dtypes
+
+        with pytest.raises(KeyError):
+            MidLevelConfig({"D": [ErrorModel(error_mechanism.ECAR(), error_type.AddDelta(), 0.2)]}).compile(schema)
+        with pytest.raises(KeyError):
+            MidLevelConfig({"A": [ErrorModel(error_mechanism.EAR(condition_to_column="D"), error_type.AddDelta(), 0.2)]}).compile(schema)
+        with pytest.raises(KeyError):
+            MidLevelConfig({"A": [ErrorModel(error_mechanism.EAR(condition_to_column=["B", "D"]), error_type.AddDelta(), 0.2)]}).compile(schema)
+        with pytest.raises(TypeError):
+            MidLevelConfig({"A": [ErrorModel(error_mechanism.ECAR(), error_type.Typo(), 0.2)]}).compile(schema)
+        with pytest.raises(ValueError, match="sum up"):
+            MidLevelConfig({"A": [ErrorModel(error_mechanism.ECAR(), error_type.AddDelta(), 0.6)] * 2}).compile(schema)
+
+    def test_append_errors(self, test_data: dict[str, pd.DataFrame]) -> None:
+        """Test that append_errors keeps the previous errors and inserts errors at the configured rates and config state into appended rows."""
+        data = test_data["data_100rows_3columns"]
+        config = MidLevelConfig(
+            {
+                "A": [ErrorModel(error_mechanism.ENAR(seed=42), error_type.AddDelta(seed=42), 0.2)],
+                "C": [ErrorModel(error_mechanism.ECAR(seed=42), error_type.Typo(seed=42), 0.5)],
+            }
+        )
+        with pytest.warns(UserWarning, match="add_delta_value"):
+            data_dirty, error_mask = create_errors(data.iloc[:60], config)
+
+        appended_data_dirty, appended_error_mask = append_errors(data_dirty, error_mask, data.iloc[60:], config)
+        new_rows = appended_error_mask.iloc[60:]
+
+        pd.testing.assert_frame_equal(appended_data_dirty.iloc[:60], data_dirty)
+        pd.testing.assert_frame_equal(appended_error_mask.iloc[:60], error_mask)
+        assert new_rows.sum().tolist() == [8, 0, 20]
+        pd.testing.assert_series_equal(
+            appended_data_dirty["A"].iloc[60:][new_rows["A"]], data["A"].iloc[60:][new_rows["A"]] + config.columns["A"][0].error_type.config.add_delta_value
+        )
+        assert not new_rows["C"].equals(create_errors(data.iloc[60:], config)[1]["C"])  # seeds are derived for the appended rows
+
+        with pytest.raises(ValueError, match="columns"):
+            append_errors(data_dirty, error_mask, data.iloc[60:, :2], config)
+
+    def test_append_errors_small_batches(self, test_data: dict[str, pd.DataFrame]) -> None:
+        """Test that appending batches too small for an error each still inserts errors at the configured rate into all rows."""
+        data = pd.concat([test_data["data_100rows_3columns"]] * 2, ignore_index=True).iloc[:190]
+        config = MidLevelConfig({"B": [ErrorModel(error_mechanism.ECAR(seed=42), error_type.MissingValue(), 0.1)]})
+
+        data_dirty, error_mask = create_errors(data.iloc[:10], config)
+        for start in range(10, 190, 9):
+            data_dirty, error_mask = append_errors(data_dirty, error_mask, data.iloc[start : start + 9], config)
+
+        assert error_mask.sum().tolist() == [0, 19, 0]
+        assert error_mask["B"].iloc[10:].sum() == error_mask["B"].sum() - 1
+        assert data_dirty["B"].isna().equals(error_mask["B"])
+
+    def test_append_errors_fitted_on_previous_rows(self, test_data: dict[str, pd.DataFrame]) -> None:
+        """Test that error types derive their statistics from the error-free cells of the previous rows instead of the appended rows."""
+        data = test_data["data_100rows_3columns"]
+        outlier = error_type.Outlier(seed=42)
+        config = MidLevelConfig({"B": [ErrorModel(error_mechanism.ECAR(seed=42), outlier, 0.5)]})
+        data_dirty, error_mask = create_errors(data.iloc[:60], config)
+
+        appended_data_dirty, appended_error_mask = append_errors(data_dirty, error_mask, data.iloc[60:], config)
+
+        new_mask = appended_error_mask["B"].iloc[60:].to_numpy()
+        fitted_outlier = derive_seeded_copy(outlier, 60).fit(data_dirty["B"][~error_mask["B"]])
+        pd.testing.assert_series_equal(appended_data_dirty["B"].iloc[60:], fitted_outlier.apply_series(data["B"].iloc[60:], new_mask))
+        assert not appended_data_dirty["B"].iloc[60:].equals(derive_seeded_copy(outlier, 60).apply_series(data["B"].iloc[60:], new_mask))
+        assert outlier._statistics is None  # noqa: SLF001
+
+    def test_create_row_errors(self, test_data: dict[str, pd.DataFrame]) -> None:
+        """Test that create_row_errors inserts the errors of each column's error type into the same rows of all columns."""
+        data = test_data["data_100rows_3columns"]
+        error_types = {"B": error_type.MissingValue(), 2: error_type.Typo(seed=42)}
+
+        data_dirty, error_mask = create_row_errors(data, 0.3, error_mechanism.RowCorrelated(seed=42), error_types)
+
+        assert error_mask.sum().tolist() == [0, 30, 30]
+        assert error_mask["B"].equals(error_mask["C"])
+        assert data_dirty["B"].isna().equals(error_mask["B"])
+        assert (data_dirty["C"][error_mask["C"]] != data["C"][error_mask["C"]]).all()
+        pd.testing.assert_frame_equal(data_dirty[~error_mask["B"]], data[~error_mask["B"]])
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import pandas as pd
+import pytest
+
+from tab_err import ErrorModel, error_mechanism, error_type
+from tab_err.api.minibatch import iter_minibatches
+
+
+def _config() -> dict:
+    """A configuration of error types that only draw from NumPy generators."""
+    return {
+        "A": [ErrorModel(error_mechanism.ENAR(seed=1), error_type.AddDelta(seed=1), 0.2)],
+        "B": [
+            ErrorModel(error_mechanism.ECAR(seed=2), error_type.Outlier(seed=2), 0.3),
+            ErrorModel(error_mechanism.EAR(condition_to_column="A", seed=3), error_type.MissingValue(seed=3), 0.2),
+        ],
+    }
+
+
+class TestMinibatch:
+    """Tests the minibatch iterator."""
+
+    def test_batches_cover_rows(self, test_data: dict[str, pd.DataFrame]) -> None:
+        """Test that the batches contain every row once, with errors at the configured rates."""
+        data = test_data["data_100rows_3columns"]
+
+        batches = list(iter_minibatches(data, _config(), 30, seed=0))
+
+        assert [len(batch) for batch, _ in batches] == [30, 30, 30, 10]
+        assert sorted(pd.concat([batch for batch, _ in batches]).index) == data.index.to_list()
+        for batch, error_mask in batches:
+            pd.testing.assert_index_equal(error_mask.index, batch.index)
+            assert error_mask["A"].sum() == int(len(batch) * 0.2)
+            assert error_mask["B"].sum() == int(len(batch) * 0.3) + int(len(batch) * 0.2)
+            assert not error_mask["C"].any()
+
+    def test_reproducible_across_threads(self, test_data: dict[str, pd.DataFrame]) -> None:
+        """Test that equal seeds yield equal batches with one and several threads, and that the batches differ from each other."""
+        data = test_data["data_100rows_3columns"]
+
+        single = list(iter_minibatches(data, _config(), 25, seed=4, n_threads=1, prefetch=1))
+        multiple = list(iter_minibatches(data, _config(), 25, seed=4, n_threads=3, prefetch=2))
+
+        for (batch, error_mask), (expected_batch, expected_error_mask) in zip(multiple, single):
+            pd.testing.assert_frame_equal(batch, expected_batch)
+            pd.testing.assert_frame_equal(error_mask, expected_error_mask)
+
+        unshuffled = list(iter_minibatches(data, _config(), 50, shuffle=False, seed=4))
+        assert unshuffled[0][0].index.to_list() == list(range(50))
+        assert not unshuffled[0][1].reset_index(drop=True).equals(unshuffled[1][1].reset_index(drop=True))
+
+    def test_early_stop_and_invalid_arguments(self, test_data: dict[str, pd.DataFrame]) -> None:
+        """Test that a consumer can stop early and that invalid arguments raise errors."""
+        data = test_data["data_100rows_3columns"]
+
+        batch_size = 10
+        batches = iter_minibatches(data, _config(), batch_size, seed=5)
+        assert len(next(batches)[0]) == batch_size
+        batches.close()
+
+        for kwargs in ({"batch_size": 0}, {"batch_size": 10, "n_threads": 0}, {"batch_size": 10, "prefetch": 0}):
+            with pytest.raises(ValueError, match="positive integer"):
+                next(iter_minibatches(data, _config(), **kwargs))
@@ -0,0 +1,78 @@
+import tracemalloc
+
+import pandas as pd
+
+from tab_err import ErrorModel, StageCollector, error_mechanism, error_type
+from tab_err.api import high_level, low_level, mid_level
+
+
+class TestObserver:
+    """Tests the instrumentation of the APIs with observers."""
+
+    def test_low_level_events(self, test_data: dict[str, pd.DataFrame]) -> None:
+        """Test that the low-level API reports its sampling, application, and whole call with the number of changed cells."""
+        collector = StageCollector()
+        _, error_mask = low_level.create_errors(
+            test_data["data_100rows_3columns"], "A", 0.3, error_mechanism.ECAR(seed=42), error_type.AddDelta(seed=42), observer=collector
+        )
+
+        assert [(event.stage, event.component, event.column) for event in collector.events] == [
+            ("ErrorMechanism.sample", "ECAR", "A"),
+            ("ErrorType.apply", "AddDelta", "A"),
+            ("low_level.create_errors", None, "A"),
+        ]
+        for event in collector.events:
+            assert event.n_cells == 100  # noqa: PLR2004
+            assert event.n_changed == error_mask["A"].sum() == 30  # noqa: PLR2004
+            assert event.wall_time >= 0
+            assert event.allocated_bytes is None
+
+    def test_mid_level_summary(self, test_data: dict[str, pd.DataFrame]) -> None:
+        """Test that the summary has one row per stage, component, and column and that allocations are measured while tracing."""
+        config = {
+            "A": [ErrorModel(error_mechanism.ENAR(seed=42), error_type.AddDelta(seed=42), 0.2)] * 2,
+            "C": [ErrorModel(error_mechanism.ECAR(seed=42), error_type.Typo(seed=42), 0.1)],
+        }
+        collector = StageCollector(trace_memory=True)
+
+        _, error_mask = mid_level.create_errors(test_data["data_100rows_3columns"], config, observer=collector)
+        assert not tracemalloc.is_tracing()
+
+        summary = collector.summary().set_index(["stage", "component", "column"])
+        assert summary.loc[("mid_level.create_errors", "", ""), "n_changed"] == error_mask.to_numpy().sum() == 50  # noqa: PLR2004
+        assert summary.loc[("ErrorType.apply", "AddDelta", "A"), "calls"] == 2  # noqa: PLR2004
+        assert summary.loc[("ErrorType.apply", "AddDelta", "A"), "n_changed"] == 40  # noqa: PLR2004
+        assert summary.loc[("ErrorMechanism.sample", "ECAR", "C"), "n_changed"] == 10  # noqa: PLR2004
+        assert (summary["allocated_bytes"] >= 0).all()
+        assert summary.index[0] == ("mid_level.create_errors", "", "")  # the enclosing stage takes the longest
+
+    def test_outer_tracing_keeps_peak(self, test_data: dict[str, pd.DataFrame]) -> None:
+        """Test that stages do not reset the peak of tracemalloc if it was started outside of them, and that sample reports its marked cells."""
+        data = test_data["data_100rows_3columns"]
+        error_mask = pd.DataFrame(data=False, index=data.index, columns=data.columns)
+        error_mask.loc[:9, "A"] = True
+        collector = StageCollector(trace_memory=True)
+
+        tracemalloc.start()
+        try:
+            allocation = bytearray(10**7)
+            del allocation
+            _, peak = tracemalloc.get_traced_memory()
+            mask = error_mechanism.ECAR(seed=42).sample(data, "A", 0.25, error_mask.copy(), observer=collector)
+            assert tracemalloc.get_traced_memory()[1] >= peak >= 10**7
+        finally:
+            tracemalloc.stop()
+
+        (event,) = collector.events
+        assert event.n_changed == (mask ^ error_mask).to_numpy().sum() == 25  # noqa: PLR2004
+        assert event.allocated_bytes is None  # the stage did not exceed the peak from before it
+
+    def test_high_level_without_observer(self, test_data: dict[str, pd.DataFrame]) -> None:
+        """Test that observing a run does not change its result."""
+        collector = StageCollector()
+        observed = high_level.create_errors(test_data["data_100rows_3columns"], 0.2, seed=42, observer=collector)
+        unobserved = high_level.create_errors(test_data["data_100rows_3columns"], 0.2, seed=42)
+
+        pd.testing.assert_frame_equal(observed[0], unobserved[0])
+        pd.testing.assert_frame_equal(observed[1], unobserved[1])
+        assert {"high_level.create_errors", "high_level.build_config", "mid_level.create_errors"} <= {event.stage for event in collector.events}
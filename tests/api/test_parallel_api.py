@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from tab_err import ErrorModel, error_mechanism, error_type
+from tab_err.api import mid_level, parallel
+
+
+@pytest.fixture
+def data() -> pd.DataFrame:
+    """A DataFrame with missing values, ties, categories, and strings."""
+    random_generator = np.random.default_rng(0)
+    data = pd.DataFrame(
+        {
+            "a": random_generator.normal(size=1000),
+            "b": random_generator.integers(0, 20, size=1000),
+            "c": pd.Categorical(random_generator.choice(["x", "y", "z"], size=1000), categories=["z", "x", "y"]),
+            "d": random_generator.choice(["p", "q", "r", None], size=1000),
+        }
+    )
+    data.loc[random_generator.choice(1000, 100, replace=False), "a"] = np.nan
+    return data
+
+
+def _block_config() -> dict:
+    """A configuration of ENAR and EAR error models, including several error models per column."""
+    return {
+        "a": [
+            ErrorModel(error_mechanism.ENAR(seed=1), error_type.MissingValue(), 0.2),
+            ErrorModel(error_mechanism.EAR(condition_to_column="b", seed=2), error_type.MissingValue(), 0.3),
+        ],
+        "b": [ErrorModel(error_mechanism.EAR(condition_to_column="c", seed=3), error_type.MissingValue(), 0.25)],
+        "d": [
+            ErrorModel(error_mechanism.ENAR(seed=4), error_type.MissingValue(), 0.6),
+            ErrorModel(error_mechanism.EAR(condition_to_column="a", seed=5), error_type.MissingValue(), 0.1),
+        ],
+    }
+
+
+class TestParallelAPI:
+    """Tests the row-partitioned API."""
+
+    @pytest.mark.parametrize("n_jobs", [1, 3])
+    def test_same_blocks_as_mid_level(self, data: pd.DataFrame, n_jobs: int, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that ENAR and EAR select the same cells as in a single process, also if the sketches of the partitions are coarse."""
+        monkeypatch.setattr(parallel, "N_SKETCH_POINTS", 4)
+
+        dirty_data, error_mask = parallel.create_errors(data, _block_config(), n_jobs=n_jobs)
+        expected_dirty_data, expected_error_mask = mid_level.create_errors(data, _block_config())
+
+        pd.testing.assert_frame_equal(error_mask, expected_error_mask)
+        pd.testing.assert_frame_equal(dirty_data, expected_dirty_data)
+
+    def test_random_errors(self, data: pd.DataFrame) -> None:
+        """Test that ECAR inserts the configured number of errors into cells that do not contain errors yet."""
+        config = {
+            "a": [
+                ErrorModel(error_mechanism.ENAR(seed=1), error_type.MissingValue(), 0.2),
+                ErrorModel(error_mechanism.ECAR(seed=2), error_type.AddDelta({"add_delta_value": 1000}, seed=2), 0.5),
+            ]
+        }
+        dirty_data, error_mask = parallel.create_errors(data, config, n_jobs=4)
+        _, block_mask = parallel.create_errors(data, {"a": config["a"][:1]}, n_jobs=4)
+        random_cells = error_mask["a"] & ~block_mask["a"]
+
+        assert error_mask.sum().tolist() == [700, 0, 0, 0]
+        assert random_cells.sum() == 500  # noqa: PLR2004
+        assert dirty_data.loc[block_mask["a"], "a"].isna().all()
+        np.testing.assert_allclose(dirty_data.loc[random_cells, "a"], data.loc[random_cells, "a"] + 1000)
+
+    def test_parameters_of_whole_column(self, data: pd.DataFrame) -> None:
+        """Test that error types derive their parameters from the whole column instead of the partitions, also if the rows are ordered."""
+        data = data.sort_values("a", ignore_index=True)
+
+        def config() -> dict:
+            return {
+                "a": [ErrorModel(error_mechanism.ENAR(seed=1), error_type.Outlier({"outlier_noise_coeff": 0.0}, seed=1), 0.2)],
+                "b": [ErrorModel(error_mechanism.EAR(condition_to_column="a", seed=2), error_type.AddDelta(seed=2), 0.3)],
+            }
+
+        parallel_config = config()
+        with pytest.warns(UserWarning, match="add_delta_value"):
+            dirty_data, error_mask = parallel.create_errors(data, parallel_config, n_jobs=3)
+        with pytest.warns(UserWarning, match="add_delta_value"):
+            expected_dirty_data, expected_error_mask = mid_level.create_errors(data, config())
+
+        assert parallel_config["b"][0].error_type.config.add_delta_value is not None
+        pd.testing.assert_frame_equal(error_mask, expected_error_mask)
+        pd.testing.assert_frame_equal(dirty_data, expected_dirty_data)
+
+    def test_invalid_arguments(self, data: pd.DataFrame) -> None:
+        """Test that unsupported numbers of jobs raise errors."""
+        with pytest.raises(ValueError, match="n_jobs"):
+            parallel.create_errors(data, _block_config(), n_jobs=0)
+
+    def test_shared_memory(self, data: pd.DataFrame) -> None:
+        """Test that exchanging columns through shared memory inserts the same errors as pickling them, for all kinds of columns."""
+        data = data.assign(e=data["d"].astype("string[pyarrow]"), f=pd.date_range("2025-01-01", periods=len(data), freq="h"))
+        config = {
+            **_block_config(),
+            "c": [ErrorModel(error_mechanism.ECAR(seed=6), error_type.Typo(seed=6), 0.3)],
+            "e": [ErrorModel(error_mechanism.ECAR(seed=7), error_type.Typo(seed=7), 0.3)],
+            "f": [ErrorModel(error_mechanism.ENAR(seed=8), error_type.AddDelta({"add_delta_value": 3600}, seed=8), 0.2)],
+        }
+        shm = Path("/dev/shm")  # noqa: S108
+        blocks_before = set(shm.iterdir()) if shm.is_dir() else set()
+
+        dirty_data, error_mask = parallel.create_errors(data, config, n_jobs=3, shared_memory=True)
+        expected_dirty_data, expected_error_mask = parallel.create_errors(data, config, n_jobs=3)
+
+        pd.testing.assert_frame_equal(error_mask, expected_error_mask)
+        pd.testing.assert_frame_equal(dirty_data, expected_dirty_data)
+        assert (set(shm.iterdir()) if shm.is_dir() else set()) == blocks_before
+
+    def test_shared_memory_worker_failure(self, data: pd.DataFrame) -> None:
+        """Test that the shared memory blocks of the workers that succeeded are unlinked if another worker fails."""
+        data = data.assign(s=["x y"] * 500 + ["x y", "x y z"] * 250)  # only the second partition has values of different formats
+        config = {
+            "a": [ErrorModel(error_mechanism.ECAR(seed=1), error_type.AddDelta({"add_delta_value": 1}, seed=1), 0.5)],
+            "s": [ErrorModel(error_mechanism.ECAR(seed=2), error_type.Permutate({"permutation_automation_pattern": "fixed"}, seed=2), 0.5)],
+        }
+        shm = Path("/dev/shm")  # noqa: S108
+        blocks_before = set(shm.iterdir()) if shm.is_dir() else set()
+
+        with pytest.raises(ValueError, match="formatted in the same way"):
+            parallel.create_errors(data, config, n_jobs=2, shared_memory=True)
+
+        assert (set(shm.iterdir()) if shm.is_dir() else set()) == blocks_before
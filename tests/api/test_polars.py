@@ -0,0 +1,105 @@
+import warnings
+
+import pandas as pd
+import pytest
+
+from tab_err import ErrorModel, _polars, error_mechanism, error_type
+from tab_err.api import high_level, low_level, mid_level
+
+pl = pytest.importorskip("polars")
+pytest.importorskip("pyarrow")
+
+
+@pytest.fixture
+def polars_data() -> pl.DataFrame:
+    """A polars DataFrame with numeric, string, and categorical columns."""
+    return pl.DataFrame(
+        {
+            "A": list(range(100)),
+            "B": [float(i) / 3 for i in range(100)],
+            "C": [f"word{i} other{i}" for i in range(100)],
+            "D": pl.Series(["X", "Y", "Z", "X"] * 25, dtype=pl.Categorical),
+        }
+    )
+
+
+class TestPolars:
+    """Tests that the APIs accept and return polars DataFrames."""
+
+    def test_low_level(self, polars_data: pl.DataFrame) -> None:
+        """Test that the low-level API returns polars DataFrames with the same errors as for pandas."""
+        dirty_data, error_mask = low_level.create_errors(polars_data, "C", 0.2, error_mechanism.ENAR(seed=42), error_type.Typo(seed=42))
+        pandas_dirty_data, pandas_error_mask = low_level.create_errors(
+            polars_data.to_pandas(), "C", 0.2, error_mechanism.ENAR(seed=42), error_type.Typo(seed=42)
+        )
+
+        assert isinstance(dirty_data, pl.DataFrame)
+        assert isinstance(error_mask, pl.DataFrame)
+        assert dirty_data.schema == polars_data.schema
+        assert error_mask["C"].to_list() == pandas_error_mask["C"].to_list()
+        assert dirty_data["C"].to_list() == pandas_dirty_data["C"].to_list()
+
+    def test_mid_level_mixed_types(self, polars_data: pl.DataFrame) -> None:
+        """Test that columns whose values have mixed types after inserting errors become string columns."""
+        config = {
+            "A": [ErrorModel(error_mechanism.ECAR(seed=42), error_type.Extraneous({"extraneous_value_template": "#{value}"}), 0.1)],
+            "D": [ErrorModel(error_mechanism.EAR(condition_to_column="B", seed=42), error_type.CategorySwap(seed=42), 0.3)],
+        }
+        dirty_data, error_mask = mid_level.create_errors(polars_data, config)
+
+        assert dirty_data.schema["A"] == pl.String
+        assert dirty_data.schema["D"] == pl.Categorical
+        assert dirty_data.filter(error_mask["A"])["A"].str.starts_with("#").all()
+        assert error_mask.sum().row(0) == (10, 0, 0, 30)
+
+    def test_high_level_and_mechanism(self, polars_data: pl.DataFrame) -> None:
+        """Test that the high-level API and error mechanisms accept polars DataFrames."""
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            dirty_data, error_mask = high_level.create_errors(polars_data, 0.2, seed=42)
+
+        assert isinstance(dirty_data, pl.DataFrame)
+        assert dirty_data.columns == polars_data.columns
+        assert error_mask.to_pandas().to_numpy().mean() == pytest.approx(0.2)
+
+        mask = error_mechanism.ECAR(seed=42).sample(polars_data, "A", 0.5)
+        assert isinstance(mask, pl.DataFrame)
+        pd.testing.assert_frame_equal(mask.to_pandas(), error_mechanism.ECAR(seed=42).sample(polars_data.to_pandas(), "A", 0.5))
+        assert error_mechanism.ECAR(seed=42).sample(polars_data, "A", 0.2, mask).sum().row(0) == (70, 0, 0, 0)
+
+    def test_schema_of_unchanged_columns(self, polars_data: pl.DataFrame) -> None:
+        """Test that columns keep their polars dtypes through the conversion to pandas, unless their errors do not fit into them."""
+        data = polars_data.with_columns(
+            pl.Series("E", [None, *range(99)], dtype=pl.Int64), pl.Series("F", [None, *range(99)], dtype=pl.Int64), pl.Series("G", [True, None] * 50)
+        )
+
+        dirty_data, error_mask = low_level.create_errors(data, "B", 0.2, error_mechanism.ECAR(seed=42), error_type.AddDelta(seed=42))
+        assert dirty_data.schema == data.schema
+        assert dirty_data.drop("B").equals(data.drop("B"))
+        assert error_mask.schema == dict.fromkeys(data.columns, pl.Boolean)
+
+        dirty_data, _ = low_level.create_errors(data, "E", 0.2, error_mechanism.ECAR(seed=42), error_type.AddDelta({"add_delta_value": 2}, seed=42))
+        assert dirty_data.schema == data.schema
+
+        dirty_data, _ = low_level.create_errors(data, "F", 0.2, error_mechanism.ECAR(seed=42), error_type.AddDelta({"add_delta_value": 0.5}, seed=42))
+        assert dirty_data.schema == {**data.schema, "F": pl.Float64}
+
+    def test_only_read_columns_are_converted(self, polars_data: pl.DataFrame, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that the mid-level API and error mechanisms convert only the columns they insert errors into or sample by."""
+        converted = []
+        column_to_pandas = _polars._column_to_pandas  # noqa: SLF001
+        monkeypatch.setattr(_polars, "_column_to_pandas", lambda column: converted.append(column.name) or column_to_pandas(column))
+        config = {"C": [ErrorModel(error_mechanism.EAR(condition_to_column="B", seed=42), error_type.Typo(seed=42), 0.2)]}
+
+        dirty_data, error_mask = mid_level.create_errors(polars_data, config)
+        assert sorted(converted) == ["B", "C"]
+        assert dirty_data.drop("C").equals(polars_data.drop("C"))
+
+        expected_dirty_data, expected_error_mask = mid_level.create_errors(_polars.polars_to_pandas(polars_data), config)
+        assert dirty_data["C"].to_list() == expected_dirty_data["C"].to_list()
+        pd.testing.assert_frame_equal(error_mask.to_pandas(), expected_error_mask)
+
+        converted.clear()
+        positions = error_mechanism.ENAR(seed=42).sample_priority(polars_data, "A", 0.3)
+        assert converted == ["A"]
+        assert positions.tolist() == error_mechanism.ENAR(seed=42).sample_priority(polars_data.to_pandas(), "A", 0.3).tolist()
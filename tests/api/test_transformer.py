@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from tab_err import ErrorModel, error_mechanism, error_type
+from tab_err.api import TabErrTransformer, mid_level
+
+
+class TestTabErrTransformer:
+    """Tests the TabErrTransformer."""
+
+    def test_transform_matches_mid_level(self, test_data: dict[str, pd.DataFrame]) -> None:
+        """Test that transforming the fitted data without seed inserts the same errors as the mid-level API, for error types without statistics."""
+        data = test_data["data_100rows_3columns"]
+        config = {
+            "A": [ErrorModel(error_mechanism.ENAR(seed=1), error_type.MissingValue(seed=1), 0.3)],
+            "C": [ErrorModel(error_mechanism.EAR(condition_to_column="A", seed=2), error_type.Typo(seed=2), 0.5)],
+        }
+
+        data_dirty, error_mask = TabErrTransformer(config).fit(data).transform_with_mask(data)
+        expected_data_dirty, expected_error_mask = mid_level.create_errors(data, config)
+
+        pd.testing.assert_frame_equal(data_dirty, expected_data_dirty)
+        pd.testing.assert_frame_equal(error_mask, expected_error_mask)
+
+    def test_transform_uses_fitted_statistics(self, test_data: dict[str, pd.DataFrame]) -> None:
+        """Test that Outlier errors of a batch are derived from the quartiles of the fitted data, without fitting the configured error type."""
+        data = test_data["data_100rows_3columns"]
+        outlier = error_type.Outlier(config={"outlier_noise_coeff": 0.0}, seed=3)
+        transformer = TabErrTransformer({"B": [ErrorModel(error_mechanism.ECAR(seed=3), outlier, 1.0)]}).fit(data)
+        batch = data.iloc[:10]
+
+        data_dirty = transformer.transform(batch)
+
+        q1, q3 = data["B"].quantile([0.25, 0.75])
+        mean_value = data["B"].mean()
+        upper = batch["B"] > mean_value
+        np.testing.assert_allclose(data_dirty["B"][upper], batch["B"][upper] + q3 + 1.5 * (q3 - q1) - mean_value)
+        np.testing.assert_allclose(data_dirty["B"][~upper], batch["B"][~upper] - mean_value + q1 - 1.5 * (q3 - q1))
+        assert outlier._statistics is None  # noqa: SLF001
+
+    def test_transform_seeds(self, test_data: dict[str, pd.DataFrame]) -> None:
+        """Test that equal seeds insert equal errors into a batch and different seeds different errors."""
+        data = test_data["data_100rows_3columns"]
+        transformer = TabErrTransformer({"B": [ErrorModel(error_mechanism.ECAR(seed=4), error_type.AddDelta(seed=4), 0.5)]}, seed=0).fit(data)
+
+        pd.testing.assert_frame_equal(transformer.transform(data, seed=1), transformer.transform(data, seed=1))
+        assert not transformer.transform(data, seed=1).equals(transformer.transform(data, seed=2))
+        pd.testing.assert_frame_equal(transformer.transform(data), transformer.transform(data, seed=0))
+
+    def test_estimator_interface(self, test_data: dict[str, pd.DataFrame]) -> None:
+        """Test the parameters, the errors for unfitted transformers and other schemas, and the feature names."""
+        data = test_data["data_100rows_3columns"]
+        config = {"A": [ErrorModel(error_mechanism.ECAR(seed=5), error_type.AddDelta(seed=5), 0.2)]}
+        transformer = TabErrTransformer(config)
+
+        assert transformer.set_params(seed=7).get_params() == {"config": config, "seed": 7}
+        with pytest.raises(ValueError, match="Invalid parameter"):
+            transformer.set_params(error_rate=0.1)
+        with pytest.raises(ValueError, match="not fitted"):
+            transformer.transform(data)
+
+        assert transformer.fit_transform(data).shape == data.shape
+        assert transformer.get_feature_names_out().tolist() == ["A", "B", "C"]
+        with pytest.raises(ValueError, match="schema"):
+            transformer.transform(data.astype({"A": "float64"}))
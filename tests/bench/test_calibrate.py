@@ -0,0 +1,8 @@
+from tab_err.api.cost import fit_cost_models
+from tab_err.bench import run_micro_benchmarks
+
+
+def test_fit_cost_models() -> None:
+    """Test that cost models are fitted to the report of the micro benchmarks."""
+    report = {"kind": "micro", "results": [result.to_dict() for result in run_micro_benchmarks(sizes=[100, 1000], dtypes=["float64"], index_types=["range"])]}
+    assert {("Outlier", "float64"), ("EAR", "float64")} <= set(fit_cost_models(report))
@@ -0,0 +1,20 @@
+from tab_err import error_type
+from tab_err.bench import run_import_benchmarks
+
+
+def test_import_budget() -> None:
+    """Test that importing tab_err stays within its budget and does not import pandas, which submodules import on first use."""
+    (result,) = run_import_benchmarks(["import tab_err"])
+
+    assert result.within_budget
+    assert "pandas" not in result.packages
+    assert "polars" not in result.packages
+
+
+def test_error_type_registry() -> None:
+    """Test that error types are resolved by name, also when deserialized."""
+    typo = error_type.get_error_type("Typo")({"typo_keyboard_layout": "ansi-qwerty"})
+
+    assert isinstance(typo, error_type.Typo)
+    assert isinstance(error_type.ErrorType.from_dict(typo.to_dict()), error_type.Typo)
+    assert set(error_type.ERROR_TYPE_NAMES) <= set(dir(error_type))
@@ -0,0 +1,28 @@
+import json
+from pathlib import Path
+
+from tab_err.bench import run_micro_benchmarks
+from tab_err.bench.__main__ import main
+
+
+def test_run_micro_benchmarks() -> None:
+    """Test that the micro benchmarks measure supported cases and record failing ones."""
+    results = run_micro_benchmarks(sizes=[100], dtypes=["int64", "object"], error_rates=[0.1], index_types=["string"], repeat=2)
+    benchmarks = {(result.benchmark, result.dtype): result for result in results}
+
+    assert len(benchmarks[("error_type/AddDelta", "int64")].times) == 2  # noqa: PLR2004
+    assert len(benchmarks[("error_mechanism/ENAR", "object")].times) == 2  # noqa: PLR2004
+    assert benchmarks[("error_type/AddDelta", "int64")].tracemalloc_peak > 0
+    assert ("error_type/Typo", "int64") not in benchmarks  # Typo does not support integers
+    assert benchmarks[("error_type/Mistype", "object")].error is not None
+
+
+def test_micro_report(tmp_path: Path) -> None:
+    """Test that the command line interface writes a JSON report."""
+    output = tmp_path / "micro.json"
+    main(["micro", "--sizes", "100", "--dtypes", "float64", "--error-rates", "0.5", "--index-types", "range", "--select", "Outlier", "--output", str(output)])
+    report = json.loads(output.read_text())
+
+    assert report["kind"] == "micro"
+    assert [result["benchmark"] for result in report["results"]] == ["error_type/Outlier"]
+    assert report["results"][0]["min"] > 0
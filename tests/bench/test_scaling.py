@@ -0,0 +1,36 @@
+import json
+from pathlib import Path
+
+from tab_err.bench import run_scaling_benchmarks
+from tab_err.bench.__main__ import main
+
+
+def test_run_scaling_benchmarks() -> None:
+    """Test that the scaling benchmarks measure every API and only one error model per column for the low-level API."""
+    results = run_scaling_benchmarks(rows=[200], columns=[5], models_per_column=[1, 2], isolate=False)
+
+    assert [(result.api, result.n_error_models_per_column) for result in results] == [
+        ("low_level", 1),
+        ("mid_level", 1),
+        ("mid_level", 2),
+        ("high_level", 1),
+        ("high_level", 2),
+        ("parallel", 1),
+        ("parallel", 2),
+    ]
+    for result in results:
+        if result.error is None:
+            assert result.wall_time > 0
+            assert result.tracemalloc_peak > 0
+            assert result.to_dict()["tracemalloc_multiple"] > 0
+
+
+def test_scaling_report(tmp_path: Path) -> None:
+    """Test that the command line interface writes a JSON report of the scaling benchmarks."""
+    output = tmp_path / "scaling.json"
+    main(["scaling", "--apis", "mid_level", "--rows", "100", "--columns", "5", "--models", "1", "--no-isolate", "--output", str(output)])
+    report = json.loads(output.read_text())
+
+    assert report["kind"] == "scaling"
+    assert [(result["api"], result["n_rows"]) for result in report["results"]] == [("mid_level", 100)]
+    assert report["results"][0]["error"] is None
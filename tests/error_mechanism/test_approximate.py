@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from tab_err import error_mechanism
+from tab_err.error_mechanism._error_mechanism import APPROXIMATE_SAMPLE_SIZE
+
+
+@pytest.fixture
+def data() -> pd.DataFrame:
+    """A DataFrame with more rows than the approximate block selection samples, with missing values, ties, and strings."""
+    random_generator = np.random.default_rng(0)
+    n_rows = 5 * APPROXIMATE_SAMPLE_SIZE
+    data = pd.DataFrame(
+        {
+            "a": random_generator.normal(size=n_rows),
+            "b": random_generator.integers(0, 100, size=n_rows),
+            "c": random_generator.choice(["x", "y", "z"], size=n_rows),
+        }
+    )
+    data.loc[random_generator.choice(n_rows, 100, replace=False), "a"] = np.nan
+    return data
+
+
+@pytest.mark.parametrize("mechanism", [error_mechanism.ENAR(seed=1, approximate=True), error_mechanism.EAR(condition_to_column="b", seed=1, approximate=True)])
+@pytest.mark.parametrize("error_rate", [0.1, 0.5, 0.99])
+def test_approximate_block(data: pd.DataFrame, mechanism: error_mechanism.ErrorMechanism, error_rate: float) -> None:
+    """Test that approximate blocks contain the exact number of cells, sorted by value, and all cells between their first and last value."""
+    error_mask = pd.DataFrame(data=False, index=data.index, columns=data.columns)
+    error_mask.loc[: len(data) // 1000, "a"] = True
+
+    positions = mechanism.sample_priority(data, "a", error_rate, error_mask)
+    block_column = "a" if isinstance(mechanism, error_mechanism.ENAR) else "b"
+    values = data[block_column].to_numpy()[positions]
+    error_free_values = data.loc[~error_mask["a"], block_column]
+
+    assert len(positions) == int(len(data) * error_rate)
+    assert len(np.unique(positions)) == len(positions)
+    assert not error_mask["a"].to_numpy()[positions].any()
+    assert (np.diff(values[~np.isnan(values)]) >= 0).all()
+    assert ((error_free_values > np.nanmin(values)) & (error_free_values < np.nanmax(values))).sum() <= len(positions)
+
+
+def test_approximate_fallback(data: pd.DataFrame) -> None:
+    """Test that approximate blocks of columns without numeric sort keys are the exact blocks."""
+    exact = error_mechanism.ENAR(seed=2).sample_priority(data, "c", 0.3)
+    approximate = error_mechanism.ENAR(seed=2, approximate=True).sample_priority(data, "c", 0.3)
+
+    np.testing.assert_array_equal(approximate, exact)
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from tab_err import ErrorModel, error_mechanism, error_type
+from tab_err._utils import SortOrderCache
+from tab_err.api import parallel
+
+
+@pytest.fixture
+def data() -> pd.DataFrame:
+    """A DataFrame with a string and an integer column to condition on, with missing values and ties."""
+    random_generator = np.random.default_rng(0)
+    data = pd.DataFrame(
+        {
+            "region": random_generator.choice(["north", "south", "east", None], size=500),
+            "date": random_generator.integers(0, 30, size=500),
+            "value": random_generator.normal(size=500),
+        }
+    )
+    data.loc[random_generator.choice(500, 20, replace=False), "date"] = None
+    return data
+
+
+@pytest.mark.parametrize("error_rate", [0.1, 0.4])
+def test_multiple_conditioning_columns(data: pd.DataFrame, error_rate: float) -> None:
+    """Test that EAR conditioned on a list of columns selects a contiguous block of error-free rows sorted by the columns in order."""
+    error_mask = pd.DataFrame(data=False, index=data.index, columns=data.columns)
+    error_mask.loc[:49, "value"] = True
+    mechanism = error_mechanism.EAR(condition_to_column=["region", "date"], seed=1)
+
+    positions = mechanism.sample_priority(data, "value", error_rate, error_mask)
+
+    expected_order = data.loc[~error_mask["value"]].sort_values(["region", "date"], kind="stable", na_position="last").index.to_numpy()
+    start = int(np.flatnonzero(expected_order == positions[0])[0])
+    assert len(positions) == int(len(data) * error_rate)
+    np.testing.assert_array_equal(positions, expected_order[start : start + len(positions)])
+
+
+def test_sort_order_is_cached_per_column_tuple(data: pd.DataFrame) -> None:
+    """Test that repeated samples of the same DataFrame reuse the sort order of the tuple of conditioning columns if a cache is set."""
+    mechanism = error_mechanism.EAR(condition_to_column=[0, "date"], seed=2)
+    mechanism._sort_order_cache = SortOrderCache()  # noqa: SLF001
+    first = mechanism.sample(data, "value", 0.2)
+    order = mechanism._sort_order_cache._orders[("region", "date")]  # noqa: SLF001
+
+    second = mechanism.sample(data, "value", 0.2, first.copy())
+
+    assert mechanism._sort_order_cache._orders[("region", "date")] is order  # noqa: SLF001
+    assert (second | ~first).all(axis=None)
+    assert second["value"].sum() == 2 * first["value"].sum()
+
+
+def test_sort_order_is_not_cached_by_default(data: pd.DataFrame) -> None:
+    """Test that a reused error mechanism samples a DataFrame that was mutated in-place like a new error mechanism."""
+    mechanism = error_mechanism.ENAR(seed=0)
+    mechanism.sample_priority(data, "value", 0.1)
+
+    data["value"] = -data["value"]
+
+    np.testing.assert_array_equal(mechanism.sample_priority(data, "value", 0.1), error_mechanism.ENAR(seed=0).sample_priority(data, "value", 0.1))
+
+
+def test_invalid_conditioning_columns(data: pd.DataFrame) -> None:
+    """Test that an empty list of conditioning columns and the parallel API with several conditioning columns raise errors."""
+    with pytest.raises(ValueError, match="at least one column"):
+        error_mechanism.EAR(condition_to_column=[], seed=3).sample(data, "value", 0.1)
+
+    config = {"value": [ErrorModel(error_mechanism.EAR(condition_to_column=["region", "date"], seed=3), error_type.MissingValue(), 0.1)]}
+    with pytest.raises(TypeError, match="multiple conditioning columns"):
+        parallel.create_errors(data, config, n_jobs=1)
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import pandas as pd
+import pytest
+
+from tab_err import ErrorModel, error_mechanism, error_type
+from tab_err._utils import get_column
+from tab_err.api import MidLevelConfig, mid_level
+
+
+class LegacyECAR(error_mechanism.ErrorMechanism):
+    """An error mechanism of earlier versions, which implements `_sample` instead of `_sample_positions`."""
+
+    def _sample(self: LegacyECAR, data: pd.DataFrame, column: str | int, error_rate: float, error_mask: pd.DataFrame) -> pd.DataFrame:  # noqa: ARG002
+        se_mask = get_column(error_mask, column)
+        se_mask_error_free = se_mask[~se_mask]
+        error_indices = self._random_generator.choice(se_mask_error_free.index, int(se_mask.size * error_rate), replace=False)
+        se_mask[error_indices] = True
+        return error_mask
+
+
+def test_legacy_sample(test_data: dict[str, pd.DataFrame]) -> None:
+    """Test that error mechanisms implementing `_sample` of earlier versions still sample DataFrames, but not arrays."""
+    data = test_data["data_100rows_3columns"]
+    error_mask = pd.DataFrame(data=False, index=data.index, columns=data.columns)
+    error_mask.loc[:9, "A"] = True
+
+    sampled_error_mask = LegacyECAR(seed=42).sample(data, "A", 0.2, error_mask.copy())
+    assert sampled_error_mask.sum().tolist() == [30, 0, 0]
+    assert sampled_error_mask["A"][:10].all()
+
+    positions = LegacyECAR(seed=42).sample_priority(data, "A", 0.2, error_mask)
+    assert positions.shape == (20,)
+    assert not error_mask["A"].iloc[positions].any()
+    assert not error_mask["A"][10:].any()  # the error mask passed in is not modified
+
+    config = MidLevelConfig({"B": [ErrorModel(LegacyECAR(seed=42), error_type.MissingValue(), 0.3)]})
+    data_dirty, result_error_mask = mid_level.create_errors(data, config)
+    assert result_error_mask.sum().tolist() == [0, 30, 0]
+    assert data_dirty["B"].isna().equals(result_error_mask["B"])
+
+    with pytest.raises(TypeError, match="_sample_positions"):
+        LegacyECAR(seed=42).sample_array_priority(data[["A", "B"]].to_numpy(), 0, 0.2)
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from tab_err import error_mechanism
+
+
+@pytest.fixture
+def data() -> pd.DataFrame:
+    """A wide DataFrame of random numbers."""
+    random_generator = np.random.default_rng(0)
+    return pd.DataFrame(random_generator.random((1_000, 8)), columns=[f"c{i}" for i in range(8)])
+
+
+def test_all_columns_of_rows(data: pd.DataFrame) -> None:
+    """Test that every erroneous row has errors in all sampled columns and that rows with errors in them are not sampled again."""
+    columns = ["c0", "c2", 5]
+    error_mask = pd.DataFrame(data=False, index=data.index, columns=data.columns)
+    error_mask.loc[:99, "c2"] = True
+
+    mask = error_mechanism.RowCorrelated(seed=1).sample_rows(data, columns, 0.3, error_mask)
+
+    erroneous_rows = (mask ^ error_mask).any(axis=1)
+    assert erroneous_rows.sum() == 300  # noqa: PLR2004
+    assert (mask.loc[erroneous_rows, ["c0", "c2", "c5"]]).all().all()
+    assert not mask.loc[:, ["c1", "c3", "c4", "c6", "c7"]].any().any()
+    assert not erroneous_rows[:100].any()
+    assert error_mask.to_numpy().sum() == 100  # noqa: PLR2004
+
+    with pytest.raises(ValueError, match="error-free cells"):
+        error_mechanism.RowCorrelated(seed=1).sample_rows(data, columns, 0.95, error_mask)
+
+
+def test_column_count_probabilities(data: pd.DataFrame) -> None:
+    """Test that the numbers of erroneous columns per row follow the distribution, and that the positions match the mask of the same seed."""
+    columns = list(data.columns)
+    mechanism = error_mechanism.RowCorrelated(seed=2, column_count_probabilities=[0.5, 0.0, 0.5])
+
+    mask = mechanism.sample_rows(data, columns, 0.6)
+    positions = mechanism.sample_row_positions(data, columns, 0.6)
+
+    counts = mask.sum(axis=1)
+    assert set(counts.unique()) == {0, 1, 3}
+    assert (counts > 0).sum() == 600  # noqa: PLR2004
+    assert (counts == 1).sum() == pytest.approx(300, abs=50)
+    assert mask.sum().min() > 0  # the columns are drawn at random
+    for column in columns:
+        np.testing.assert_array_equal(positions[column], np.flatnonzero(mask[column].to_numpy()))
+
+    capped = error_mechanism.RowCorrelated(seed=2, column_count_probabilities=[0.0, 0.0, 1.0]).sample_rows(data, ["c0", "c1"], 0.1)
+    assert (capped.sum(axis=1).isin([0, 2])).all()
+
+    with pytest.raises(ValueError, match="sum up to 1"):
+        error_mechanism.RowCorrelated(column_count_probabilities=[0.5, 0.6])
+
+
+def test_per_column_rows(data: pd.DataFrame) -> None:
+    """Test that seeded instances select the same rows of every column when they are used per column."""
+    mechanism = error_mechanism.RowCorrelated(seed=3)
+
+    positions = [mechanism.sample_priority(data, column, 0.2) for column in data.columns]
+
+    assert len(positions[0]) == 200  # noqa: PLR2004
+    for column_positions in positions[1:]:
+        np.testing.assert_array_equal(column_positions, positions[0])
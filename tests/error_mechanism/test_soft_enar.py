@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from tab_err import error_mechanism
+
+
+@pytest.fixture
+def data() -> pd.DataFrame:
+    """A DataFrame with a numeric column with missing values, a conditioning column, and a string column."""
+    random_generator = np.random.default_rng(0)
+    n_rows = 2_000
+    data = pd.DataFrame(
+        {
+            "a": random_generator.normal(size=n_rows),
+            "b": np.arange(n_rows),
+            "c": random_generator.choice(["x", "y", "z"], size=n_rows),
+        }
+    )
+    data.loc[random_generator.choice(n_rows, 50, replace=False), "a"] = np.nan
+    return data
+
+
+@pytest.mark.parametrize("column", ["a", "c"])
+@pytest.mark.parametrize("error_rate", [0.0, 0.1, 0.5, 0.85])
+def test_exact_count_and_exclusion(data: pd.DataFrame, column: str, error_rate: float) -> None:
+    """Test that exactly the requested number of distinct cells is selected, none of which is erroneous yet."""
+    error_mask = pd.DataFrame(data=False, index=data.index, columns=data.columns)
+    error_mask.loc[: len(data) // 10, column] = True
+
+    positions = error_mechanism.SoftENAR(seed=1, steepness=2.0).sample_priority(data, column, error_rate, error_mask)
+
+    assert len(positions) == int(len(data) * error_rate)
+    assert len(np.unique(positions)) == len(positions)
+    assert not error_mask[column].to_numpy()[positions].any()
+
+
+def test_all_error_free_cells(data: pd.DataFrame) -> None:
+    """Test that all error-free cells are selected if the error rate requires them."""
+    error_mask = pd.DataFrame(data=False, index=data.index, columns=data.columns)
+    error_mask.loc[: len(data) // 2 - 1, "a"] = True
+
+    positions = error_mechanism.SoftENAR(seed=1).sample_priority(data, "a", 0.5, error_mask)
+
+    np.testing.assert_array_equal(np.sort(positions), np.arange(len(data) // 2, len(data)))
+
+
+@pytest.mark.parametrize(("steepness", "larger"), [(3.0, True), (-3.0, False)])
+def test_depends_on_value(data: pd.DataFrame, steepness: float, *, larger: bool) -> None:
+    """Test that positive steepness prefers large values and negative steepness small values, of the column or the conditioning column."""
+    own = error_mechanism.SoftENAR(seed=2, steepness=steepness).sample_priority(data, "a", 0.2)
+    conditioned = error_mechanism.SoftENAR(condition_to_column="b", seed=2, steepness=steepness).sample_priority(data, "a", 0.2)
+
+    assert (np.nanmean(data["a"].to_numpy()[own]) > np.nanmean(data["a"])) == larger
+    assert (data["b"].to_numpy()[conditioned].mean() > data["b"].mean()) == larger
+
+
+def test_nested_and_reproducible(data: pd.DataFrame) -> None:
+    """Test that equal seeds select the same cells and masks of lower error rates are contained in those of higher ones."""
+    mechanism = error_mechanism.SoftENAR(seed=3)
+    low = mechanism.sample(data, "a", 0.1)
+    high = mechanism.sample(data, "a", 0.3)
+
+    pd.testing.assert_frame_equal(low, error_mechanism.SoftENAR(seed=3).sample(data, "a", 0.1))
+    assert not (low & ~high).to_numpy().any()
+
+
+def test_array(data: pd.DataFrame) -> None:
+    """Test that numeric arrays select the same cells as DataFrames."""
+    array = data[["a", "b"]].to_numpy()
+
+    np.testing.assert_array_equal(
+        error_mechanism.SoftENAR(seed=4).sample_array_priority(array, 0, 0.2),
+        error_mechanism.SoftENAR(seed=4).sample_priority(data[["a", "b"]], "a", 0.2),
+    )
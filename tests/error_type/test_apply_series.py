@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from tab_err import ErrorModel, error_mechanism, error_type
+from tab_err._utils import get_column
+from tab_err.api import MidLevelConfig, mid_level
+
+
+@pytest.fixture
+def data() -> pd.DataFrame:
+    """A DataFrame with a numeric and a string column and a non-default index."""
+    random_generator = np.random.default_rng(0)
+    return pd.DataFrame({"a": random_generator.normal(size=100), "b": random_generator.choice(["x y", "y z"], size=100)}, index=np.arange(100, 300, 2))
+
+
+@pytest.mark.parametrize(
+    ("error", "column"),
+    [
+        (error_type.Outlier(seed=1), "a"),
+        (error_type.AddDelta({"add_delta_value": 5}, seed=1), "a"),
+        (error_type.Typo(seed=1), "b"),
+        (error_type.MissingValue(), "b"),
+    ],
+)
+def test_same_errors_as_apply(data: pd.DataFrame, error: error_type.ErrorType, column: str) -> None:
+    """Test that apply_series inserts the same errors as apply with a DataFrame mask that is True at the same cells."""
+    mask = np.random.default_rng(2).random(len(data)) < 0.3  # noqa: PLR2004
+    error_mask = pd.DataFrame(data=False, index=data.index, columns=data.columns)
+    error_mask[column] = mask
+
+    pd.testing.assert_series_equal(error.apply_series(data[column], mask), error.apply(data, error_mask, column))
+
+
+def test_generator(data: pd.DataFrame) -> None:
+    """Test that apply_series draws from a given generator instead of the seed and does not modify the Series."""
+    mask = np.ones(len(data), dtype=bool)
+    original = data["a"].copy()
+    first = error_type.Outlier(seed=1).apply_series(data["a"], mask, np.random.default_rng(3))
+    second = error_type.Outlier(seed=2).apply_series(data["a"], mask, np.random.default_rng(3))
+
+    pd.testing.assert_series_equal(first, second)
+    pd.testing.assert_series_equal(data["a"], original)
+
+
+def test_invalid_mask(data: pd.DataFrame) -> None:
+    """Test that masks of another length and columns of unsupported dtypes raise errors."""
+    with pytest.raises(ValueError, match="length"):
+        error_type.MissingValue().apply_series(data["a"], np.ones(len(data) - 1, dtype=bool))
+
+    with pytest.raises(TypeError, match="Column a"):
+        error_type.Typo().apply_series(data["a"], np.ones(len(data), dtype=bool))
+
+
+class LegacyNegate(error_type.ErrorType):
+    """An error type of earlier versions, which implements `_apply` instead of `_apply_series`."""
+
+    @staticmethod
+    def _check_type(data: pd.DataFrame, column: str | int) -> None:
+        pass
+
+    def _get_valid_columns(self: LegacyNegate, data: pd.DataFrame) -> list[str | int]:
+        return data.select_dtypes(include="number").columns.to_list()
+
+    def _apply(self: LegacyNegate, data: pd.DataFrame, error_mask: pd.DataFrame, column: str | int) -> pd.Series:
+        series = get_column(data, column)
+        return series.where(~get_column(error_mask, column), -series)
+
+
+def test_legacy_apply(data: pd.DataFrame) -> None:
+    """Test that error types implementing `_apply` of earlier versions are applied through apply and apply_series."""
+    mask = np.random.default_rng(2).random(len(data)) < 0.3  # noqa: PLR2004
+    error_mask = pd.DataFrame(data=False, index=data.index, columns=data.columns)
+    error_mask["a"] = mask
+    expected = data["a"].where(~mask, -data["a"])
+
+    pd.testing.assert_series_equal(LegacyNegate().apply(data, error_mask, "a"), expected)
+    pd.testing.assert_series_equal(LegacyNegate().apply_series(data["a"], mask), expected)
+    pd.testing.assert_series_equal(LegacyNegate().apply_series(data["a"].rename(None), mask), expected.rename(None))
+
+    config = MidLevelConfig({"a": [ErrorModel(error_mechanism.ECAR(seed=42), LegacyNegate(), 0.3)]})
+    data_dirty, result_error_mask = mid_level.create_errors(data, config)
+    pd.testing.assert_series_equal(data_dirty["a"], data["a"].where(~result_error_mask["a"], -data["a"]))
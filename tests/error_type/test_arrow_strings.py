@@ -0,0 +1,36 @@
+import pandas as pd
+import pytest
+
+from tab_err import ErrorType, error_type
+
+pa = pytest.importorskip("pyarrow")
+
+ERROR_TYPES = [
+    error_type.Typo(seed=42),
+    error_type.Mojibake({"encoding_sender": "utf_8", "encoding_receiver": "windows-1251"}, seed=42),
+    error_type.Replace({"replace_what": "-", "replace_with": "+"}, seed=42),
+    error_type.Extraneous({"extraneous_value_template": "#{value}!"}, seed=42),
+    error_type.Extraneous({"extraneous_value_template": "{{{value}}}"}, seed=42),
+    error_type.Permutate({"permutation_separator": "-", "permutation_pattern": [2, 0, 1]}, seed=42),
+    error_type.Permutate({"permutation_separator": "-"}, seed=42),
+    error_type.MissingValue(seed=42),
+    error_type.MissingValue({"missing_value": "?"}, seed=42),
+]
+
+
+@pytest.mark.parametrize("dtype", [pd.ArrowDtype(pa.string()), pd.ArrowDtype(pa.large_string()), pd.StringDtype("pyarrow")])
+@pytest.mark.parametrize("error_type_", ERROR_TYPES, ids=lambda error_type_: type(error_type_).__name__)
+def test_arrow_strings(error_type_: ErrorType, dtype: pd.api.extensions.ExtensionDtype) -> None:
+    """Test that string error types keep Arrow-backed columns Arrow-backed and insert the same errors as for object columns."""
+    values = ["Alice-Bob-Clara", "Zoë-Yann-Xu", "David-Eve-Frank", "Grace-Heidi-Ivan"]
+    error_mask = pd.DataFrame({"A": [True, False, True, True]})
+
+    arrow_series = error_type_.apply(pd.DataFrame({"A": pd.Series(values, dtype=dtype)}), error_mask, "A")
+    object_series = error_type_.apply(pd.DataFrame({"A": pd.Series(values, dtype=object)}), error_mask, "A")
+
+    assert arrow_series.dtype == dtype
+    assert arrow_series[~error_mask["A"]].tolist() == values[1:2]
+    if isinstance(error_type_, error_type.MissingValue) and error_type_.config.missing_value is None:
+        assert arrow_series[error_mask["A"]].isna().all()  # object columns contain the string "<NA>" instead
+    else:
+        assert arrow_series.tolist() == object_series.tolist()
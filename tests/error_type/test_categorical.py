@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import pandas as pd
+import pytest
+
+from tab_err import ErrorModel, error_mechanism, error_type
+from tab_err.api import MidLevelConfig
+
+
+@pytest.fixture
+def data() -> pd.DataFrame:
+    """A DataFrame with a categorical column with missing values and an unused category."""
+    return pd.DataFrame({"a": pd.Categorical(["Berlin", "Paris", "Rome", "Paris", None] * 20, categories=["Rome", "Paris", "Berlin", "Oslo"])})
+
+
+@pytest.fixture
+def error_mask(data: pd.DataFrame) -> pd.DataFrame:
+    """Masks two thirds of the cells, including missing values."""
+    return pd.DataFrame({"a": data.index % 3 != 0})
+
+
+@pytest.mark.parametrize(
+    "error",
+    [
+        error_type.Replace({"replace_what": "e", "replace_with": "3"}),
+        error_type.Extraneous({"extraneous_value_template": "__{value}!"}),
+        error_type.Mojibake({"encoding_sender": "utf_8", "encoding_receiver": "iso-8859-2"}),
+    ],
+)
+def test_same_values_as_strings(data: pd.DataFrame, error_mask: pd.DataFrame, error: error_type.ErrorType) -> None:
+    """Test that categorical columns stay categorical, with appended categories, and contain the errors of the column as strings."""
+    result = error.apply(data, error_mask, "a")
+    string_data = data.astype(object).fillna("")
+    expected = error.apply(string_data, error_mask, "a").where(data["a"].notna())
+
+    assert isinstance(result.dtype, pd.CategoricalDtype)
+    assert result.cat.categories[:4].tolist() == data["a"].cat.categories.tolist()
+    pd.testing.assert_series_equal(result.astype(object), expected.astype(object))
+
+
+def test_typo(data: pd.DataFrame, error_mask: pd.DataFrame) -> None:
+    """Test that Typo changes each masked value of a categorical column on its own."""
+    result = error_type.Typo(seed=0).apply(data, error_mask, "a")
+    values = data["a"].astype(object)
+    changed = error_mask["a"] & data["a"].notna()
+
+    assert isinstance(result.dtype, pd.CategoricalDtype)
+    assert (result[changed].astype(object) != values[changed]).all()
+    assert result[~changed].astype(object).equals(values[~changed])
+
+
+@pytest.mark.parametrize("missing_value", [None, "?"])
+def test_missing_value(data: pd.DataFrame, error_mask: pd.DataFrame, missing_value: str | None) -> None:
+    """Test that MissingValue keeps categorical columns categorical, also with a missing value that is no category yet."""
+    error = error_type.MissingValue({"missing_value": missing_value})
+    result = error.apply(data, error_mask, "a")
+
+    assert isinstance(error.get_output_dtype(data["a"].dtype), pd.CategoricalDtype)
+    assert isinstance(result.dtype, pd.CategoricalDtype)
+    if missing_value is None:
+        assert result[error_mask["a"]].isna().all()
+    else:
+        assert (result[error_mask["a"]] == missing_value).all()
+
+
+def test_missing_value_output_dtype(data: pd.DataFrame) -> None:
+    """Test that the output dtype of a categorical column with a configured missing value includes it as a category, as the result does."""
+    error = error_type.MissingValue({"missing_value": "MISSING"})
+    config = MidLevelConfig({"a": [ErrorModel(error_mechanism.ECAR(seed=42), error, 0.3)]})
+
+    plan = config.compile(data)
+    data_dirty, _ = plan.run(data)
+
+    assert plan.output_dtypes["a"].categories.tolist() == ["Rome", "Paris", "Berlin", "Oslo", "MISSING"]
+    pd.testing.assert_series_equal(data_dirty.dtypes, plan.output_dtypes)
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from tab_err import error_type
+
+
+@pytest.fixture
+def data() -> pd.DataFrame:
+    """A DataFrame with a low-cardinality string column and missing values."""
+    random_generator = np.random.default_rng(0)
+    return pd.DataFrame({"a": random_generator.choice(["DE-Berlin", "FR-Paris", "IT-Rome"], size=1000), "b": random_generator.integers(0, 5, size=1000)})
+
+
+@pytest.mark.parametrize(
+    ("error", "column"),
+    [
+        (error_type.Replace({"replace_what": "e", "replace_with": "3"}), "a"),
+        (error_type.Extraneous({"extraneous_value_template": "__{value}!"}), "a"),
+        (error_type.Mojibake({"encoding_sender": "utf_8", "encoding_receiver": "iso-8859-2"}), "a"),
+        (error_type.Permutate({"permutation_separator": "-", "permutation_pattern": [1, 0]}), "a"),
+        (error_type.WrongUnit({"wrong_unit_scaling": lambda x: x * 1000}), "b"),
+    ],
+)
+def test_same_errors_as_per_value(data: pd.DataFrame, error: error_type.ErrorType, column: str, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that value-deterministic ErrorTypes insert the same errors when they map each unique value only once."""
+    error_mask = pd.DataFrame({"a": data.index % 3 == 0, "b": data.index % 3 == 0})
+    memoized = error.apply(data, error_mask, column)
+    monkeypatch.setattr(type(error), "value_deterministic", False)
+
+    pd.testing.assert_series_equal(memoized, error.apply(data, error_mask, column))
+
+
+def test_function_called_per_unique_value(data: pd.DataFrame) -> None:
+    """Test that the error function is called once per unique masked value."""
+    calls: list[int] = []
+    error = error_type.WrongUnit({"wrong_unit_scaling": lambda x: calls.append(x) or x * 2})
+    error.apply(data, pd.DataFrame(data=True, index=data.index, columns=data.columns), "b")
+
+    assert sorted(calls) == sorted(data["b"].unique())
+
+
+def test_permutate_with_fixed_pattern() -> None:
+    """Test that Permutate is only value-deterministic with a fixed pattern, because random permutations are drawn per value."""
+    assert error_type.Permutate({"permutation_pattern": [1, 0]}).value_deterministic
+    assert error_type.Permutate({"permutation_automation_pattern": "fixed"}).value_deterministic
+    assert not error_type.Permutate().value_deterministic